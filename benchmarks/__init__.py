@@ -0,0 +1,24 @@
+"""
+Tax-Calculator benchmark suite.
+
+The benchmarks are written in the style of airspeed velocity (asv), so
+they can be run either with asv (see the asv.conf.json file in the
+top-level directory) or, without installing anything other than the
+taxcalc package, with the benchmarks runner:
+
+  python -m benchmarks run [--quick] [--bench REGEX]
+  python -m benchmarks compare OLD_RESULTS NEW_RESULTS
+  python -m benchmarks check [--threshold FRACTION]
+                            [--mem-threshold FRACTION]
+  python -m benchmarks kernels [--sizes N [N ...]] [--kernel REGEX]
+
+The time_ benchmarks report seconds per call and the peakmem_ benchmarks
+report the peak memory allocated during the call (as measured by the
+taxcalc MemoryProfile class), and the check command fails when either
+regresses by more than its threshold.
+
+The macro benchmarks use the cps.csv.gz input data that are included in
+the taxcalc package and the kernel micro benchmarks use synthetic data
+generated from those data by the taxcalc SyntheticData class, so no
+network access or confidential data are needed to run them.
+"""
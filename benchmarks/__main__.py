@@ -0,0 +1,8 @@
+"""
+Command-line interface to the Tax-Calculator benchmarks runner.
+"""
+import sys
+from benchmarks.runner import main
+
+if __name__ == '__main__':
+    sys.exit(main())
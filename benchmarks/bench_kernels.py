@@ -0,0 +1,169 @@
+"""
+Micro benchmarks that time each JIT-compiled calc-style function (kernel)
+in isolation using synthetic Records data generated by the taxcalc
+SyntheticData class, which bootstraps the cps.csv.gz input data included
+in the taxcalc package, so that no confidential input data are needed.
+
+Besides the asv-style KernelBench benchmarks, which are run by the
+benchmarks runner, this module provides the kernel_report function, which
+reports the compile time of each kernel and its execution time per record
+(in nanoseconds) for a range of sample sizes (the scaling curve), and is
+called by the runner's kernels command:
+
+  python -m benchmarks kernels [--sizes 1e4 1e5 1e6 1e7] [--kernel REGEX]
+
+Notice that a synthetic sample with ten million records requires about
+twenty gigabytes of memory.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle bench_kernels.py
+# pylint --disable=locally-disabled bench_kernels.py
+#
+# pylint: disable=attribute-defined-outside-init,missing-function-docstring
+# pylint: disable=too-few-public-methods,no-value-for-parameter
+
+import re
+import time
+import numpy as np
+import pandas as pd
+import taxcalc as tc
+from taxcalc import calcfunctions
+
+
+TAX_YEAR = 2026
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+
+# calc-style functions in the order they are called by Calculator.calc_all
+KERNELS = [
+    'UBI', 'EI_PayrollTax', 'DependentCare', 'Adj', 'ALD_InvInc_ec_base',
+    'CapGains', 'SSBenefits', 'AGI', 'ItemDedCap', 'ItemDed',
+    'AdditionalMedicareTax', 'StdDed', 'TaxInc', 'SchXYZTax', 'GainsTax',
+    'AGIsurtax', 'NetInvIncTax', 'AMT', 'F2441', 'EITC',
+    'RefundablePayrollTaxCredit', 'PersonalTaxCredit', 'AmOppCreditParts',
+    'SchR', 'EducationTaxCredit', 'CharityCredit', 'ChildDepTaxCredit',
+    'NonrefundableCredits', 'AdditionalCTC', 'C1040', 'CTC_new', 'IITAX',
+    'FairShareTax', 'LumpSumTax', 'ExpandIncome', 'AfterTaxIncome',
+]
+
+
+def synthetic_records(num_records, year=TAX_YEAR, seed=0):
+    """
+    Return Records object for the specified year containing num_records
+    synthetic filing units generated by the SyntheticData class.
+    """
+    data, _ = tc.SyntheticData(weights=None, seed=seed).sample(num_records)
+    return tc.Records(data=data, start_year=year, gfactors=None,
+                      weights=None, adjust_ratios=None)
+
+
+def prepared_inputs(num_records, year=TAX_YEAR, seed=0):
+    """
+    Return (Policy, Records) pair for the specified year, where all the
+    kernels have been called once (in the order that they are called by
+    the Calculator.calc_all method) so that the calculated variables used
+    as input by each kernel have realistic values.
+    """
+    pol = tc.Policy()
+    pol.set_year(year)
+    rec = synthetic_records(num_records, year, seed)
+    for kname in KERNELS:
+        getattr(calcfunctions, kname)(pol, rec)
+    return pol, rec
+
+
+def compile_seconds(kname):
+    """
+    Return number of seconds taken to JIT-compile the named kernel, which
+    is NaN if the kernel has not been compiled.
+    """
+    dispatcher = getattr(calcfunctions, kname).applied_function
+    signatures = getattr(dispatcher, 'signatures', [])
+    if not signatures:
+        return np.nan
+    return sum(dispatcher.get_metadata(sig)['timers']['compiler_lock']
+               for sig in signatures)
+
+
+def time_kernel(kname, pol, rec, repeat=3):
+    """
+    Return minimum number of seconds taken by one call to the named kernel
+    in repeat calls, restoring the variables that the kernel returns before
+    each call so that every call does identical work.
+    """
+    kernel = getattr(calcfunctions, kname)
+    saved = {vname: getattr(rec, vname).copy()
+             for vname in kernel.out_args if hasattr(rec, vname)}
+    samples = []
+    for _ in range(repeat):
+        for vname, values in saved.items():
+            getattr(rec, vname)[:] = values
+        start = time.perf_counter()
+        kernel(pol, rec)
+        samples.append(time.perf_counter() - start)
+    return min(samples)
+
+
+def kernel_report(sizes=None, pattern=None, repeat=3, year=TAX_YEAR):
+    """
+    Return Pandas DataFrame containing one row for each kernel whose name
+    matches the optional pattern regex, with columns containing the compile
+    time (seconds), the execution time per record (nanoseconds) for each of
+    the specified sample sizes, and the scaling exponent, which is the slope
+    of the log-log relationship between execution time and sample size
+    (one implies linear scaling).
+    """
+    if sizes is None:
+        sizes = DEFAULT_SIZES
+    sizes = sorted(int(size) for size in sizes)
+    knames = [kname for kname in KERNELS
+              if not pattern or re.search(pattern, kname)]
+    seconds = {kname: [] for kname in knames}
+    for size in sizes:
+        pol, rec = prepared_inputs(size, year)
+        for kname in knames:
+            seconds[kname].append(time_kernel(kname, pol, rec, repeat))
+        del pol, rec
+    rows = []
+    for kname in knames:
+        row = [kname, compile_seconds(kname)]
+        row.extend(1e9 * secs / size
+                   for secs, size in zip(seconds[kname], sizes))
+        if len(sizes) > 1 and min(seconds[kname]) > 0.:
+            slope = np.polyfit(np.log(sizes), np.log(seconds[kname]), 1)[0]
+        else:
+            slope = np.nan
+        row.append(slope)
+        rows.append(row)
+    columns = (['kernel', 'compile_s'] +
+               [f'ns_per_rec_{size:.0e}'.replace('+0', '') for size in sizes] +
+               ['scaling'])
+    return pd.DataFrame(rows, columns=columns)
+
+
+class KernelBench:
+    """
+    Time each kernel for synthetic samples of several sizes.
+    """
+    number = 1
+    repeat = 3
+    params = [DEFAULT_SIZES, KERNELS]
+    param_names = ['records', 'kernel']
+    _cache = {}
+
+    def setup(self, records, kernel):
+        if records not in KernelBench._cache:
+            KernelBench._cache.clear()  # keep only one sample in memory
+            KernelBench._cache[records] = prepared_inputs(records)
+        self.pol, self.rec = KernelBench._cache[records]
+        self.saved = {
+            vname: getattr(self.rec, vname).copy()
+            for vname in getattr(calcfunctions, kernel).out_args
+            if hasattr(self.rec, vname)
+        }
+
+    def teardown(self, records, kernel):  # pylint: disable=unused-argument
+        for vname, values in self.saved.items():
+            getattr(self.rec, vname)[:] = values
+
+    def time_kernel(self, records, kernel):  # pylint: disable=unused-argument
+        getattr(calcfunctions, kernel)(self.pol, self.rec)
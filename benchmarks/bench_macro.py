@@ -0,0 +1,150 @@
+"""
+Macro benchmarks that time the main Tax-Calculator operations using the
+cps.csv.gz input data included in the taxcalc package and that measure
+the peak memory allocated by each of them (the peakmem_ benchmarks,
+which are measured by the runner using the taxcalc MemoryProfile class).
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle bench_macro.py
+# pylint --disable=locally-disabled bench_macro.py
+#
+# pylint: disable=attribute-defined-outside-init,missing-function-docstring
+# pylint: disable=too-few-public-methods
+
+import os
+import sys
+import glob
+import shutil
+import tempfile
+import subprocess
+import taxcalc as tc
+
+
+TAX_YEAR = 2026
+REFORMS_DIR = os.path.join(os.path.dirname(tc.__file__), 'reforms')
+REFORM_FILES = sorted(
+    os.path.basename(path)
+    for path in glob.glob(os.path.join(REFORMS_DIR, '*.json'))
+)
+
+
+class PolicyBench:
+    """
+    Time construction of current-law Policy object.
+    """
+    number = 1
+    repeat = 3
+
+    def time_policy_ctor(self):
+        tc.Policy()
+
+    peakmem_policy_ctor = time_policy_ctor
+
+
+class ReformBench:
+    """
+    Time implementation of each reform in the taxcalc/reforms directory.
+    """
+    number = 1
+    repeat = 3
+    params = REFORM_FILES
+    param_names = ['reform']
+
+    def setup(self, reform):
+        path = os.path.join(REFORMS_DIR, reform)
+        self.reform = tc.Calculator.read_json_param_objects(path, None)
+        self.pol = tc.Policy()
+
+    def time_implement_reform(self, reform):  # pylint: disable=unused-argument
+        self.pol.implement_reform(self.reform['policy'],
+                                  print_warnings=False, raise_errors=False)
+
+    peakmem_implement_reform = time_implement_reform
+
+
+class RecordsBench:
+    """
+    Time construction and extrapolation of CPS Records object.
+    """
+    number = 1
+    repeat = 3
+
+    def setup(self):
+        self.pol = tc.Policy()
+        self.rec = tc.Records.cps_constructor()
+
+    def time_cps_constructor(self):
+        tc.Records.cps_constructor()
+
+    def time_increment_year_to_last_budget_year(self):
+        calc = tc.Calculator(policy=self.pol, records=self.rec)
+        calc.advance_to_year(tc.Policy.LAST_BUDGET_YEAR)
+
+    peakmem_cps_constructor = time_cps_constructor
+    peakmem_increment_year_to_last_budget_year = \
+        time_increment_year_to_last_budget_year
+
+
+class CalculatorBench:
+    """
+    Time calculations and tables for baseline and reform Calculator objects.
+    """
+    number = 1
+    repeat = 3
+
+    def setup(self):
+        rec = tc.Records.cps_constructor()
+        pol = tc.Policy()
+        self.calc1 = tc.Calculator(policy=pol, records=rec)
+        self.calc1.advance_to_year(TAX_YEAR)
+        pol.implement_reform({'II_em': {TAX_YEAR: 1000}})
+        self.calc2 = tc.Calculator(policy=pol, records=rec)
+        self.calc2.advance_to_year(TAX_YEAR)
+        self.calc1.calc_all()
+        self.calc2.calc_all()
+
+    def time_calc_all(self):
+        self.calc2.calc_all()
+
+    def time_mtr(self):
+        self.calc2.mtr(calc_all_already_called=True)
+
+    def time_distribution_tables(self):
+        self.calc1.distribution_tables(self.calc2, 'weighted_deciles')
+
+    def time_difference_table(self):
+        self.calc1.difference_table(self.calc2, 'weighted_deciles', 'iitax')
+
+    peakmem_calc_all = time_calc_all
+    peakmem_mtr = time_mtr
+    peakmem_distribution_tables = time_distribution_tables
+    peakmem_difference_table = time_difference_table
+
+
+class CLIBench:
+    """
+    Time complete tc CLI run with --tables and --dumpdb options, which
+    includes the time to import taxcalc and to compile the JIT functions.
+    There is no peakmem_ benchmark because the run is in a subprocess.
+    """
+    number = 1
+    repeat = 1
+
+    def setup(self):
+        self.workdir = tempfile.mkdtemp()
+
+    def teardown(self):
+        shutil.rmtree(self.workdir, ignore_errors=True)
+
+    def time_tc_cps_tables_dumpdb(self):
+        code = ('import sys; from taxcalc.cli.tc import cli_tc_main; '
+                f"sys.argv = ['tc', 'cps.csv', '{TAX_YEAR}', "
+                "'--tables', '--dumpdb', '--silent']; "
+                'sys.exit(cli_tc_main())')
+        env = dict(os.environ)
+        pkgdir = os.path.dirname(os.path.dirname(tc.__file__))
+        env['PYTHONPATH'] = os.pathsep.join(
+            filter(None, [pkgdir, env.get('PYTHONPATH')])
+        )
+        subprocess.run([sys.executable, '-c', code], cwd=self.workdir,
+                       env=env, check=True)
@@ -0,0 +1,372 @@
+"""
+Runner for the asv-style Tax-Calculator benchmarks, which stores the
+timing and peak-memory results of each run in the benchmarks/results
+directory so that the history of results can be reported and runs can
+be compared.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle runner.py
+# pylint --disable=locally-disabled runner.py
+
+import os
+import re
+import sys
+import json
+import glob
+import time
+import inspect
+import argparse
+import datetime
+import platform
+import importlib
+import itertools
+import statistics
+import subprocess
+
+
+BENCH_DIR = os.path.dirname(os.path.abspath(__file__))
+RESULTS_DIR = os.path.join(BENCH_DIR, 'results')
+DEFAULT_THRESHOLD = 0.10
+DEFAULT_MEM_THRESHOLD = 0.10
+BENCH_PREFIXES = ('time_', 'peakmem_')
+
+
+def discover(pattern=None):
+    """
+    Return list of (name, cls, method_name, param_tuple) benchmarks
+    defined in the benchmarks/bench_*.py modules, where param_tuple
+    contains the values of the asv-style params of the benchmark class,
+    keeping only those whose name matches the optional pattern regex.
+    """
+    benchmarks = []
+    paths = sorted(glob.glob(os.path.join(BENCH_DIR, 'bench_*.py')))
+    for path in paths:
+        modname = os.path.splitext(os.path.basename(path))[0]
+        module = importlib.import_module(f'benchmarks.{modname}')
+        for clsname, cls in inspect.getmembers(module, inspect.isclass):
+            if cls.__module__ != module.__name__:
+                continue
+            for combo in _param_combinations(cls):
+                for method in sorted(dir(cls)):
+                    if not method.startswith(BENCH_PREFIXES):
+                        continue
+                    name = f'{modname}.{clsname}.{method}'
+                    if combo:
+                        name += '(' + ', '.join(str(p) for p in combo) + ')'
+                    if pattern and not re.search(pattern, name):
+                        continue
+                    benchmarks.append((name, cls, method, combo))
+    return benchmarks
+
+
+def run_benchmark(cls, method, combo, repeat=None):
+    """
+    Return list of seconds per call of a time_ benchmark method, or of
+    peak bytes allocated during the call of a peakmem_ benchmark method,
+    for each repetition, calling the setup and teardown methods (if any)
+    of the benchmark class around each repetition.  Like asv, peakmem_
+    benchmarks are called only once per repetition.
+    """
+    # pylint: disable=import-outside-toplevel
+    from taxcalc.memprofile import MemoryProfile, MEGABYTE
+    peakmem = method.startswith('peakmem_')
+    number = 1 if peakmem else getattr(cls, 'number', 1)
+    if repeat is None:
+        repeat = getattr(cls, 'repeat', 3)
+    samples = []
+    for _ in range(repeat):
+        bench = cls()
+        if hasattr(bench, 'setup'):
+            bench.setup(*combo)
+        func = getattr(bench, method)
+        if peakmem:
+            mprof = MemoryProfile(trace_allocations=True)
+            with mprof.stage(method):
+                func(*combo)
+            mprof.stop()
+            traced_peak = mprof.dataframe()['traced_peak_mb'].iloc[-1]
+            samples.append(traced_peak * MEGABYTE)
+        else:
+            start = time.perf_counter()
+            for _ in range(number):
+                func(*combo)
+            samples.append((time.perf_counter() - start) / number)
+        if hasattr(bench, 'teardown'):
+            bench.teardown(*combo)
+    return samples
+
+
+def run(pattern=None, quick=False, results_dir=RESULTS_DIR, verbose=True):
+    """
+    Run benchmarks and write their results to a JSON file in results_dir,
+    returning the name of that file.
+    """
+    # pylint: disable=import-outside-toplevel,too-many-locals
+    import taxcalc
+    results = {}
+    for name, cls, method, combo in discover(pattern):
+        samples = run_benchmark(cls, method, combo,
+                                repeat=1 if quick else None)
+        unit = 'bytes' if method.startswith('peakmem_') else 'seconds'
+        results[name] = {
+            'unit': unit,
+            'min': min(samples),
+            'median': statistics.median(samples),
+            'samples': samples,
+        }
+        if verbose:
+            print(f'{name:<72} {_fmt_value(min(samples), unit):>10}')
+    now = datetime.datetime.now()
+    commit = _git_commit()
+    run_info = {
+        'timestamp': now.isoformat(timespec='seconds'),
+        'commit': commit,
+        'taxcalc_version': taxcalc.__version__,
+        'python': platform.python_version(),
+        'machine': platform.node(),
+        'quick': quick,
+        'results': results,
+    }
+    os.makedirs(results_dir, exist_ok=True)
+    fname = os.path.join(
+        results_dir, f'{now.strftime("%Y%m%dT%H%M%S")}-{commit[:8]}.json'
+    )
+    with open(fname, 'w', encoding='utf-8') as rfile:
+        json.dump(run_info, rfile, indent=1)
+    if verbose:
+        print(f'Wrote benchmark results to {fname}')
+    return fname
+
+
+def result_files(results_dir=RESULTS_DIR):
+    """
+    Return chronologically sorted list of results files in results_dir.
+    """
+    return sorted(glob.glob(os.path.join(results_dir, '*.json')))
+
+
+def compare(old_fname, new_fname, threshold=DEFAULT_THRESHOLD,
+            mem_threshold=DEFAULT_MEM_THRESHOLD):
+    """
+    Return (report_string, regressions_list) comparing the minimum values
+    in the two results files, where regressions_list contains the names
+    of the time benchmarks that are more than threshold (a fraction)
+    slower and of the peakmem benchmarks that use more than mem_threshold
+    (a fraction) more memory in the new results than in the old results.
+    """
+    # pylint: disable=too-many-locals
+    old = _read_results(old_fname)
+    new = _read_results(new_fname)
+    lines = [
+        f'OLD: {os.path.basename(old_fname)} (commit {old["commit"][:8]})',
+        f'NEW: {os.path.basename(new_fname)} (commit {new["commit"][:8]})',
+        f'{"benchmark":<72} {"old":>10} {"new":>10} {"ratio":>7}',
+    ]
+    regressions = []
+    for name in sorted(set(old['results']) | set(new['results'])):
+        unit = _unit(new['results'].get(name, old['results'].get(name)))
+        if name not in old['results'] or name not in new['results']:
+            oldt = old['results'].get(name, {}).get('min')
+            newt = new['results'].get(name, {}).get('min')
+            lines.append(f'{name:<72} {_fmt_value(oldt, unit):>10} '
+                         f'{_fmt_value(newt, unit):>10} {"n/a":>7}')
+            continue
+        oldt = old['results'][name]['min']
+        newt = new['results'][name]['min']
+        ratio = newt / oldt if oldt > 0 else float('inf')
+        limit = mem_threshold if unit == 'bytes' else threshold
+        flag = ''
+        if ratio > 1. + limit:
+            flag = '  REGRESSION'
+            regressions.append(name)
+        elif ratio < 1. / (1. + limit):
+            flag = '  improved'
+        lines.append(f'{name:<72} {_fmt_value(oldt, unit):>10} '
+                     f'{_fmt_value(newt, unit):>10} {ratio:>7.2f}{flag}')
+    lines.append(f'{len(regressions)} regression(s) larger than '
+                 f'{100 * threshold:.0f} percent (time) or '
+                 f'{100 * mem_threshold:.0f} percent (peak memory)')
+    return '\n'.join(lines) + '\n', regressions
+
+
+def history(pattern=None, results_dir=RESULTS_DIR):
+    """
+    Return string containing minimum time or peak memory of each benchmark
+    in each of the results files, which are shown from oldest to newest.
+    """
+    fnames = result_files(results_dir)
+    runs = [_read_results(fname) for fname in fnames]
+    names = sorted(set(itertools.chain.from_iterable(
+        run_info['results'] for run_info in runs
+    )))
+    lines = []
+    for run_info in runs:
+        lines.append(f'{run_info["timestamp"]} {run_info["commit"][:8]} '
+                     f'taxcalc-{run_info["taxcalc_version"]}')
+    for name in names:
+        if pattern and not re.search(pattern, name):
+            continue
+        times = [
+            _fmt_value(run_info['results'].get(name, {}).get('min'),
+                       _unit(run_info['results'].get(name)))
+            for run_info in runs
+        ]
+        lines.append(f'{name:<72} ' + ' '.join(f'{t:>10}' for t in times))
+    return '\n'.join(lines) + '\n'
+
+
+def main(argv=None):
+    """
+    Parse command-line arguments and run specified runner command,
+    returning zero when successful and one when a check finds one or
+    more regressions.
+    """
+    parser = argparse.ArgumentParser(
+        prog='python -m benchmarks',
+        description='Run, compare, and check Tax-Calculator benchmarks.')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+    prun = subparsers.add_parser('run', help='run benchmarks')
+    prun.add_argument('--bench', default=None,
+                      help='regex that selects benchmarks to run')
+    prun.add_argument('--quick', default=False, action='store_true',
+                      help='run each benchmark only once')
+    pcmp = subparsers.add_parser('compare', help='compare two results files')
+    pcmp.add_argument('OLD')
+    pcmp.add_argument('NEW')
+    pcmp.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    pcmp.add_argument('--mem-threshold', type=float,
+                      default=DEFAULT_MEM_THRESHOLD)
+    pchk = subparsers.add_parser(
+        'check',
+        help=('compare newest results with previous (or --baseline) '
+              'results and fail if any benchmark regressed'))
+    pchk.add_argument('--baseline', default=None,
+                      help='results file to compare newest results with')
+    pchk.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD)
+    pchk.add_argument('--mem-threshold', type=float,
+                      default=DEFAULT_MEM_THRESHOLD)
+    phst = subparsers.add_parser('history', help='show results history')
+    phst.add_argument('--bench', default=None,
+                      help='regex that selects benchmarks to show')
+    pkrn = subparsers.add_parser(
+        'kernels',
+        help=('report compile time and nanoseconds per record of each '
+              'kernel for several synthetic sample sizes'))
+    pkrn.add_argument('--sizes', type=float, nargs='+', default=None,
+                      help='sample sizes (default is 1e4 1e5 1e6)')
+    pkrn.add_argument('--kernel', default=None,
+                      help='regex that selects kernels to time')
+    pkrn.add_argument('--repeat', type=int, default=3)
+    pkrn.add_argument('--csv', default=None,
+                      help='name of CSV file in which to write the report')
+    args = parser.parse_args(argv)
+    if args.command == 'run':
+        run(pattern=args.bench, quick=args.quick)
+        return 0
+    if args.command == 'compare':
+        report, _ = compare(args.OLD, args.NEW, args.threshold,
+                            args.mem_threshold)
+        sys.stdout.write(report)
+        return 0
+    if args.command == 'history':
+        sys.stdout.write(history(pattern=args.bench))
+        return 0
+    if args.command == 'kernels':
+        # pylint: disable=import-outside-toplevel
+        from benchmarks.bench_kernels import kernel_report
+        report = kernel_report(sizes=args.sizes, pattern=args.kernel,
+                               repeat=args.repeat)
+        sys.stdout.write(report.to_string(index=False, float_format='%.2f'))
+        sys.stdout.write('\n')
+        if args.csv:
+            report.to_csv(args.csv, index=False, float_format='%.3f')
+        return 0
+    # args.command == 'check'
+    fnames = result_files()
+    if args.baseline:
+        old_fname = args.baseline
+    elif len(fnames) >= 2:
+        old_fname = fnames[-2]
+    else:
+        sys.stderr.write('ERROR: need at least two results files to check\n')
+        return 1
+    report, regressions = compare(old_fname, fnames[-1], args.threshold,
+                                  args.mem_threshold)
+    sys.stdout.write(report)
+    return 1 if regressions else 0
+
+
+# ----- private functions -----
+
+
+def _param_combinations(cls):
+    """
+    Return list of tuples of asv-style params values for benchmark class.
+    """
+    params = getattr(cls, 'params', None)
+    if params is None:
+        return [()]
+    if len(getattr(cls, 'param_names', [])) > 1:
+        return list(itertools.product(*params))
+    return [(param,) for param in params]
+
+
+def _read_results(fname):
+    """
+    Return contents of results file as a dictionary.
+    """
+    with open(fname, 'r', encoding='utf-8') as rfile:
+        return json.load(rfile)
+
+
+def _git_commit():
+    """
+    Return current git commit hash of the repository or 'unknown'.
+    """
+    try:
+        proc = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=BENCH_DIR,
+                              capture_output=True, text=True, check=True)
+        return proc.stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def _unit(result):
+    """
+    Return unit of the benchmark result dictionary, which is 'seconds'
+    for results files written before peakmem benchmarks were added.
+    """
+    if result is None:
+        return 'seconds'
+    return result.get('unit', 'seconds')
+
+
+def _fmt_value(value, unit):
+    """
+    Return string containing benchmark value formatted for its unit.
+    """
+    if unit == 'bytes':
+        return _fmt_bytes(value)
+    return _fmt_time(value)
+
+
+def _fmt_bytes(nbytes):
+    """
+    Return string containing number of bytes formatted in megabytes.
+    """
+    if nbytes is None:
+        return 'n/a'
+    return f'{nbytes / 1024**2:.1f}MB'
+
+
+def _fmt_time(seconds):
+    """
+    Return string containing seconds formatted with appropriate units.
+    """
+    if seconds is None:
+        return 'n/a'
+    if seconds >= 1.:
+        return f'{seconds:.2f}s'
+    if seconds >= 1e-3:
+        return f'{seconds * 1e3:.1f}ms'
+    return f'{seconds * 1e6:.1f}us'
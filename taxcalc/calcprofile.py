@@ -0,0 +1,150 @@
+"""
+Tax-Calculator CalcProfile class that times calc-style functions.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle calcprofile.py
+# pylint --disable=locally-disabled calcprofile.py
+
+import time
+import threading
+import contextlib
+import pandas as pd
+
+
+__all__ = ['CalcProfile']
+
+
+class _ActiveProfile(threading.local):
+    """
+    Thread-local holder of the CalcProfile object (if any) that is
+    collecting timings for the calc-style functions being executed
+    in the current thread.
+    """
+    # pylint: disable=too-few-public-methods
+    profile = None
+
+
+ACTIVE = _ActiveProfile()
+
+
+class CalcProfile():
+    """
+    Constructor for the CalcProfile class, which accumulates the wall time,
+    number of calls, and number of array bytes touched by each calc-style
+    function (and by each Calculator method that calls them) executed by a
+    Calculator object that was constructed with profile=True.
+
+    Timings are grouped by year and by call path, where a call path is
+    the semicolon-separated list of the names of the enclosing Calculator
+    methods and the calc-style function (for example,
+    calc_all;_calc_one_year;_taxinc_to_amt;TaxInc), so that the three
+    _taxinc_to_amt passes and the calculations done by BenefitSurtax and
+    BenefitLimitation are reported separately.
+
+    Returns
+    -------
+    class instance: CalcProfile
+
+    Notes
+    -----
+    The timings are used as follows:
+         calc = Calculator(policy=pol, records=rec, profile=True)
+         calc.calc_all()
+         timings = calc.profile.dataframe()
+         calc.profile.write_folded('calc.folded')  # input to flamegraph.pl
+    When a Calculator object is constructed with profile=False (the
+    default), no timings are collected and the only overhead is a
+    thread-local attribute lookup in each calc-style function call.
+    """
+
+    COLUMNS = ['year', 'path', 'function', 'calls',
+               'seconds', 'self_seconds', 'bytes']
+
+    def __init__(self):
+        self._stats = {}
+        self._stack = []
+        self._years = []
+
+    def __deepcopy__(self, memo):
+        # the profile is shared with Calculator copies (such as those
+        # made by the ComputeBenefit function) so their timings are kept
+        return self
+
+    @contextlib.contextmanager
+    def section(self, name, year=None, nbytes=0):
+        """
+        Context manager that times the enclosed code as a call to the named
+        function that touches nbytes array bytes in the specified year,
+        where year=None implies the year of the enclosing section.
+        """
+        if year is None and self._years:
+            year = self._years[-1]
+        self._stack.append(name)
+        self._years.append(year)
+        key = (year, ';'.join(self._stack))
+        prior_profile = ACTIVE.profile
+        ACTIVE.profile = self
+        start = time.perf_counter()
+        try:
+            yield self
+        finally:
+            elapsed = time.perf_counter() - start
+            ACTIVE.profile = prior_profile
+            self._stack.pop()
+            self._years.pop()
+            stats = self._stats.setdefault(key, [0, 0., 0])
+            stats[0] += 1
+            stats[1] += elapsed
+            stats[2] += nbytes
+
+    def dataframe(self):
+        """
+        Return Pandas DataFrame containing one row for each year and call
+        path, with columns containing the number of calls, the total wall
+        time (seconds), the wall time not spent in nested functions
+        (self_seconds), and the total number of array bytes touched.
+        """
+        child_seconds = {}
+        for (year, path), stats in self._stats.items():
+            parent = path.rpartition(';')[0]
+            if parent:
+                child_seconds[(year, parent)] = (
+                    child_seconds.get((year, parent), 0.) + stats[1]
+                )
+        rows = []
+        for (year, path), (calls, seconds, nbytes) in self._stats.items():
+            self_seconds = seconds - child_seconds.get((year, path), 0.)
+            rows.append([year, path, path.rpartition(';')[2], calls,
+                         seconds, max(self_seconds, 0.), nbytes])
+        dframe = pd.DataFrame(rows, columns=CalcProfile.COLUMNS)
+        return dframe.sort_values(['year', 'path'], ignore_index=True)
+
+    def folded(self, by_year=False):
+        """
+        Return string containing the timings in the folded-stack format
+        (one "path microseconds" line per call path) that is read by
+        flamegraph tools; when by_year is True, the year is used as the
+        root of each call path.
+        """
+        dframe = self.dataframe()
+        if by_year:
+            paths = dframe['year'].astype(str) + ';' + dframe['path']
+        else:
+            paths = dframe['path']
+        usecs = (dframe['self_seconds'] * 1e6).groupby(paths).sum()
+        lines = [f'{path} {int(round(usec))}\n'
+                 for path, usec in usecs.items()]
+        return ''.join(lines)
+
+    def write_folded(self, filename, by_year=False):
+        """
+        Write the folded() string to the named file.
+        """
+        with open(filename, 'w', encoding='utf-8') as ffile:
+            ffile.write(self.folded(by_year))
+
+    def clear(self):
+        """
+        Remove all accumulated timings.
+        """
+        self._stats = {}
@@ -8,6 +8,7 @@ Tax-Calculator federal income and payroll tax Calculator class.
 # pylint: disable=too-many-lines,no-value-for-parameter
 
 import copy
+import contextlib
 import numpy as np
 import pandas as pd
 import paramtools
@@ -30,6 +31,8 @@ from taxcalc.records import Records
 from taxcalc.consumption import Consumption
 from taxcalc.growdiff import GrowDiff
 from taxcalc.growfactors import GrowFactors
+from taxcalc.resultcache import ResultCache
+from taxcalc.calcprofile import CalcProfile
 from taxcalc.utils import (DIST_VARIABLES, create_distribution_table,
                            DIFF_VARIABLES, create_difference_table,
                            create_diagnostic_table,
@@ -39,6 +42,12 @@ from taxcalc.utils import (DIST_VARIABLES, create_distribution_table,
 # import pdb
 
 
+# current-law Policy objects used by Calculator.reform_documentation, whose
+# keys identify the indexing rates in the GrowFactors object of the policy
+_CURRENT_LAW_POLICIES = {}
+_MAX_CURRENT_LAW_POLICIES = 4
+
+
 class Calculator():
     """
     Constructor for the Calculator class.
@@ -68,6 +77,19 @@ class Calculator():
         consumption values specified implying consumption value is equal to
         government cost of providing the in-kind benefits
 
+    result_cache: None or ResultCache class object
+        specifies the on-disk cache from which the calc_all method reads
+        its results when the same calculations have already been done
+        and to which the calc_all method writes its results otherwise;
+        default is None, which implies no caching of calc_all results;
+        when argument is an object it is shared (not copied)
+
+    profile: boolean
+        specifies whether or not to collect timings for each calc-style
+        function called by the Calculator methods; default value is false;
+        when true, the timings are available in the CalcProfile object
+        returned by the profile property
+
     Raises
     ------
     ValueError:
@@ -92,7 +114,8 @@ class Calculator():
     # pylint: disable=too-many-public-methods
 
     def __init__(self, policy=None, records=None, verbose=False,
-                 sync_years=True, consumption=None):
+                 sync_years=True, consumption=None, result_cache=None,
+                 profile=False):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
         # pylint: disable=too-many-branches
         if isinstance(policy, Policy):
@@ -100,6 +123,9 @@ class Calculator():
         else:
             raise ValueError('must specify policy as a Policy object')
         if isinstance(records, Records):
+            if isinstance(result_cache, ResultCache):
+                # identify input data before the copy is extrapolated
+                records.input_key()
             self.__records = copy.deepcopy(records)
         else:
             raise ValueError('must specify records as a Records object')
@@ -111,6 +137,11 @@ class Calculator():
             self.__consumption = copy.deepcopy(consumption)
         else:
             raise ValueError('consumption must be None or Consumption object')
+        if result_cache is None or isinstance(result_cache, ResultCache):
+            self.__result_cache = result_cache
+        else:
+            raise ValueError('result_cache must be None or ResultCache object')
+        self.__profile = CalcProfile() if profile else None
         if self.__consumption.current_year < self.__policy.current_year:
             self.__consumption.set_year(self.__policy.current_year)
         current_year_is_data_year = (
@@ -145,7 +176,8 @@ class Calculator():
         Advance all embedded objects to next year.
         """
         next_year = self.__policy.current_year + 1
-        self.__records.increment_year()
+        with self._profiling('increment_year', next_year):
+            self.__records.increment_year()
         self.__policy.set_year(next_year)
         self.__consumption.set_year(next_year)
 
@@ -167,16 +199,18 @@ class Calculator():
         """
         Call all tax-calculation functions for the current_year.
         """
-        # conducts static analysis of Calculator object for current_year
-        UBI(self.__policy, self.__records)
-        BenefitPrograms(self)
-        self._calc_one_year(zero_out_calc_vars)
-        BenefitSurtax(self)
-        BenefitLimitation(self)
-        FairShareTax(self.__policy, self.__records)
-        LumpSumTax(self.__policy, self.__records)
-        ExpandIncome(self.__policy, self.__records)
-        AfterTaxIncome(self.__policy, self.__records)
+        with self._profiling('calc_all', self.current_year):
+            if self.__result_cache is None:
+                self._calc_all(zero_out_calc_vars)
+                return
+            key = self.__result_cache.key(self.__policy, self.__records,
+                                          self.__consumption,
+                                          zero_out_calc_vars)
+            if key is None:
+                self._calc_all(zero_out_calc_vars)
+            elif not self.__result_cache.fetch(key, self.__records):
+                self._calc_all(zero_out_calc_vars)
+                self.__result_cache.store(key, self.__records)
 
     def weighted_total(self, variable_name):
         """
@@ -214,15 +248,21 @@ class Calculator():
     def array(self, variable_name, variable_value=None):
         """
         If variable_value is None, return numpy ndarray containing the
-         named variable in embedded Records object.
+         named variable in embedded Records object, where the values of
+         an integer variable stored in a narrower type (see the storage
+         field in records_variables.json) are returned in an int32 copy.
         If variable_value is not None, set named variable in embedded Records
          object to specified variable_value and return None (which can be
          ignored).
         """
         if variable_value is None:
-            return getattr(self.__records, variable_name)
+            values = getattr(self.__records, variable_name)
+            if values.dtype.kind in 'bi' and values.dtype.itemsize < 4:
+                return values.astype(np.int32)
+            return values
         assert isinstance(variable_value, np.ndarray)
         setattr(self.__records, variable_name, variable_value)
+        self.__records.note_changed(variable_name)
         return None
 
     def n65(self):
@@ -242,29 +282,32 @@ class Calculator():
         assert isinstance(variable_add, np.ndarray)
         setattr(self.__records, variable_name,
                 self.array(variable_name) + variable_add)
+        self.__records.note_changed(variable_name)
 
     def zeroarray(self, variable_name):
         """
         Set named variable in embedded Records object to zeros.
         """
         setattr(self.__records, variable_name, np.zeros(self.array_len))
+        self.__records.note_changed(variable_name)
 
     def store_records(self):
         """
-        Make internal copy of embedded Records object that can then be
-        restored after interim calculations that make temporary changes
-        to the embedded Records object.
+        Make internal snapshot of the variables in the embedded Records
+        object that can then be restored after interim calculations that
+        make temporary changes to the embedded Records object.
         """
         assert self.__stored_records is None
-        self.__stored_records = copy.deepcopy(self.__records)
+        self.__stored_records = self.__records.snapshot()
 
     def restore_records(self):
         """
-        Set the embedded Records object to the stored Records object
-        that was saved in the last call to the store_records() method.
+        Set the variables in the embedded Records object to the values in
+        the snapshot that was saved in the last call to the store_records()
+        method.
         """
-        assert isinstance(self.__stored_records, Records)
-        self.__records = copy.deepcopy(self.__stored_records)
+        assert isinstance(self.__stored_records, dict)
+        self.__records.restore(self.__stored_records)
         del self.__stored_records
         self.__stored_records = None
 
@@ -289,6 +332,9 @@ class Calculator():
                 return val
             return val[0]  # drop down a dimension.
         setattr(self.__policy, param_name, param_value)
+        year_values = self.__policy.year_values
+        if param_name in year_values:
+            year_values[param_name] = param_value[0]
         return None
 
     def consump_param(self, param_name):
@@ -311,6 +357,14 @@ class Calculator():
         """
         return self.__policy.parameter_errors
 
+    @property
+    def profile(self):
+        """
+        Calculator class CalcProfile object property, which is None
+        unless the Calculator object was constructed with profile=True.
+        """
+        return self.__profile
+
     @property
     def current_year(self):
         """
@@ -671,7 +725,9 @@ class Calculator():
             self.array('e26270', scorpincome_var + finite_diff)
         if self.__consumption.has_response():
             self.__consumption.response(self.__records, finite_diff)
-        self.calc_all(zero_out_calc_vars=zero_out_calculated_vars)
+        # perturbed results are not worth caching
+        with self._profiling('mtr', self.current_year):
+            self._calc_all(zero_out_calc_vars=zero_out_calculated_vars)
         payrolltax_chng = self.array('payrolltax')
         incometax_chng = self.array('iitax')
         combined_taxes_chng = incometax_chng + payrolltax_chng
@@ -1136,13 +1192,15 @@ class Calculator():
         # pylint: disable=too-many-statements,too-many-branches,too-many-locals
 
         # nested function used only in reform_documentation function
-        def param_doc(years_list, updated, baseline):
+        def param_doc(years_list, updated, baseline, pnames=None):
             """
             Parameters
             ----------
             years_list: list of parameter-change years
             updated: reform Policy or updated GrowDiff object
             base: current-law Policy or default GrowDiff object
+            pnames: set of names of the only parameters that can differ
+                    or None when any parameter can differ
 
             Returns
             -------
@@ -1184,12 +1242,15 @@ class Calculator():
             doc = ''
             assert isinstance(years_list, list)
             years = sorted(years_list)
+            mdata_base = None
             for year in years:
                 baseline.set_year(year)
                 updated.set_year(year)
                 assert set(baseline.keys()) == set(updated.keys())
                 params_with_diff = []
                 for pname in baseline.keys():
+                    if pnames is not None and pname not in pnames:
+                        continue
                     upda_value = getattr(updated, pname)
                     base_value = getattr(baseline, pname)
                     is_array = isinstance(upda_value, np.ndarray)
@@ -1199,7 +1260,9 @@ class Calculator():
                     ):
                         params_with_diff.append(pname)
                 if params_with_diff:
-                    mdata_base = baseline.specification(meta_data=True)
+                    if mdata_base is None:
+                        # parameter metadata are the same in all years
+                        mdata_base = baseline.specification(meta_data=True)
                     # write year
                     doc += f'{year}:\n'
                     for pname in sorted(params_with_diff):
@@ -1252,34 +1315,51 @@ class Calculator():
                         else:  # if baseline is GrowDiff object
                             # each GrowDiff parameter has zero as default value
                             doc += '  baseline_value: 0.0\n'
-                    del mdata_base
             return doc
 
         # begin main logic of reform_documentation
-        # create Policy object with current-law-policy values
-        gdiff_base = GrowDiff()
-        gdiff_base.update_growdiff(params['growdiff_baseline'])
+        # create Policy object with current-law-policy values, which is a
+        # copy of a cached Policy object, and skip the GrowDiff objects
+        # when there are no growth-difference assumptions
         assert isinstance(growfactors, GrowFactors)
         gfactors_clp = copy.deepcopy(growfactors)
-        gdiff_base.apply_to(gfactors_clp)
-        clp = Policy(gfactors=gfactors_clp)
+        gdiff_base = None
+        if params['growdiff_baseline']:
+            gdiff_base = GrowDiff()
+            gdiff_base.update_growdiff(params['growdiff_baseline'])
+            gdiff_base.apply_to(gfactors_clp)
+        clp = _current_law_policy(gfactors_clp)
         # create Policy object with post-reform values
-        gdiff_resp = GrowDiff()
-        gdiff_resp.update_growdiff(params['growdiff_response'])
-        gfactors_ref = copy.deepcopy(growfactors)
-        gdiff_base.apply_to(gfactors_ref)
-        gdiff_resp.apply_to(gfactors_ref)
-        ref = Policy(gfactors=gfactors_ref)
-        ref.implement_reform(params['policy'])
-        reform_years = Policy.years_in_revision(params['policy'])
-        if policy_dicts is not None:  # compound reform has been specified
+        gdiff_resp = None
+        if params['growdiff_response']:
+            gdiff_resp = GrowDiff()
+            gdiff_resp.update_growdiff(params['growdiff_response'])
+            gfactors_ref = copy.deepcopy(gfactors_clp)
+            gdiff_resp.apply_to(gfactors_ref)
+            ref = _current_law_policy(gfactors_ref)
+        else:
+            ref = copy.deepcopy(clp)
+        compound = policy_dicts is not None
+        if compound:
             assert isinstance(policy_dicts, list)
-            for policy_dict in policy_dicts:
-                ref.implement_reform(policy_dict)
-                xyears = Policy.years_in_revision(policy_dict)
-                for year in xyears:
-                    if year not in reform_years:
-                        reform_years.append(year)
+        reform_dicts = [params['policy']] + (policy_dicts or [])
+        ref.implement_reforms(reform_dicts)
+        reform_years = []
+        for policy_dict in reform_dicts:
+            for year in Policy.years_in_revision(policy_dict):
+                if year not in reform_years:
+                    reform_years.append(year)
+        # only the parameters in the reform can have different values,
+        # unless the reform or the response assumptions change the indexing
+        # rates of all parameters
+        pnames = None
+        if gdiff_resp is None and not any(
+                'parameter_indexing_CPI_offset' in policy_dict
+                for policy_dict in reform_dicts
+        ):
+            pnames = {pname.split('-indexed')[0]
+                      for policy_dict in reform_dicts
+                      for pname in policy_dict}
         # generate documentation text
         doc = 'REFORM DOCUMENTATION\n'
         # ... documentation for baseline growdiff assumptions
@@ -1297,24 +1377,15 @@ class Calculator():
         else:
             doc += 'none: no response GrowDiff assumptions specified\n'
         # ... documentation for (possibly compound) policy reform
-        if policy_dicts is None:
+        if not compound:
             doc += 'Policy Reform Parameter Values by Year:\n'
         else:
             doc += 'Compound Policy Reform Parameter Values by Year:\n'
         # ... use clp and ref Policy objects to generate documentation
         if reform_years:
-            doc += param_doc(reform_years, ref, clp)
+            doc += param_doc(reform_years, ref, clp, pnames)
         else:
             doc += 'none: using current-law policy parameters\n'
-        # cleanup local objects
-        del gdiff_base
-        del gfactors_clp
-        del gdiff_resp
-        del gfactors_ref
-        del clp
-        del ref
-        del years
-        del reform_years
         # return documentation string
         return doc
 
@@ -1362,16 +1433,47 @@ class Calculator():
 
     # ----- begin private methods of Calculator class -----
 
+    def _calc_all(self, zero_out_calc_vars=False):
+        """
+        Call all tax-calculation functions for the current_year without
+        using any result cache.
+        """
+        # conducts static analysis of Calculator object for current_year
+        UBI(self.__policy, self.__records)
+        with self._profiling('BenefitPrograms'):
+            BenefitPrograms(self)
+        with self._profiling('_calc_one_year'):
+            self._calc_one_year(zero_out_calc_vars)
+        with self._profiling('BenefitSurtax'):
+            BenefitSurtax(self)
+        with self._profiling('BenefitLimitation'):
+            BenefitLimitation(self)
+        FairShareTax(self.__policy, self.__records)
+        LumpSumTax(self.__policy, self.__records)
+        ExpandIncome(self.__policy, self.__records)
+        AfterTaxIncome(self.__policy, self.__records)
+
     def _taxinc_to_amt(self):
         """
         Call TaxInc through AMT functions.
         """
-        TaxInc(self.__policy, self.__records)
-        SchXYZTax(self.__policy, self.__records)
-        GainsTax(self.__policy, self.__records)
-        AGIsurtax(self.__policy, self.__records)
-        NetInvIncTax(self.__policy, self.__records)
-        AMT(self.__policy, self.__records)
+        with self._profiling('_taxinc_to_amt'):
+            TaxInc(self.__policy, self.__records)
+            SchXYZTax(self.__policy, self.__records)
+            GainsTax(self.__policy, self.__records)
+            AGIsurtax(self.__policy, self.__records)
+            NetInvIncTax(self.__policy, self.__records)
+            AMT(self.__policy, self.__records)
+
+    def _profiling(self, name, year=None):
+        """
+        Return context manager that times the enclosed code as the named
+        section of the CalcProfile object, or that does nothing when
+        timings are not being collected.
+        """
+        if self.__profile is None:
+            return contextlib.nullcontext()
+        return self.__profile.section(name, year)
 
     def _calc_one_year(self, zero_out_calc_vars=False):
         """
@@ -1452,3 +1554,18 @@ class Calculator():
         C1040(self.__policy, self.__records)
         CTC_new(self.__policy, self.__records)
         IITAX(self.__policy, self.__records)
+
+
+def _current_law_policy(gfactors):
+    """
+    Return copy of the cached current-law Policy object that uses the
+    indexing rates in the specified GrowFactors object, which is not used
+    by the returned Policy object so that it can still be updated.
+    """
+    rates = gfactors.gfdf[['ACPIU', 'AWAGE']]
+    key = (rates.index.to_numpy().tobytes(), rates.to_numpy().tobytes())
+    if key not in _CURRENT_LAW_POLICIES:
+        if len(_CURRENT_LAW_POLICIES) >= _MAX_CURRENT_LAW_POLICIES:
+            del _CURRENT_LAW_POLICIES[next(iter(_CURRENT_LAW_POLICIES))]
+        _CURRENT_LAW_POLICIES[key] = Policy(gfactors=copy.deepcopy(gfactors))
+    return copy.deepcopy(_CURRENT_LAW_POLICIES[key])
@@ -29,7 +29,7 @@ def cli_tc_main():
     start_time = time.time()
 
     # parse command-line arguments:
-    usage_str = 'tc INPUT TAXYEAR {}{}{}{}'.format(
+    usage_str = 'tc INPUT TAXYEAR {}{}{}{}{}'.format(
         '[--help] [--numyears N]\n',
         (
             '          '
@@ -41,6 +41,10 @@ def cli_tc_main():
             '[--params] [--tables] [--graphs] '
             '[--dumpdb] [--dumpvars DUMPVARS]\n'
         ),
+        (
+            '          '
+            '[--cachedir CACHEDIR] [--memprofile]\n'
+        ),
         (
             '          '
             '[--runid N] [--silent] [--test] [--version] [--usage]'
@@ -131,6 +135,23 @@ def cli_tc_main():
                               'records_variables.json file plus mtr_itax and '
                               'mtr_ptax (MTRs wrt taxpayer earnings).'),
                         default=None)
+    parser.add_argument('--cachedir',
+                        help=('CACHEDIR is name of optional directory that '
+                              'contains an on-disk cache of the calculated '
+                              'variables, which are read from the cache '
+                              'when the same calculations have been done '
+                              'in an earlier run and are written to the '
+                              'cache otherwise. No --cachedir implies '
+                              'calculated variables are not cached.'),
+                        default=None)
+    parser.add_argument('--memprofile',
+                        help=('optional flag that causes the memory used '
+                              'by each stage of the calculations to be '
+                              'written to a text file, which also lists '
+                              'the largest arrays and DataFrames held in '
+                              'memory. Memory profiling slows execution.'),
+                        default=False,
+                        action="store_true")
     parser.add_argument('--runid', metavar='N',
                         help=('N is a positive integer run id that is used '
                               'to construct simpler output file names. '
@@ -246,6 +267,7 @@ def cli_tc_main():
         assump=args.assump,
         runid=args.runid,
         silent=args.silent,
+        memprofile=tc.MemoryProfile() if args.memprofile else None,
     )
     if tcio.errmsg:
         if tcio.errmsg.endswith('\n'):
@@ -262,6 +284,9 @@ def cli_tc_main():
         assump=args.assump,
         aging_input_data=aging_data,
         exact_calculations=args.exact,
+        result_cache=(
+            tc.ResultCache(args.cachedir) if args.cachedir else None
+        ),
     )
     if tcio.errmsg:
         if tcio.errmsg.endswith('\n'):
@@ -292,6 +317,8 @@ def cli_tc_main():
         return retcode
     # quit if args.numyears is equal to one
     if args.numyears == 1:
+        if args.memprofile:
+            tcio.write_memprofile_file()
         if not args.silent:
             print(  # pragma: no cover
                 f'Execution time is {(time.time() - start_time):.1f} seconds'
@@ -307,6 +334,8 @@ def cli_tc_main():
             output_dump=args.dumpdb,
             dump_varlist=dumpvars_list,
         )
+    if args.memprofile:
+        tcio.write_memprofile_file()
     if not args.silent:
         print(  # pragma: no cover
             f'Execution time is {(time.time() - start_time):.1f} seconds'
@@ -7,12 +7,27 @@ Tax-Calculator abstract base data class.
 
 import os
 import abc
+import copy
+import json
+import shutil
+import hashlib
+import tempfile
 import numpy as np
 import pandas as pd
 from taxcalc.growfactors import GrowFactors
 from taxcalc.utils import read_egg_csv, read_egg_json, json_to_dict
 
 
+# columnar caches of CSV files are stored in the directory specified by the
+# INPUT_CACHE_DIR_ENV environment variable, from which least recently used
+# caches are removed when they are larger than the number of bytes given by
+# INPUT_CACHE_SIZE_ENV or, by default, INPUT_CACHE_MAX_SIZE_BYTES
+INPUT_CACHE_DIR_ENV = 'TAXCALC_INPUT_CACHE_DIR'
+INPUT_CACHE_SIZE_ENV = 'TAXCALC_INPUT_CACHE_MAX_BYTES'
+INPUT_CACHE_SUFFIX = '.inputcols'
+INPUT_CACHE_MAX_SIZE_BYTES = 2 * 1024**3
+
+
 class Data():
     """
     Inherit from this class for Records and other collections of
@@ -22,7 +37,11 @@ class Data():
     Parameters
     ----------
     data: string or Pandas DataFrame
-        string describes CSV file in which data reside;
+        string describes CSV file in which data reside or directory
+        containing columnar store written by the write_columns method,
+        whose columns are read from memory-mapped files and copied into
+        the values of the read variables (so a scratch_dir must also be
+        specified to avoid holding all the data in memory);
         DataFrame already contains cross-sectional data for start_year.
         NOTE: data=None is allowed but the returned instance contains only
               the data variable information in the specified VARINFO file.
@@ -49,6 +68,14 @@ class Data():
         while TMD input data generated in the tax-microdata repository
         use a 1.0 weights_scale value.
 
+    scratch_dir: None or string
+        None keeps the values of all variables in memory;
+        string describes directory in which the values of all variables
+        (and copies of them) are kept in memory-mapped temporary files,
+        which allows the data to be larger than the available memory
+        (when the data are read from a columnar store, as the data are
+        read from a CSV file or a DataFrame in memory).
+
     Raises
     ------
     ValueError:
@@ -70,9 +97,12 @@ class Data():
     VARINFO_FILE_NAME = None
     VARINFO_FILE_PATH = None
 
+    INTEGER_STORAGE_TYPES = ('bool', 'int8', 'int16', 'int32')
+
     def __init__(self, data, start_year, gfactors=None,
-                 weights=None, weights_scale=0.01):
+                 weights=None, weights_scale=0.01, scratch_dir=None):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
+        # pylint: disable=too-many-statements
 
         # initialize data variable info sets and read variable information
         self.INTEGER_READ_VARS = set()
@@ -81,7 +111,23 @@ class Data():
         self.CALCULATED_VARS = set()
         self.CHANGING_CALCULATED_VARS = set()
         self.INTEGER_VARS = set()
+        self.INTEGER_STORAGE = {}
+        self.GROWFACTOR_VARS = {}
         self._read_var_info()
+        # initialize column store of variables (see _read_data method)
+        self._float_cols = []
+        self._int_cols = []
+        self._col_rows = {}
+        self._arrays = {}
+        self._scratch_dir = scratch_dir
+        self._num_grown = 0
+        self._num_unsigned = 0
+        self._gfcols = None
+        # initialize identification of the input values (see input_key)
+        self._data_source = None
+        self._weights_source = None
+        self._source_key = None
+        self._input_changed = False
         if data is not None:
             # check consistency of specified gfactors and weights
             if gfactors is None and weights is None:
@@ -102,6 +148,8 @@ class Data():
                 if not isinstance(gfactors, GrowFactors):
                     raise ValueError('gfactors is not a GrowFactors instance')
             self.gfactors = gfactors
+            if self.__aging_data:
+                self._index_growfactors()
             # read sample weights
             self.WT = None
             self.weights_scale = weights_scale
@@ -122,7 +170,7 @@ class Data():
                 assert wt_colname in self.WT.columns, (
                     f'no weights for start year {self.current_year}'
                 )
-                self.s006 = self.WT[wt_colname] * self.weights_scale
+                self.s006[:] = self.WT[wt_colname] * self.weights_scale
 
     @property
     def data_year(self):
@@ -160,7 +208,181 @@ class Data():
             assert wt_colname in self.WT.columns, (
                 f'no weights for new year {self.current_year}'
             )
-            self.s006 = self.WT[wt_colname] * self.weights_scale
+            self.s006[:] = self.WT[wt_colname] * self.weights_scale
+
+    def snapshot(self):
+        """
+        Return the current year and a copy of the values of all variables,
+        which can be passed to the restore method to set the variables
+        back to these values.
+
+        Returns
+        -------
+        snapshot: dictionary
+            the variables in the column store are copied as one array
+            for each storage type.
+        """
+        self._attach_columns()
+        detached = {
+            name: copy.deepcopy(getattr(self, name))
+            for name in self._float_cols + self._int_cols
+            if not self._is_column(name)
+        }
+        return {
+            'year': self.__current_year,
+            'input_changed': self._input_changed,
+            'arrays': {key: self._copy_array(array)
+                       for key, array in self._arrays.items()},
+            'detached': detached,
+        }
+
+    def restore(self, snapshot):
+        """
+        Set the current year and the values of all variables to those in
+        the specified snapshot, which was returned by the snapshot method
+        of this object.  The snapshot can be restored more than once.
+        The column store is replaced by a copy of the snapshot, so arrays
+        obtained from the variables before the restore keep their values.
+        """
+        self.__current_year = snapshot['year']
+        self._input_changed = snapshot['input_changed']
+        self._arrays = {key: self._copy_array(array)
+                        for key, array in snapshot['arrays'].items()}
+        self._bind_columns(self._float_cols + self._int_cols)
+        for name, value in snapshot['detached'].items():
+            setattr(self, name, copy.deepcopy(value))
+
+    def input_key(self):
+        """
+        Return string that identifies the current values of the variables
+        by the data and weights from which they were read, the growth
+        factors used to extrapolate them, and the current year, or return
+        None if the values cannot be identified in this way (for example,
+        because a read variable has been changed as described in the
+        note_changed method).  Data and weights read from files are
+        identified by a hash of the file contents, while data read from a
+        DataFrame are identified by a hash of the values of the read
+        variables, which can be computed only before the data have been
+        extrapolated.  The hash is computed when first needed and is then
+        remembered by the object and its copies.
+        """
+        if self._input_changed:
+            return None
+        if self._source_key is None:
+            self._source_key = self._source_hash()
+        if not self._source_key:
+            return None
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(
+            f'{type(self).__name__}|{self._source_key}|{self.__data_year}|'
+            f'{self.__current_year}|{self.weights_scale}|'.encode('utf-8')
+        )
+        if self.gfactors is not None:
+            gfdf = self.gfactors.gfdf
+            hasher.update(f'{list(gfdf.columns)}|'.encode('utf-8'))
+            _hash_values(hasher, gfdf.to_numpy())
+        for values in self._input_key_values():
+            _hash_values(hasher, values)
+        return hasher.hexdigest()
+
+    def note_changed(self, varname):
+        """
+        Note that the named variable has been set by code outside this
+        object (for example, by the Calculator.array method), which means
+        that the input_key method returns None until a snapshot taken
+        before the change is restored, unless the variable is one whose
+        values are calculated anew each year.
+        """
+        if varname not in self.CHANGING_CALCULATED_VARS:
+            self._input_changed = True
+
+    def copy_with_gfactors(self, gfactors):
+        """
+        Return deep copy of the object that uses the specified GrowFactors
+        object to extrapolate the data, which is the same as constructing
+        the object from the same data with the specified gfactors, but
+        without reading the data and weights again.
+
+        Raises
+        ------
+        ValueError:
+            if the object is not extrapolating data.
+            if gfactors is not a GrowFactors class instance.
+            if the object has been extrapolated past its data year.
+        """
+        # pylint: disable=protected-access
+        if not self.__aging_data:
+            raise ValueError('data are not being extrapolated')
+        if not isinstance(gfactors, GrowFactors):
+            raise ValueError('gfactors is not a GrowFactors instance')
+        if self.current_year != self.data_year:
+            raise ValueError('current_year is not equal to data_year')
+        # the memo makes the copy refer to gfactors instead of a copy of
+        # the growth factors of this object
+        dup = copy.deepcopy(self, {id(self.gfactors): gfactors})
+        dup._index_growfactors()
+        return dup
+
+    def write_columns(self, path):
+        """
+        Write the values of all read variables to a columnar store in the
+        new directory at path, which can be specified as the data argument
+        of the class constructor.
+
+        Raises
+        ------
+        OSError:
+            if the columnar store cannot be written.
+        """
+        index = None
+        if not self.__index.equals(pd.RangeIndex(self.array_length)):
+            index = [int(label) for label in self.__index]
+        _write_columns(
+            path,
+            {varname: getattr(self, varname)
+             for varname in sorted(self.USABLE_READ_VARS)},
+            {'length': self.array_length,
+             'ignored': sorted(self.IGNORED_VARS),
+             'index': index}
+        )
+
+    def __deepcopy__(self, memo):
+        """
+        Return deep copy of the object whose column store is allocated in
+        the same way as that of the object.
+        """
+        dup = self.__class__.__new__(self.__class__)
+        memo[id(self)] = dup
+        state = self.__getstate__()
+        for name, value in state.items():
+            if name == '_arrays':
+                dup.__dict__[name] = {key: self._copy_array(array)
+                                      for key, array in value.items()}
+            else:
+                dup.__dict__[name] = copy.deepcopy(value, memo)
+        dup._bind_columns([name for name in self._float_cols + self._int_cols
+                           if name not in state])
+        return dup
+
+    def __getstate__(self):
+        """
+        Return the object state without the variables that are views of
+        the column store, so that copies and pickles of the object have
+        their own column store.
+        """
+        state = self.__dict__.copy()
+        for name in self._float_cols + self._int_cols:
+            if self._is_column(name):
+                del state[name]
+        return state
+
+    def __setstate__(self, state):
+        """
+        Set the object state and the missing views of the column store.
+        """
+        self.__dict__.update(state)
+        self._bind_columns([name for name in self._float_cols + self._int_cols
+                            if name not in state])
 
     # ----- begin private methods of Data class -----
 
@@ -169,6 +391,7 @@ class Data():
         Read Data variables metadata from JSON file and
         specifies static variable name sets listed above.
         """
+        # pylint: disable=too-many-branches
         assert self.VARINFO_FILE_NAME is not None
         assert self.VARINFO_FILE_PATH is not None
         file_path = os.path.join(self.VARINFO_FILE_PATH,
@@ -199,61 +422,128 @@ class Data():
                                 FIXED_CALCULATED_VARS)
         self.CHANGING_CALCULATED_VARS = FLOAT_CALCULATED_VARS
         self.INTEGER_VARS = self.INTEGER_READ_VARS | INT_CALCULATED_VARS
+        # storage is the type in which the values of an integer variable
+        # are stored, which is int32 unless a narrower type is specified
+        for iotype in ('read', 'calc'):
+            for varname, vinfo in vardict[iotype].items():
+                storage = vinfo.get('storage')
+                if varname not in self.INTEGER_VARS:
+                    if storage is not None:
+                        msg = ('storage specified for non-integer '
+                               f'variable {varname}')
+                        raise ValueError(msg)
+                    continue
+                if storage is None:
+                    storage = 'int32'
+                if storage not in self.INTEGER_STORAGE_TYPES:
+                    msg = (f'storage of {varname} is not one of '
+                           f'{self.INTEGER_STORAGE_TYPES}')
+                    raise ValueError(msg)
+                self.INTEGER_STORAGE[varname] = np.dtype(storage)
+        # growfactor is the name of the growth factor applied to a variable
+        # or a list of the names of the growth factors applied to its
+        # nonnegative and negative values
+        for varname, vinfo in vardict['read'].items():
+            gfnames = vinfo.get('growfactor')
+            if gfnames is None:
+                continue
+            if varname not in FLOAT_READ_VARS:
+                msg = f'growfactor specified for non-float variable {varname}'
+                raise ValueError(msg)
+            if isinstance(gfnames, str):
+                gfnames = [gfnames, gfnames]
+            if len(gfnames) != 2:
+                msg = f'growfactor of {varname} is not one or two names'
+                raise ValueError(msg)
+            self.GROWFACTOR_VARS[varname] = tuple(gfnames)
 
     def _read_data(self, data):
         """
         Read data from file or use specified DataFrame as data.
         """
-        # pylint: disable=too-many-branches
+        # pylint: disable=too-many-branches,too-many-statements
         if data is None:
             return  # because there are no data to read
         # read specified data
+        cache_path = None
+        cached = None
         if isinstance(data, pd.DataFrame):
             taxdf = data
+            self._data_source = ('frame',)
         elif isinstance(data, str):
+            if os.path.isdir(data):
+                cached = _read_columns(data)
+                if cached is None:
+                    msg = f'data directory {data} is not a columnar store'
+                    raise ValueError(msg)
+                self._data_source = ('store', os.path.abspath(data))
+            else:
+                cache_path = self._cache_path('data', data)
+                cached = _read_cached_columns(cache_path)
             if os.path.isfile(data):
+                self._data_source = _file_source(data)
+            if cached is not None:
+                taxdf = None
+            elif os.path.isfile(data):
                 taxdf = pd.read_csv(data)
             else:  # find file in conda package
                 taxdf = read_egg_csv(data)  # pragma: no cover
+                self._data_source = ('frame',)  # pragma: no cover
         else:
             msg = 'data is neither a string nor a Pandas DataFrame'
             raise ValueError(msg)
-        self.__dim = len(taxdf.index)
-        self.__index = taxdf.index
-        # create class variables using taxdf column names
+        if cached is None:
+            self.__dim = len(taxdf.index)
+            self.__index = taxdf.index
+            colnames = list(taxdf.columns.values)
+        else:
+            columns, meta = cached
+            self.__dim = meta['length']
+            if meta.get('index') is None:
+                self.__index = pd.RangeIndex(self.__dim)
+            else:
+                self.__index = pd.Index(meta['index'])
+            colnames = list(columns) + meta['ignored']
+        # find class variables using taxdf column names
         READ_VARS = set()
         self.IGNORED_VARS = set()
-        for varname in list(taxdf.columns.values):
+        for varname in colnames:
             if varname in self.USABLE_READ_VARS:
                 READ_VARS.add(varname)
-                if varname in self.INTEGER_READ_VARS:
-                    setattr(self, varname,
-                            taxdf[varname].astype(np.int32).values)
-                else:
-                    setattr(self, varname,
-                            taxdf[varname].astype(np.float64).values)
             else:
                 self.IGNORED_VARS.add(varname)
         # check that MUST_READ_VARS are all present in taxdf
         if not self.MUST_READ_VARS.issubset(READ_VARS):
             msg = 'data missing one or more MUST_READ_VARS'
             raise ValueError(msg)
-        # delete intermediate taxdf object
-        del taxdf
-        # create other class variables that are set to all zeros
-        UNREAD_VARS = self.USABLE_READ_VARS - READ_VARS
-        ZEROED_VARS = self.CALCULATED_VARS | UNREAD_VARS
-        for varname in ZEROED_VARS:
-            if varname in self.INTEGER_VARS:
-                setattr(self, varname,
-                        np.zeros(self.array_length, dtype=np.int32))
+        # create column store in which other class variables are all zeros
+        self._create_columns()
+        for varname in READ_VARS:
+            if cached is not None:
+                values = columns[varname]
+            elif varname in self.INTEGER_READ_VARS:
+                values = taxdf[varname].astype(np.int64).values
             else:
-                setattr(self, varname,
-                        np.zeros(self.array_length, dtype=np.float64))
+                values = taxdf[varname].astype(np.float64).values
+            var = getattr(self, varname)
+            if (varname in self.INTEGER_READ_VARS and
+                    not np.array_equal(values.astype(var.dtype), values)):
+                msg = f'{varname} values cannot be stored as {var.dtype}'
+                raise ValueError(msg)
+            var[:] = values
+        # cache the typed read variables so the file is not parsed again
+        if cached is None:
+            _cache_columns(
+                cache_path,
+                {varname: getattr(self, varname)
+                 for varname in sorted(READ_VARS)},
+                {'length': self.__dim,
+                 'ignored': sorted(self.IGNORED_VARS)}
+            )
         # delete intermediate variables
+        del taxdf
+        del cached
         del READ_VARS
-        del UNREAD_VARS
-        del ZEROED_VARS
 
     def zero_out_changing_calculated_vars(self):
         """
@@ -272,11 +562,26 @@ class Data():
         """
         if weights is None:
             return
+        self._weights_source = ('frame',)
         if isinstance(weights, pd.DataFrame):
             WT = weights
         elif isinstance(weights, str):
             if os.path.isfile(weights):
+                self._weights_source = _file_source(weights)
+            cache_path = self._cache_path('weights', weights)
+            cached = _read_cached_columns(cache_path)
+            if cached is not None:
+                WT = pd.DataFrame(cached[0])
+            elif os.path.isfile(weights):
                 WT = pd.read_csv(weights)
+                if all(pd.api.types.is_numeric_dtype(dtype)
+                       for dtype in WT.dtypes):
+                    _cache_columns(
+                        cache_path,
+                        {name: WT[name].to_numpy(np.float64)
+                         for name in WT.columns},
+                        {}
+                    )
             else:  # find file in conda package
                 WT = read_egg_csv(
                     os.path.basename(weights))  # pragma: no cover
@@ -287,8 +592,409 @@ class Data():
         setattr(self, 'WT', WT.astype(np.float64))
         del WT
 
+    def _create_columns(self):
+        """
+        Create the column store, which contains the values of all the
+        float variables in the rows of one two-dimensional array and the
+        values of the integer variables in the rows of one array for each
+        of their storage types, and set each variable to a view of its
+        row.  The variables with growth factors are in the first rows of
+        the float array, with those whose nonnegative and negative values
+        have the same growth factor first, so that the variables can be
+        extrapolated with a few array operations.
+        """
+        allvars = self.USABLE_READ_VARS | self.CALCULATED_VARS
+        signed = sorted(var for var, gfn in self.GROWFACTOR_VARS.items()
+                        if gfn[0] != gfn[1])
+        grown = sorted(set(self.GROWFACTOR_VARS) - set(signed)) + signed
+        self._num_grown = len(grown)
+        self._num_unsigned = len(grown) - len(signed)
+        self._float_cols = grown + sorted(
+            allvars - self.INTEGER_VARS - set(grown)
+        )
+        self._int_cols = sorted(allvars & self.INTEGER_VARS)
+        groups = {'float64': self._float_cols}
+        for name in self._int_cols:
+            key = self.INTEGER_STORAGE[name].name
+            groups.setdefault(key, []).append(name)
+        self._col_rows = {name: (key, row)
+                          for key, names in groups.items()
+                          for row, name in enumerate(names)}
+        self._arrays = {
+            key: self._new_array((len(names), self.array_length), key)
+            for key, names in groups.items()
+        }
+        self._bind_columns(self._float_cols + self._int_cols)
+
+    def _new_array(self, shape, dtype):
+        """
+        Return new array of zeros with the specified shape and dtype, which
+        is memory-mapped to a temporary file in the scratch directory if
+        one was specified.  The file is removed at once, so its space is
+        freed when the array is no longer used.
+        """
+        if self._scratch_dir is None or 0 in shape:
+            return np.zeros(shape, dtype=dtype)
+        fd, path = tempfile.mkstemp(suffix='.scratch', dir=self._scratch_dir)
+        os.close(fd)
+        try:
+            return np.memmap(path, dtype=dtype, mode='w+', shape=shape)
+        finally:
+            try:
+                os.remove(path)
+            except OSError:  # pragma: no cover
+                pass  # file cannot be removed while mapped on some systems
+
+    def _copy_array(self, array):
+        """
+        Return copy of array allocated by the _new_array method.
+        """
+        dup = self._new_array(array.shape, array.dtype)
+        dup[:] = array
+        return dup
+
+    def _column_location(self, name):
+        """
+        Return the array and row of the column store containing the named
+        variable.
+        """
+        key, row = self._col_rows[name]
+        return self._arrays[key], row
+
+    def _bind_columns(self, names):
+        """
+        Set each named variable to a view of its row in the column store.
+        """
+        for name in names:
+            array, row = self._column_location(name)
+            setattr(self, name, array[row])
+
+    def _is_column(self, name):
+        """
+        Return True if the named variable is a view of its row in the
+        column store; otherwise return False, which is the case when the
+        variable has been set to another array (for example, by the
+        Calculator.array method or by a calc-style function).
+        """
+        var = getattr(self, name)
+        array, row = self._column_location(name)
+        return (isinstance(var, np.ndarray) and var.base is array and
+                var.dtype == array.dtype and var.shape == array[row].shape and
+                var.ctypes.data == array[row].ctypes.data)
+
+    def _attach_columns(self, names=None, cast=False):
+        """
+        Copy into the column store the values of the named variables (or
+        of all variables if names is None) that are not views of the
+        column store and set them to views of the column store.  Unless
+        cast is True, a variable is left as it is if its type or shape
+        differs from that of its row.
+        """
+        if names is None:
+            names = self._float_cols + self._int_cols
+        for name in names:
+            if self._is_column(name):
+                continue
+            var = getattr(self, name)
+            array, row = self._column_location(name)
+            if not cast and not (isinstance(var, np.ndarray) and
+                                 var.dtype == array.dtype and
+                                 var.shape == array[row].shape):
+                continue
+            array[row] = var
+            setattr(self, name, array[row])
+
+    def _index_growfactors(self):
+        """
+        Specify for each row of the array of grown variables the column
+        of the growth factors applied to its nonnegative and negative values.
+        """
+        gfcols = {name: col for col, name in enumerate(self.gfactors.names)}
+        grown = self._float_cols[:self._num_grown]
+        for varname in grown:
+            for gfname in self.GROWFACTOR_VARS[varname]:
+                if gfname not in gfcols:
+                    msg = f'growfactor {gfname} of {varname} is not known'
+                    raise ValueError(msg)
+        self._gfcols = np.array(
+            [[gfcols[name] for name in self.GROWFACTOR_VARS[varname]]
+             for varname in grown],
+            dtype=np.intp
+        ).reshape(-1, 2)
+
+    def _cache_path(self, kind, path):
+        """
+        Return path to the columnar cache of the specified kind of contents
+        of the CSV file at path, which is identified by a hash of the
+        contents of the CSV file and of the VARINFO file, or return None
+        if caching is not enabled (see the INPUT_CACHE_DIR_ENV constant)
+        or if either file cannot be read.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from taxcalc import __version__
+        cache_dir = _cache_directory(INPUT_CACHE_DIR_ENV)
+        if cache_dir is None or not os.path.isfile(path):
+            return None
+        varinfo_path = os.path.join(self.VARINFO_FILE_PATH,
+                                    self.VARINFO_FILE_NAME)
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(f'{kind}|{__version__}|'.encode('utf-8'))
+        try:
+            for fpath in (varinfo_path, path):
+                _hash_file(hasher, fpath)
+                hasher.update(b'|')
+        except OSError:  # pragma: no cover
+            return None
+        return os.path.join(cache_dir,
+                            hasher.hexdigest() + INPUT_CACHE_SUFFIX)
+
+    def _source_hash(self):
+        """
+        Return hash of the data and weights from which the variables were
+        read, or an empty string if they cannot be identified (see the
+        input_key method).
+        """
+        hasher = hashlib.blake2b(digest_size=20)
+        for kind, source in (('data', self._data_source),
+                             ('weights', self._weights_source)):
+            if source is None:
+                hasher.update(f'|{kind}|None|'.encode('utf-8'))
+                continue
+            hasher.update(f'|{kind}|{source[0]}|'.encode('utf-8'))
+            try:
+                if source[0] == 'file':
+                    if _file_source(source[1]) != source:
+                        return ''  # because file changed after being read
+                    _hash_file(hasher, source[1])
+                elif source[0] == 'store':
+                    for name in sorted(os.listdir(source[1])):
+                        stat = os.stat(os.path.join(source[1], name))
+                        hasher.update(
+                            f'{name}|{stat.st_size}|{stat.st_mtime_ns}|'
+                            .encode('utf-8')
+                        )
+                elif kind == 'weights':
+                    hasher.update(f'{list(self.WT.columns)}|'.encode('utf-8'))
+                    _hash_values(hasher, self.WT.to_numpy(np.float64))
+                else:
+                    if self.__current_year != self.__data_year:
+                        return ''  # because data have been extrapolated
+                    for varname in sorted(self.USABLE_READ_VARS):
+                        _hash_values(hasher, getattr(self, varname))
+            except OSError:  # pragma: no cover
+                return ''
+        return hasher.hexdigest()
+
+    def _input_key_values(self):
+        """
+        Return list of arrays whose values are included in the input_key
+        string in addition to the input data, weights, and growth factors.
+        """
+        # Override this method in subclass whose variables depend on other
+        # arguments of the subclass constructor
+        return []
+
     def _extrapolate(self, year):
         """
         Apply to data variables the growth factor values for specified year.
         """
-        # Override this empty method in subclass
+        # Override this method in subclass to apply other growth factors
+        self._attach_columns(self._float_cols[:self._num_grown], cast=True)
+        grown = self._arrays['float64'][:self._num_grown]
+        factors = self.gfactors.year_factors(year)
+        nun = self._num_unsigned
+        grown[:nun] *= factors[self._gfcols[:nun, 0], np.newaxis]
+        signed = grown[nun:]
+        signed[:] = np.where(
+            signed >= 0,
+            signed * factors[self._gfcols[nun:, 0], np.newaxis],
+            signed * factors[self._gfcols[nun:, 1], np.newaxis]
+        )
+
+
+def _file_source(path):
+    """
+    Return tuple that identifies the file at path by its absolute path,
+    size, and modification time.
+    """
+    stat = os.stat(path)
+    return ('file', os.path.abspath(path), stat.st_size, stat.st_mtime_ns)
+
+
+def _hash_file(hasher, path):
+    """
+    Update hasher with the contents of the file at path.
+    """
+    with open(path, 'rb') as hfile:
+        chunk = hfile.read(1 << 20)
+        while chunk:
+            hasher.update(chunk)
+            chunk = hfile.read(1 << 20)
+
+
+def _hash_values(hasher, values):
+    """
+    Update hasher with the dtype, shape, and contents of values.
+    """
+    array = np.ascontiguousarray(np.asarray(values))
+    hasher.update(f'{array.dtype.str}|{array.shape}|'.encode('utf-8'))
+    hasher.update(array.reshape(-1).view(np.uint8).data)
+
+
+def _cache_directory(env_var):
+    """
+    Return path to the cache directory specified by the named environment
+    variable, or None if the variable is not set or is empty, in which
+    case caching is not enabled.  The directory should be writable only
+    by the user because the columnar caches of CSV files contain
+    uncompressed copies of the input data and the parameters snapshot
+    files are unpickled.
+    """
+    return os.environ.get(env_var) or None
+
+
+def _input_cache_max_size():
+    """
+    Return the maximum total size in bytes of the columnar caches of CSV
+    files, which is specified by the INPUT_CACHE_SIZE_ENV environment
+    variable or is INPUT_CACHE_MAX_SIZE_BYTES if the variable is not set.
+
+    Raises
+    ------
+    ValueError:
+        if the environment variable is not a positive integer.
+    """
+    value = os.environ.get(INPUT_CACHE_SIZE_ENV)
+    if not value:
+        return INPUT_CACHE_MAX_SIZE_BYTES
+    try:
+        max_size = int(value)
+    except ValueError:
+        max_size = 0
+    if max_size <= 0:
+        msg = f'{INPUT_CACHE_SIZE_ENV} must be a positive integer'
+        raise ValueError(msg)
+    return max_size
+
+
+def _read_cached_columns(path):
+    """
+    Return (columns, meta) pair read from the columnar cache at path using
+    the _read_columns function after marking the cache as most recently
+    used, or None if path is None or if the cache cannot be read.
+    """
+    cached = _read_columns(path)
+    if cached is not None:
+        try:
+            os.utime(path)
+        except OSError:  # pragma: no cover
+            pass  # cache may have been evicted by another process
+    return cached
+
+
+def _read_columns(path):
+    """
+    Return (columns, meta) pair read from the columnar cache at path, where
+    columns is a dictionary of read-only arrays memory-mapped from the cache
+    and meta is the dictionary stored with them, or None if path is None
+    or if the cache cannot be read.
+    """
+    if path is None:
+        return None
+    try:
+        with open(os.path.join(path, 'columns.json'), 'r',
+                  encoding='utf-8') as jfile:
+            info = json.load(jfile)
+        columns = {}
+        for dtype, names in info['dtypes'].items():
+            array = np.load(os.path.join(path, f'{dtype}.npy'),
+                            mmap_mode='r', allow_pickle=False)
+            if (array.dtype != np.dtype(dtype) or
+                    array.shape != (len(names), info['length'])):
+                return None
+            columns.update(zip(names, array))
+        columns = {name: columns[name] for name in info['order']}
+    except (OSError, ValueError, KeyError, TypeError):
+        return None
+    return columns, info['meta']
+
+
+def _cache_columns(path, columns, meta):
+    """
+    Write the columns and meta dictionaries to the columnar cache at path
+    using the _write_columns function and then remove least recently used
+    caches until the total size of the caches is no larger than the value
+    of the _input_cache_max_size function, doing nothing if path is None
+    and not writing
+    the cache if it cannot be written (for example, because it has just
+    been written by another process).
+    """
+    if path is None:
+        return
+    max_size = _input_cache_max_size()
+    cache_dir = os.path.dirname(path)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        _write_columns(path, columns, meta)
+    except OSError:  # pragma: no cover
+        pass
+    _evict_columns(cache_dir, max_size, INPUT_CACHE_SUFFIX)
+
+
+def _evict_columns(cache_dir, max_size_bytes, suffix):
+    """
+    Remove least recently used columnar stores in the cache_dir directories
+    whose names end with suffix until the total size of these stores is no
+    larger than max_size_bytes.
+    """
+    entries = []
+    for entry in os.scandir(cache_dir):
+        if entry.name.endswith(suffix):
+            try:
+                mtime = entry.stat().st_mtime
+                size = sum(item.stat().st_size
+                           for item in os.scandir(entry.path))
+            except OSError:  # pragma: no cover
+                continue
+            entries.append((mtime, size, entry.path))
+    total_size = sum(size for _, size, _ in entries)
+    for _, size, path in sorted(entries):
+        if total_size <= max_size_bytes:
+            break
+        shutil.rmtree(path, ignore_errors=True)
+        total_size -= size
+
+
+def _write_columns(path, columns, meta):
+    """
+    Write the equal-length arrays in the columns dictionary and the meta
+    dictionary to a columnar store in the new directory at path, which
+    contains a two-dimensional array file for each dtype.  The store is
+    written to a temporary directory that is then renamed, so that
+    concurrent readers never see a partially written store.
+    """
+    dtypes = {}
+    for name, array in columns.items():
+        dtypes.setdefault(array.dtype.name, []).append(name)
+    length = len(next(iter(columns.values()))) if columns else 0
+    parent = os.path.dirname(os.path.abspath(path))
+    tmpdir = tempfile.mkdtemp(suffix='.tmp', dir=parent)
+    try:
+        for dtype, names in dtypes.items():
+            array = np.lib.format.open_memmap(
+                os.path.join(tmpdir, f'{dtype}.npy'), mode='w+',
+                dtype=dtype, shape=(len(names), length)
+            )
+            for row, name in enumerate(names):
+                array[row] = columns[name]
+            array.flush()
+            del array
+        with open(os.path.join(tmpdir, 'columns.json'), 'w',
+                  encoding='utf-8') as jfile:
+            json.dump({'order': list(columns), 'dtypes': dtypes,
+                       'length': length, 'meta': meta}, jfile)
+        os.replace(tmpdir, path)
+        tmpdir = None
+    finally:
+        if tmpdir is not None:
+            shutil.rmtree(tmpdir, ignore_errors=True)
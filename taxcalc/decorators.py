@@ -11,7 +11,10 @@ import io
 import ast
 import inspect
 import numba
+import numpy as np
+from pandas import DataFrame, Series
 from taxcalc.policy import Policy
+from taxcalc.calcprofile import ACTIVE
 
 
 DO_JIT = True
@@ -256,11 +259,17 @@ def iterate_jit(parameters=None, **kwargs):
         # Get the input arguments from the function
         in_args = inspect.getfullargspec(func).args
         # Get the numba.jit arguments
-        jit_args_list = inspect.getfullargspec(JIT).args + ['nopython']
+        jit_args_list = inspect.getfullargspec(JIT).args + ['nopython',
+                                                            'nogil']
         kwargs_for_jit = {}
         for key, val in kwargs.items():
             if key in jit_args_list:
                 kwargs_for_jit[key] = val
+        # Release the GIL while the compiled loop executes so that the
+        # baseline and reform Calculator objects can execute calc-style
+        # functions concurrently in separate threads.
+        if JIT is numba.jit and kwargs_for_jit.get('nopython', False):
+            kwargs_for_jit.setdefault('nogil', True)
 
         # Any name that is a parameter
         # Boolean flag is given special treatment.
@@ -304,6 +313,19 @@ def iterate_jit(parameters=None, **kwargs):
             if os.getenv('TESTING') == 'True':
                 return func(*args, **kwargs)
 
+            # read current-year policy parameter values from the dictionary
+            # materialized by the Policy object instead of fetching each
+            # parameter attribute and generating a high-level function
+            year_values = getattr(args[0], 'year_values', None)
+            if (
+                    isinstance(year_values, dict) and not kwargs and
+                    not any(farg in year_values for farg in all_out_args)
+            ):
+                return _call_applied_function(
+                    func.__name__, applied_jitted_f, all_out_args, in_args,
+                    year_values, args[1]
+                )
+
             in_arrays = []
             pm_or_pf = []
             for farg in all_out_args + in_args:
@@ -322,9 +344,78 @@ def iterate_jit(parameters=None, **kwargs):
             eval(func_code,  # pylint: disable=eval-used
                  {"applied_f": applied_jitted_f}, fakeglobals)
             high_level_fn = fakeglobals['hl_func']
-            ans = high_level_fn(*args, **kwargs)
+            profile = ACTIVE.profile
+            if profile is None:
+                ans = high_level_fn(*args, **kwargs)
+                return ans
+            nbytes = sum(getattr(arr, 'nbytes', 0) for arr in in_arrays)
+            with profile.section(func.__name__, nbytes=nbytes):
+                ans = high_level_fn(*args, **kwargs)
             return ans
 
+        # expose the apply-style function and the names of the returned
+        # variables so that a single calc-style function can be timed
+        # (including its JIT compile time) in isolation
+        wrapper.applied_function = applied_jitted_f
+        wrapper.out_args = tuple(all_out_args)
         return wrapper
 
     return make_wrapper
+
+
+def _call_applied_function(name, applied_f, out_args, in_args,
+                           year_values, pf):
+    """
+    Call applied_f, the apply-style function for the named calc-style
+    function, with the current-year parameter values in year_values and
+    the variables in the pf object, store the returned arrays in pf, and
+    return them in a DataFrame just as the high-level function created by
+    the create_toplevel_function_string function does.
+    """
+    # pylint: disable=too-many-arguments,too-many-positional-arguments
+    arrays = []
+    for farg in out_args + in_args:
+        if farg in year_values:
+            arrays.append(year_values[farg])
+        elif farg in out_args:
+            arrays.append(_get_values(getattr(pf, farg)))
+        else:
+            arrays.append(_kernel_values(getattr(pf, farg)))
+    profile = ACTIVE.profile
+    if profile is None:
+        outputs = applied_f(*arrays)
+    else:
+        nbytes = sum(getattr(arr, 'nbytes', 0) for arr in arrays)
+        with profile.section(name, nbytes=nbytes):
+            outputs = applied_f(*arrays)
+    if len(out_args) == 1:
+        setattr(pf, out_args[0], outputs)
+        return DataFrame(data=outputs, columns=out_args)
+    for farg, output in zip(out_args, outputs):
+        setattr(pf, farg, output)
+    return DataFrame(data=np.column_stack(outputs), columns=out_args)
+
+
+def _kernel_values(var):
+    """
+    Return NumPy array containing the values of var that can be passed as
+    an input argument to an apply-style function.  Numba promotes the
+    narrow integer and boolean types in which some Records variables are
+    stored to int64 in arithmetic, but NumPy scalars do not, so such
+    arrays are upcast when the functions are not jitted.
+    """
+    values = _get_values(var)
+    if (not DO_JIT and isinstance(values, np.ndarray) and
+            values.dtype.kind in 'biu' and values.dtype.itemsize < 8):
+        return values.astype(np.int64)
+    return values
+
+
+def _get_values(var):
+    """
+    Return NumPy array containing the values of var if it is a Pandas
+    Series; otherwise return var.
+    """
+    if isinstance(var, Series):
+        return var.values
+    return var
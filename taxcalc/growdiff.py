@@ -75,12 +75,9 @@ class GrowDiff(Parameters):
         Apply updated GrowDiff values to specified GrowFactors instance.
         """
         assert isinstance(growfactors, GrowFactors)
-        for gfvn in GrowFactors.VALID_NAMES:
-            _gfvn = f'_{gfvn}'
-            for i in range(0, self.num_years):
-                cyr = i + self.start_year
-                diff_array = getattr(self, _gfvn)
-                growfactors.update(gfvn, cyr, diff_array[i])
+        diff = np.column_stack([getattr(self, f'_{gfvn}')[:self.num_years]
+                                for gfvn in growfactors.names])
+        growfactors.apply_diff(diff, self.start_year)
 
     def set_rates(self):
         """
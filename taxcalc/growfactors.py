@@ -84,9 +84,12 @@ class GrowFactors():
         # determine first_year and last_year from gfdf
         self._first_year = min(gfdf.index)
         self._last_year = max(gfdf.index)
-        # set gfdf as attribute of class
-        self.gfdf = pd.DataFrame()
-        setattr(self, 'gfdf', gfdf.astype(np.float64))
+        # store grow factors in a dense (years x factors) array with a
+        # row index for each year and a column index for each factor name
+        self._years = [int(year) for year in gfdf.index]
+        self._rows = {year: row for row, year in enumerate(self._years)}
+        self._cols = {name: col for col, name in enumerate(gfdf.columns)}
+        self._factors = np.array(gfdf.to_numpy(dtype=np.float64), order='C')
         del gfdf
         # specify factors as being unused (that is, not yet accessed)
         self.used = False
@@ -105,6 +108,26 @@ class GrowFactors():
         """
         return self._last_year
 
+    @property
+    def names(self):
+        """
+        List of grow factor names in the order of the columns of the
+        arrays returned by the year_factors and cumulative_factors methods
+        and expected by the apply_diff method.
+        """
+        return list(self._cols)
+
+    @property
+    def gfdf(self):
+        """
+        DataFrame view of the grow factors, which has a YEAR index and a
+        column for each grow factor and which shares its values with this
+        GrowFactors object.
+        """
+        return pd.DataFrame(self._factors, copy=False,
+                            index=pd.Index(self._years, name='YEAR'),
+                            columns=list(self._cols))
+
     def price_inflation_rates(self, firstyear, lastyear):
         """
         Return list of price inflation rates rounded to four decimal digits.
@@ -119,9 +142,7 @@ class GrowFactors():
         if lastyear > self.last_year:
             msg = 'last_year={} > GrowFactors.last_year={}'
             raise ValueError(msg.format(lastyear, self.last_year))
-        rates = [round((self.gfdf['ACPIU'][cyr] - 1.0), 4)
-                 for cyr in range(firstyear, lastyear + 1)]
-        return rates
+        return self._rates('ACPIU', firstyear, lastyear)
 
     def wage_growth_rates(self, firstyear, lastyear):
         """
@@ -137,9 +158,7 @@ class GrowFactors():
         if lastyear > self.last_year:
             msg = 'lastyear={} > GrowFactors.last_year={}'
             raise ValueError(msg.format(lastyear, self.last_year))
-        rates = [round((self.gfdf['AWAGE'][cyr] - 1.0), 4)
-                 for cyr in range(firstyear, lastyear + 1)]
-        return rates
+        return self._rates('AWAGE', firstyear, lastyear)
 
     def factor_value(self, name, year):
         """
@@ -155,11 +174,47 @@ class GrowFactors():
         if year > self.last_year:
             msg = 'year={} > GrowFactors.last_year={}'
             raise ValueError(msg.format(year, self.last_year))
-        return self.gfdf.loc[year, name]
+        return self._factors[self._rows[year], self._cols[name]]
+
+    def year_factors(self, year):
+        """
+        Return read-only array view of the values of all factors for the
+        specified year, which are in the order of the names property.
+        """
+        self.used = True
+        if year < self.first_year:
+            msg = 'year={} < GrowFactors.first_year={}'
+            raise ValueError(msg.format(year, self.first_year))
+        if year > self.last_year:
+            msg = 'year={} > GrowFactors.last_year={}'
+            raise ValueError(msg.format(year, self.last_year))
+        factors = self._factors[self._rows[year]]
+        factors.flags.writeable = False
+        return factors
+
+    def cumulative_factors(self, firstyear, lastyear):
+        """
+        Return array containing, for each factor in the order of the names
+        property, the product of its values for the years from firstyear
+        through lastyear, which is the factor that ages a variable from the
+        year before firstyear to lastyear.  The product of no years (when
+        firstyear is greater than lastyear) is one.
+        """
+        self.used = True
+        if firstyear > lastyear:
+            return np.ones(len(self._cols))
+        if firstyear < self.first_year:
+            msg = 'firstyear={} < GrowFactors.first_year={}'
+            raise ValueError(msg.format(firstyear, self.first_year))
+        if lastyear > self.last_year:
+            msg = 'lastyear={} > GrowFactors.last_year={}'
+            raise ValueError(msg.format(lastyear, self.last_year))
+        rows = [self._rows[year] for year in range(firstyear, lastyear + 1)]
+        return np.prod(self._factors[rows], axis=0)
 
     def update(self, name, year, diff):
         """
-        Add to self.gfdf (for name and year) the specified diff amount.
+        Add to the factor value (for name and year) the specified diff amount.
         """
         if self.used:
             msg = 'cannot update growfactors after they have been used'
@@ -167,4 +222,34 @@ class GrowFactors():
         assert name in GrowFactors.VALID_NAMES
         if self.first_year <= year <= self.last_year:
             assert isinstance(diff, float)
-            self.gfdf.loc[year, name] += diff
+            self._factors[self._rows[year], self._cols[name]] += diff
+
+    def apply_diff(self, diff, firstyear):
+        """
+        Add to the factor values the specified diff amounts, which is a
+        two-dimensional array whose rows are for the years beginning with
+        firstyear and whose columns are in the order of the names property.
+        Rows for years outside the range of years of the grow factors are
+        ignored, as they are by the update method.
+        """
+        if self.used:
+            msg = 'cannot update growfactors after they have been used'
+            raise ValueError(msg)
+        diff = np.asarray(diff, dtype=np.float64)
+        if diff.ndim != 2 or diff.shape[1] != len(self._cols):
+            msg = 'diff does not have a column for each of the {} factors'
+            raise ValueError(msg.format(len(self._cols)))
+        years = range(firstyear, firstyear + len(diff))
+        idxs = [idx for idx, year in enumerate(years) if year in self._rows]
+        rows = [self._rows[years[idx]] for idx in idxs]
+        self._factors[rows] += diff[idxs]
+
+    def _rates(self, name, firstyear, lastyear):
+        """
+        Return list of the values minus one, rounded to four decimal digits,
+        of the factor with the specified name for the years from firstyear
+        through lastyear.
+        """
+        col = self._cols[name]
+        return [round(self._factors[self._rows[year], col] - 1.0, 4)
+                for year in range(firstyear, lastyear + 1)]
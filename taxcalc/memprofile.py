@@ -0,0 +1,259 @@
+"""
+Tax-Calculator MemoryProfile class that reports memory use by stage.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle memprofile.py
+# pylint --disable=locally-disabled memprofile.py
+
+import time
+import tracemalloc
+import contextlib
+import numpy as np
+import pandas as pd
+
+
+MEGABYTE = 1024.0**2
+
+
+class MemoryProfile():
+    """
+    Constructor for the MemoryProfile class, which records the memory
+    used by each stage of a Tax-Calculator run.
+
+    For each stage, the profile records the wall time, the resident set
+    size (RSS) of the process at the end of the stage, the change in RSS
+    during the stage, the peak RSS during the stage, and the peak and the
+    change in the memory allocated by Python (including NumPy arrays) as
+    measured by the tracemalloc module.  The profile also records the
+    largest NumPy arrays and Pandas objects held by selected objects, such
+    as the Records object embedded in a Calculator object.
+
+    Parameters
+    ----------
+    trace_allocations: boolean
+        specifies whether or not to use the tracemalloc module, which
+        slows execution, to measure memory allocated by Python;
+        default value is true.
+
+    Returns
+    -------
+    class instance: MemoryProfile
+
+    Notes
+    -----
+    A profile can be used to measure stages in either of two ways:
+         mprof = MemoryProfile()
+         with mprof.stage('Records construction'):
+             rec = Records.cps_constructor()
+         mprof.restart()
+         calc = Calculator(policy=pol, records=rec)
+         mprof.checkpoint('Calculator construction')
+         mprof.record_objects('calc', calc)
+         print(mprof.report())
+    or it can be passed to the TaxCalcIO constructor (which is what the
+    tc --memprofile option does).  The peak RSS values are available only
+    on Linux, where the RSS high-water mark can be reset for each stage;
+    elsewhere they are reported as NaN.
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    COLUMNS = ['stage', 'seconds', 'rss_mb', 'rss_change_mb', 'rss_peak_mb',
+               'traced_change_mb', 'traced_peak_mb']
+    OBJECT_COLUMNS = ['object', 'attribute', 'type', 'mb']
+
+    def __init__(self, trace_allocations=True):
+        self.trace_allocations = trace_allocations
+        self._started_tracing = False
+        self._stages = []
+        self._objects = []
+        self._start_time = 0.
+        self._start_rss = 0
+        self._start_traced = 0
+        self._peak_was_reset = False
+        self.restart()
+
+    def restart(self):
+        """
+        Start a new stage without recording the current stage.
+        """
+        if self.trace_allocations and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._peak_was_reset = MemoryProfile._reset_rss_peak()
+        self._start_rss = MemoryProfile._rss_bytes('VmRSS')
+        if tracemalloc.is_tracing():
+            tracemalloc.reset_peak()
+            self._start_traced = tracemalloc.get_traced_memory()[0]
+        self._start_time = time.perf_counter()
+
+    def checkpoint(self, stage):
+        """
+        Record memory use of the named stage, which began when the last
+        restart or checkpoint method was called, and start a new stage.
+        """
+        seconds = time.perf_counter() - self._start_time
+        rss = MemoryProfile._rss_bytes('VmRSS')
+        if self._peak_was_reset:
+            rss_peak = MemoryProfile._rss_bytes('VmHWM') / MEGABYTE
+        else:
+            rss_peak = np.nan  # pragma: no cover
+        if tracemalloc.is_tracing():
+            traced, traced_peak = tracemalloc.get_traced_memory()
+            traced_change = (traced - self._start_traced) / MEGABYTE
+            traced_peak = (traced_peak - self._start_traced) / MEGABYTE
+        else:
+            traced_change = np.nan
+            traced_peak = np.nan
+        self._stages.append([
+            stage,
+            seconds,
+            rss / MEGABYTE,
+            (rss - self._start_rss) / MEGABYTE,
+            rss_peak,
+            traced_change,
+            traced_peak,
+        ])
+        self.restart()
+
+    @contextlib.contextmanager
+    def stage(self, name):
+        """
+        Context manager that records memory use of the enclosed code
+        as the named stage.
+        """
+        self.restart()
+        try:
+            yield self
+        finally:
+            self.checkpoint(name)
+
+    def record_objects(self, label, obj, top=10):
+        """
+        Record the top largest NumPy arrays and Pandas objects that are
+        attributes of obj or attributes of the attributes of obj (such as
+        the Records object embedded in a Calculator object), using label
+        to identify obj in the report.
+        """
+        sizes = []
+        for name, value in MemoryProfile._attributes(obj):
+            nbytes = MemoryProfile._nbytes(value)
+            if nbytes is not None:
+                sizes.append([label, name, type(value).__name__,
+                              nbytes / MEGABYTE])
+            else:
+                for subname, subvalue in MemoryProfile._attributes(value):
+                    nbytes = MemoryProfile._nbytes(subvalue)
+                    if nbytes is not None:
+                        sizes.append([label, f'{name}.{subname}',
+                                      type(subvalue).__name__,
+                                      nbytes / MEGABYTE])
+        sizes.sort(key=lambda row: row[3], reverse=True)
+        self._objects.extend(sizes[:top])
+
+    def dataframe(self):
+        """
+        Return Pandas DataFrame containing one row for each recorded stage.
+        """
+        return pd.DataFrame(self._stages, columns=MemoryProfile.COLUMNS)
+
+    def objects_dataframe(self):
+        """
+        Return Pandas DataFrame containing one row for each recorded object
+        attribute.
+        """
+        return pd.DataFrame(self._objects,
+                            columns=MemoryProfile.OBJECT_COLUMNS)
+
+    def report(self):
+        """
+        Return string containing formatted memory profile report.
+        """
+        sdf = self.dataframe()
+        odf = self.objects_dataframe()
+        lines = ['MEMORY USE BY STAGE (MB = 2^20 bytes)\n']
+        if not sdf.empty:
+            lines.append(sdf.to_string(index=False, float_format='%.1f'))
+            lines.append('\n')
+        if not odf.empty:
+            lines.append('\nLARGEST ARRAYS AND DATAFRAMES (MB)\n')
+            lines.append(odf.to_string(index=False, float_format='%.1f'))
+            lines.append('\n')
+        return ''.join(lines)
+
+    def write_report(self, filename):
+        """
+        Write report() string to the named file.
+        """
+        with open(filename, 'w', encoding='utf-8') as rfile:
+            rfile.write(self.report())
+
+    def stop(self):
+        """
+        Stop tracing Python memory allocations if tracing was started by
+        this MemoryProfile object.
+        """
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+
+    # ----- begin private methods of MemoryProfile class -----
+
+    @staticmethod
+    def _attributes(obj):
+        """
+        Return list of (name, value) pairs for the attributes of obj with
+        any name-mangling prefix removed from private attribute names.
+        """
+        if not hasattr(obj, '__dict__') or isinstance(obj, type):
+            return []
+        attrs = []
+        for name, value in vars(obj).items():
+            if name.startswith('_') and '__' in name[1:]:
+                name = name[name.index('__', 1) + 2:]
+            attrs.append((name, value))
+        return attrs
+
+    @staticmethod
+    def _nbytes(value):
+        """
+        Return number of bytes used by value if it is a NumPy array or
+        a Pandas object; otherwise return None.
+        """
+        if isinstance(value, np.ndarray):
+            return value.nbytes
+        if isinstance(value, pd.DataFrame):
+            return int(value.memory_usage(index=True, deep=True).sum())
+        if isinstance(value, pd.Series):
+            return int(value.memory_usage(index=True, deep=True))
+        if isinstance(value, pd.Index):
+            return int(value.memory_usage(deep=True))
+        return None
+
+    @staticmethod
+    def _rss_bytes(field):
+        """
+        Return the value of the named field (VmRSS or VmHWM) of the
+        /proc/self/status file in bytes, or zero if it cannot be read.
+        """
+        try:
+            with open('/proc/self/status', 'r', encoding='utf-8') as sfile:
+                for line in sfile:
+                    if line.startswith(field + ':'):
+                        return int(line.split()[1]) * 1024
+        except (OSError, ValueError):  # pragma: no cover
+            pass
+        return 0  # pragma: no cover
+
+    @staticmethod
+    def _reset_rss_peak():
+        """
+        Reset the RSS high-water mark so that VmHWM measures the peak RSS
+        since this call, which is possible only on Linux, and return True
+        if the reset succeeded.
+        """
+        try:
+            with open('/proc/self/clear_refs', 'w', encoding='utf-8') as cfile:
+                cfile.write('5')
+        except OSError:  # pragma: no cover
+            return False
+        return True
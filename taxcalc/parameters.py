@@ -1,14 +1,22 @@
 """
 Tax-Calculator abstract base parameter class based on paramtools package.
 """
+# pylint: disable=too-many-lines
 
 import os
 import copy
-from collections import defaultdict
+import bisect
+import pickle
+import tempfile
+from collections import defaultdict, OrderedDict
 from typing import Union, Mapping, Any, List
 import numpy as np
 import marshmallow
 import paramtools
+from paramtools.parameters import ParameterSlice
+from paramtools.schema import BaseValidatorSchema, ValueObject, get_type
+from paramtools.schema_factory import SchemaFactory
+from taxcalc.data import _cache_directory
 
 
 class CompatibleDataSchema(marshmallow.Schema):
@@ -32,6 +40,20 @@ paramtools.register_custom_type(
 )
 
 
+# parameter fields that document a parameter but are not used to compute
+# its values, which are loaded only when the metadata are requested
+DOC_METADATA_FIELDS = ('title', 'description', 'notes',
+                       'section_1', 'section_2', 'compatible_data')
+
+# documentation metadata and schema classes shared by all Parameters objects
+_DOC_METADATA = {}
+_SCHEMA_CLASSES = {}
+# paramtools version whose Parameters constructor is reproduced when a
+# Parameters object is constructed from a snapshot (snapshots are not used
+# with other paramtools versions)
+SNAPSHOT_PARAMTOOLS_VERSION = '0.20.0'
+
+
 class Parameters(paramtools.Parameters):
     """
     Base class that wraps ParamTools, providing parameter indexing
@@ -70,6 +92,11 @@ class Parameters(paramtools.Parameters):
     array_first = True
     label_to_extend = 'year'
     uses_extend_func = True
+    _bulk_extension = False
+    _year_values = None
+    _array_cache = None
+    _year_states = None
+    _defaults_path = None
 
     REMOVED_PARAMS = None
     REDEFINED_PARAMS = None
@@ -84,6 +111,7 @@ class Parameters(paramtools.Parameters):
     def __init__(self, start_year=None, num_years=None, last_known_year=None,
                  removed=None, redefined=None, wage_indexed=None, **kwargs):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
+        # pylint: disable=too-many-locals,too-many-statements
 
         # In case we need to wait for this to be called from the
         # initialize method for legacy reasons.
@@ -117,18 +145,172 @@ class Parameters(paramtools.Parameters):
             kwargs['initial_state'] = {
                 'year': start_year or self.JSON_START_YEAR
             }
+        # documentation metadata are separated from the defaults that are
+        # needed for computation and loaded only when they are requested
+        if isinstance(self.defaults, str) and os.path.isfile(self.defaults):
+            self._defaults_path = self.defaults
+        # use compiled index of the defaults and the extended parameter
+        # values, which is stored in a snapshot, when one is available
+        key = None
+        snapshot_path = None
+        if set(kwargs.keys()) == {'initial_state'}:
+            key = self._snapshot_key(  # pylint: disable=assignment-from-none
+                last_budget_year
+            )
+            snapshot_path = _snapshot_file_path(key)
+        snapshot = _read_snapshot(snapshot_path)
+        if snapshot is not None:
+            self.defaults = snapshot['defaults']
+            self._init_from_snapshot(snapshot['data'],
+                                     kwargs['initial_state'], key)
+            return
         # update defaults to correspond to user-defined parameter years
         self.defaults = super().get_defaults()
         label = self.defaults['schema']['labels']['year']
         label['validators']['range']['max'] = last_budget_year
         super().__init__(**kwargs)
+        # the value objects are sorted after the selections cached in sel
+        # are made, so drop them as they are not in the sorted order
+        self.sel._cache.clear()  # pylint: disable=protected-access
+        if self._defaults_path is not None:
+            _split_doc_metadata(self.defaults)
+            docs = _split_doc_metadata(self._data)
+            _DOC_METADATA.setdefault(self._defaults_path, docs)
+        _write_snapshot(snapshot_path,
+                        {'defaults': self.defaults, 'data': self._data})
+
+    def _snapshot_key(self, last_budget_year):
+        """
+        Return string that identifies everything that determines the
+        parameter values after the defaults have been read and extended
+        through last_budget_year, or None if snapshots are not to be used.
+        Subclasses that return a string must implement the set_rates method.
+        """
+        # pylint: disable=unused-argument
+        return None
+
+    def _init_from_snapshot(self, data, initial_state, key):
+        """
+        Initialize Parameters object in the same way as the paramtools
+        Parameters constructor does, except that the deserialized, extended,
+        and sorted parameter data are taken from a snapshot.
+        """
+        factory = SchemaFactory(self.defaults)
+        self._defaults_schema, self._validator_schema = (
+            _unloaded_schemas(factory, key)
+        )
+        self._schema = factory.schema
+        self._data = data
+        self.label_validators = factory.label_validators
+        self.keyfuncs = {}
+        for label, validator in self.label_validators.items():
+            cmp_funcs = getattr(validator, 'cmp_funcs', None)
+            if cmp_funcs is not None:
+                self.keyfuncs[label] = cmp_funcs()['key']
+        self._stateless_label_grid = OrderedDict()
+        for name, validator in self.label_validators.items():
+            if hasattr(validator, 'grid'):
+                self._stateless_label_grid[name] = validator.grid()
+            else:
+                self._stateless_label_grid[name] = []
+        self.label_grid = copy.deepcopy(self._stateless_label_grid)
+        self._validator_schema.pt_context['spec'] = self
+        self._warnings = {}
+        self._errors = {}
+        self._defer_validation = False
+        self._state = self.parse_labels(**initial_state)
+        self.sel = ParameterSlice(self)
+        self.set_state()
+        if 'operators' not in self._schema:
+            self._schema['operators'] = {}
+        self._schema['operators'].update(self.operators)
+        # set indexing rates as is done when parameters are extended
+        self.set_rates()
+
+    def __deepcopy__(self, memo):
+        """
+        Return deep copy of this object that shares the parameter data and
+        arrays with this object until either object adjusts them.
+        """
+        cls = self.__class__
+        pcopy = cls.__new__(cls)
+        memo[id(self)] = pcopy
+        pcopy._share_from(self, memo)  # pylint: disable=protected-access
+        return pcopy
+
+    def _share_from(self, other, memo):
+        """
+        Set the attributes of this object to deep copies of the attributes
+        of the other object, except that the parameter data dictionaries,
+        the read-only parameter arrays, and the defaults and schemas, which
+        are not changed, are shared with the other object.  The shared
+        parameter data dictionaries, their value lists, and their value
+        objects are made read-only, so that changing them raises an error
+        instead of changing the parameter values of both objects.  The
+        data of a shared parameter are copied by the object that adjusts
+        the parameter first (see the _own_param_data method), so each
+        object uses memory only for the parameters it adjusts.
+        """
+        # pylint: disable=protected-access,attribute-defined-outside-init
+        # pylint: disable=too-many-branches
+        data = other._data
+        for param, pdata in list(data.items()):
+            if not isinstance(pdata, _ReadOnlyDict):
+                data[param] = _read_only_param_data(pdata)
+                other.sel._cache.pop(param, None)
+        for attr, value in other.__dict__.items():
+            if attr in ('defaults', '_defaults_schema', 'label_validators',
+                        'keyfuncs'):
+                pass  # these are never changed
+            elif attr in data:
+                if (
+                    not isinstance(value, np.ndarray) or
+                    value.flags.writeable
+                ):
+                    value = copy.deepcopy(value, memo)
+            elif attr == '_data':
+                value = dict(data)
+            elif attr == '_validator_schema':
+                value = type(value)()
+                value.pt_context['spec'] = self
+            elif attr == 'sel':
+                sel = ParameterSlice(self)
+                sel._cache.update(value._cache)
+                sel._key_cache.update(value._key_cache)
+                value = sel
+            elif attr in ('_array_cache', '_year_states'):
+                continue  # set below
+            elif attr == '_year_values':
+                value = None
+            else:
+                value = copy.deepcopy(value, memo)
+            setattr(self, attr, value)
+        if other._array_cache is not None and other._array_cache[0] is data:
+            self._array_cache = (self._data, dict(other._array_cache[1]))
+        if other._year_states is not None and other._year_states[0] is data:
+            # the precomputed year states are added to by each object
+            arrays, states = other._year_states[1:]
+            self._year_states = (self._data, arrays, dict(states))
+
+    def _own_param_data(self, param):
+        """
+        Return the data dictionary of param after copying it, if it is
+        shared with other objects, so that it can be changed.
+        """
+        data = self._data[param]
+        if isinstance(data, _ReadOnlyDict):
+            data = dict(data)
+            data['value'] = [dict(vo) for vo in data['value']]
+            self._data[param] = data
+            self.sel._cache.pop(param, None)  # pylint: disable=W0212
+        return data
 
     def adjust(  # pylint: disable=arguments-differ
             # pylint warning W0221 is:
             #   Number of parameters was 6 in 'Parameters.adjust' and
             #   is now 5 in overriding 'Parameters.adjust' method
             self, params_or_path,
-            print_warnings=True, raise_errors=True, **kwargs
+            print_warnings=True, raise_errors=True, validate=True, **kwargs
     ):
         """
         Update parameter values using a ParamTools styled adjustment.
@@ -155,6 +337,13 @@ class Parameters(paramtools.Parameters):
         raise_errors: Boolean
             Raise errors as a ValidationError. If False, they will be stored
             in the errors attribute.
+        validate: Boolean
+            Validate the adjustment or not.  If False, the adjustment is
+            trusted to be valid (for example, because it has been checked
+            by the Policy.validate_reforms method), so the parameter values
+            are deserialized and indexed without any range or related
+            parameter validation and without a transaction that restores
+            the original values when the adjustment is not valid.
 
 
         Returns
@@ -163,6 +352,22 @@ class Parameters(paramtools.Parameters):
             Parsed paremeter dictionary
 
         """
+        if not validate:
+            self._warnings = {}
+            self._errors = {}
+            # select values from the current value lists rather than from
+            # selections cached before their order changed, so that trusted
+            # and validated adjustments order the value lists in the same way
+            self.sel._cache.clear()  # pylint: disable=protected-access
+            kwargs['ignore_warnings'] = True
+            validator_schema = self._validator_schema
+            self._validator_schema = _TrustedValidatorSchema(validator_schema)
+            try:
+                return self.adjust_with_indexing(
+                    params_or_path, raise_errors=True, **kwargs
+                )
+            finally:
+                self._validator_schema = validator_schema
         if print_warnings:
             _data = copy.deepcopy(self._data)
             kwargs['ignore_warnings'] = False
@@ -183,6 +388,9 @@ class Parameters(paramtools.Parameters):
                     params_or_path, raise_errors=True, **kwargs
                 )
         except paramtools.ValidationError as ve:
+            # the transaction restored a copy of the parameter data, so the
+            # cached selections of the replaced value objects are dropped
+            self.sel._cache.clear()  # pylint: disable=protected-access
             if self.errors and raise_errors:
                 raise ve
             if self.errors and not raise_errors:
@@ -194,6 +402,7 @@ class Parameters(paramtools.Parameters):
             # pylint: disable=possibly-used-before-assignment
             self._data = _data
             # pylint: enable=possibly-used-before-assignment
+            self.sel._cache.clear()  # pylint: disable=protected-access
             _warnings = copy.deepcopy(self._warnings)
             self._warnings = {}
             self._errors = {}
@@ -462,7 +671,9 @@ class Parameters(paramtools.Parameters):
                         )
 
                     # 2.c Set indexed status.
-                    self._data[base_param]['indexed'] = indexed_val
+                    self._own_param_data(base_param)['indexed'] = (
+                        indexed_val
+                    )
 
                     # 2.d Adjust with values greater than or equal to current
                     # year in params
@@ -557,7 +768,7 @@ class Parameters(paramtools.Parameters):
             )
         return None  # pragma: no cover
 
-    def _update(self, revision, print_warnings, raise_errors):
+    def _update(self, revision, print_warnings, raise_errors, validate=True):
         """
         A translation layer on top of ``adjust``. Projects
         that have historically used the ``_update`` method with
@@ -672,13 +883,110 @@ class Parameters(paramtools.Parameters):
         return self.adjust(
             new_params,
             print_warnings=print_warnings,
-            raise_errors=raise_errors
+            raise_errors=raise_errors,
+            validate=validate
         )
 
     def set_year(self, year):
         """Specify parameter year"""
         self.set_state(year=year)
 
+    @property
+    def year_values(self):
+        """
+        Dictionary containing the value of each parameter in the current
+        year, which is a scalar for a scalar parameter or a one-dimensional
+        array for a vector (for example, MARS-indexed) parameter.  This is
+        the value that is passed to the calc-style functions in the
+        calcfunctions.py module, so reading it is faster than indexing the
+        parameter attribute.  The dictionary is built when it is first used
+        after the parameter state (for example, the year) changes.
+        """
+        if self._year_values is None:
+            self._year_values = {
+                name: getattr(self, name)[0] for name in self._data
+            }
+        return self._year_values
+
+    def _set_state(self, params=None, **labels):
+        """
+        Set the parameter attributes for the specified state, which makes
+        the year_values dictionary out of date.  When only the values of
+        the specified params have changed, only their attributes are set.
+        When the state is a single year, the attributes and the year_values
+        dictionary are taken from the precomputed state of that year.
+        """
+        # pylint: disable=protected-access
+        if params is not None:
+            for name in params:
+                self.sel._cache.pop(name, None)
+                if self._array_cache is not None:
+                    self._array_cache[1].pop(f'_{name}', None)
+            self._year_states = None
+        if not labels:
+            # values may have changed only if the parameter data and the
+            # all-years arrays derived from them are still the same objects
+            valid = (
+                self._array_cache is not None and
+                self._array_cache[0] is self._data
+            )
+            if valid and 'year' in self._state:
+                self._year_states = None
+                if self._set_year_state(self._state['year']):
+                    return
+        elif set(labels) == {'year'}:
+            if self._set_year_state(labels['year']):
+                return
+        if params is None or labels or not self.array_first:
+            super()._set_state(params=params, **labels)
+        else:
+            for name in params:
+                setattr(self, name, self.to_array(name))
+        self._year_values = None
+        # all-years arrays do not depend on the year state
+        if params is None and set(labels) != {'year'}:
+            self._array_cache = None
+            self._year_states = None
+
+    def _set_year_state(self, year):
+        """
+        Set the year state, the parameter attributes, and the year_values
+        dictionary to those in the precomputed state of the specified year
+        and return True, or return False if the state of that year cannot
+        be precomputed.  The state of a year is precomputed, by slicing the
+        all-years array of each parameter, the first time the year is set
+        after the parameter values change.  The precomputed attribute
+        arrays are read-only and are not changed afterwards.
+        """
+        if not self.array_first or set(self._state) - {'year'}:
+            return False
+        years = self.parse_labels(year=year)['year']
+        if len(years) != 1:
+            return False
+        if self._year_states is None or self._year_states[0] is not self._data:
+            arrays = {name: getattr(self, f'_{name}') for name in self._data}
+            for array in arrays.values():
+                if np.ndim(array) == 0 or array.shape[0] != self.num_years:
+                    arrays = None
+                    break
+            self._year_states = (self._data, arrays, {})
+        _, arrays, states = self._year_states
+        year_grid = self._stateless_label_grid['year']
+        if arrays is None or years[0] not in year_grid:
+            return False
+        if years[0] not in states:
+            idx = years[0] - self.start_year
+            states[years[0]] = (
+                {name: array[idx:idx + 1] for name, array in arrays.items()},
+                {name: array[idx] for name, array in arrays.items()},
+            )
+        attrs, values = states[years[0]]
+        self._state['year'] = years
+        self.label_grid['year'] = years
+        self.__dict__.update(attrs)
+        self._year_values = dict(values)
+        return True
+
     @property
     def current_year(self):
         """Propery docstring"""
@@ -778,6 +1086,44 @@ class Parameters(paramtools.Parameters):
         """
         return self.specification(meta_data=True, use_state=False)
 
+    def specification(self, use_state=True, meta_data=False,
+                      include_empty=False, serializable=False,
+                      sort_values=False, **labels):
+        """
+        Query value(s) of all parameters along labels specified in
+        ``labels`` as is done by the paramtools specification method.
+        When ``meta_data`` is True, the documentation metadata of each
+        parameter (its title, description, notes, sections, and compatible
+        data), which are not kept with the parameter values, are included.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        spec = super().specification(
+            use_state=use_state, meta_data=meta_data,
+            include_empty=include_empty, serializable=serializable,
+            sort_values=sort_values, **labels
+        )
+        if meta_data:
+            docs = self._doc_metadata()
+            for param, data in spec.items():
+                if param in docs:
+                    spec[param] = dict(docs[param], **data)
+        return spec
+
+    def _doc_metadata(self):
+        """
+        Return dictionary containing the documentation metadata of each
+        parameter, which are read from the defaults file the first time
+        they are needed and then shared by all objects using that file.
+        """
+        path = self._defaults_path
+        if path is None:
+            return {}
+        if path not in _DOC_METADATA:
+            _DOC_METADATA[path] = _split_doc_metadata(
+                paramtools.read_json(path)
+            )
+        return _DOC_METADATA[path]
+
     @staticmethod
     def years_in_revision(revision):
         """
@@ -798,17 +1144,201 @@ class Parameters(paramtools.Parameters):
         """
         Get the value of a parameter over all years by accessing it
         with an underscore in front of its name: ``pol._EITC_c`` instead of
-        ``pol.EITC_c``.
+        ``pol.EITC_c``.  The returned array is a read-only view of an
+        array that is cached until the parameter values change.
         """
         if (
             attr.startswith('_') and
             attr[1:] in super().__getattribute__('_data')
         ):
-            return self.to_array(
-                attr[1:], year=list(range(self.start_year, self.end_year + 1))
-            )
+            # cache the all-years array of each parameter until the values
+            # of the parameter change (or the _data dictionary is replaced)
+            data = super().__getattribute__('_data')
+            if self._array_cache is None or self._array_cache[0] is not data:
+                self._array_cache = (data, {})
+            cache = self._array_cache[1]
+            if attr not in cache:
+                cache[attr] = self._all_years_array(attr[1:])
+                if isinstance(cache[attr], np.ndarray):
+                    cache[attr].flags.writeable = False
+            if not isinstance(cache[attr], np.ndarray):
+                return cache[attr]  # scalar of parameter without labels
+            array = cache[attr].view()
+            array.flags.writeable = False
+            return array
         raise AttributeError(f'{attr} is not defined')
 
+    def _all_years_array(self, param):
+        """
+        Return array containing the values of param in all years, which is
+        filled directly from the value objects of param when they contain
+        exactly one value for each combination of year and other label
+        values and which is otherwise constructed by the to_array method.
+        """
+        years = list(range(self.start_year, self.end_year + 1))
+        vos = self._data[param]['value']
+        if (
+            not vos or set(self._state) - {'year'} or
+            self._data[param].get('number_dims', 0)
+        ):
+            return self.to_array(param, year=years)
+        labels = vos[0].keys() - {'value', '_auto'}
+        # order labels in the same way as the to_array method does
+        grid = dict(self.label_grid, year=years)
+        order = [label for label in grid if label in labels]
+        if 'year' not in labels or len(order) != len(labels):
+            return self.to_array(param, year=years)
+        index = {label: {val: idx for idx, val in enumerate(grid[label])}
+                 for label in order}
+        shape = tuple(len(grid[label]) for label in order)
+        array = np.empty(shape, dtype=self._numpy_type(param))
+        filled = np.zeros(shape, dtype=bool)
+        num_filled = 0
+        for vo in vos:
+            if vo.keys() - {'value', '_auto'} != labels:
+                return self.to_array(param, year=years)
+            if vo['year'] not in index['year']:
+                continue
+            try:
+                idx = tuple(index[label][vo[label]] for label in order)
+            except KeyError:
+                return self.to_array(param, year=years)
+            array[idx] = vo['value']
+            filled[idx] = True
+            num_filled += 1
+        if num_filled != filled.size or not filled.all():
+            return self.to_array(param, year=years)
+        return array
+
+    def extend(self, label=None, label_values=None, params=None,
+               raise_errors=True, ignore_warnings=False):
+        """
+        Extend parameter values along label, which is done in bulk for
+        the year label: for each extended parameter, the values of all its
+        label combinations are indexed together one year at a time, which
+        produces exactly the same rounded values as calling extend_func for
+        each value object, and the extended value objects are appended to
+        the parameter values without searching for value objects to update.
+        Parameters whose values cannot be extended in bulk (for example,
+        those with no value in the first year to be extended) are extended
+        by the paramtools.Parameters.extend method.
+        """
+        # pylint: disable=too-many-arguments,too-many-positional-arguments
+        # pylint: disable=too-many-locals,arguments-renamed
+        if label is None:
+            label = self.label_to_extend
+        if label != 'year' or not self.uses_extend_func:
+            return super().extend(  # pragma: no cover
+                label=label, label_values=label_values, params=params,
+                raise_errors=raise_errors, ignore_warnings=ignore_warnings
+            )
+        full_grid = self._stateless_label_grid[label]
+        if label_values is None:
+            extend_grid = full_grid
+        else:
+            extend_grid = self.parse_labels(**{label: label_values})[label]
+        names = [param for param in self._data
+                 if params is None or param in params]
+        adjustment = defaultdict(list)
+        fallback = []
+        columns = []  # (param, seed value objects by year, missing years)
+        for param in names:
+            groups = _year_groups(self._data[param]['value'], extend_grid)
+            if groups is None:
+                fallback.append(param)
+                continue
+            indexed = self._data[param].get('indexed', False)
+            for by_year, missing in groups:
+                if indexed:
+                    columns.append((param, by_year, missing))
+                    continue
+                # values of unindexed parameters are carried forward
+                years = sorted(by_year)
+                for year in missing:
+                    seed = by_year[years[bisect.bisect(years, year) - 1]]
+                    adjustment[param].append(
+                        OrderedDict(dict(seed, year=year), _auto=True)
+                    )
+        if columns:
+            self._index_columns(columns, full_grid, adjustment)
+        parsed = {}
+        if fallback:
+            parsed.update(super().extend(
+                label=label, label_values=label_values, params=fallback,
+                raise_errors=raise_errors, ignore_warnings=ignore_warnings
+            ))
+        self._bulk_extension = True
+        try:
+            parsed.update(self._adjust(
+                adjustment, extend_adj=False, ignore_warnings=ignore_warnings,
+                raise_errors=raise_errors, deserialized=True
+            ))
+        finally:
+            self._bulk_extension = False
+        return parsed
+
+    def _index_columns(self, columns, full_grid, adjustment):
+        """
+        Append to adjustment the value objects for the missing years of
+        each (param, by_year, missing) column, where the value in each year
+        is the value in the prior year grown by the prior year's indexing
+        rate, which is returned by the get_index_rate method, and rounded
+        to the nearest cent, as in the extend_func method.
+        """
+        # pylint: disable=too-many-locals
+        num_years = len(full_grid)
+        num_cols = len(columns)
+        values = np.zeros((num_years, num_cols))
+        known = np.zeros((num_years, num_cols), dtype=bool)
+        for col, (param, by_year, _) in enumerate(columns):
+            for year, seed in by_year.items():
+                if year in full_grid:
+                    row = full_grid.index(year)
+                    values[row, col] = seed['value']
+                    known[row, col] = True
+        # indexing rate used to grow a value from year ix to year ix+1,
+        # which is the same for all the columns of a parameter
+        last_year = max(missing[-1] for _, _, missing in columns)
+        num_rates = full_grid.index(last_year)
+        rates = np.zeros((num_rates, num_cols))
+        param_rates = {}
+        for col, (param, _, _) in enumerate(columns):
+            if param not in param_rates:
+                param_rates[param] = [
+                    self.get_index_rate(param, full_grid[ix])
+                    for ix in range(num_rates)
+                ]
+            rates[:, col] = param_rates[param]
+        for row in range(1, num_rates + 1):
+            grown = values[row - 1] * (1 + rates[row - 1])
+            grown = np.where(grown < 9e99, np.round(grown, 2), 9e99)
+            values[row] = np.where(known[row], values[row], grown)
+        for col, (param, by_year, missing) in enumerate(columns):
+            years = sorted(by_year)
+            for year in missing:
+                seed = by_year[years[bisect.bisect(years, year) - 1]]
+                adjustment[param].append(OrderedDict(
+                    dict(seed, year=year),
+                    value=values[full_grid.index(year), col],
+                    _auto=True
+                ))
+
+    def _update_param(self, param, new_values):
+        """
+        Update the values of param with new_values, which are appended
+        when they are the bulk-extended value objects for years that have
+        no value objects.
+        """
+        self._own_param_data(param)
+        self._year_states = None
+        if self._array_cache is not None:
+            self._array_cache[1].pop(f'_{param}', None)
+        if not self._bulk_extension:
+            super()._update_param(param, new_values)
+            return
+        self._data[param]['value'].extend(new_values)
+        self.sel._cache.pop(param, None)  # pylint: disable=protected-access
+
     def extend_func(
         self,
         param: str,
@@ -887,6 +1417,235 @@ class Parameters(paramtools.Parameters):
         return extend_vo
 
 
+class _TrustedValidatorSchema():
+    """
+    Wrapper of a paramtools validator schema whose load method deserializes
+    parameter value objects in the same way as the wrapped schema does,
+    but without the range and related-parameter validation, which is what
+    takes almost all of the time of a parameter adjustment.  All other
+    attributes are those of the wrapped schema.
+    """
+
+    def __init__(self, schema):
+        self._schema = schema
+
+    def __getattr__(self, attr):
+        return getattr(self._schema, attr)
+
+    def load(self, data, ignore_warnings, deserialized=False):
+        """
+        Return deserialized data without validating them.
+        """
+        # pylint: disable=unused-argument
+        if deserialized:
+            return data
+        fields = self._schema.fields
+        return {param: fields[param].deserialize(vos)
+                for param, vos in data.items()}
+
+
+class _ReadOnlyDict(dict):
+    """
+    Dictionary that raises a TypeError when it is changed, which is used
+    for the parameter data shared by Parameters objects.  Copies of it
+    are ordinary dictionaries.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('shared parameter data cannot be changed')
+
+    __setitem__ = __delitem__ = __ior__ = _read_only
+    clear = pop = popitem = setdefault = update = _read_only
+
+    def __reduce__(self):
+        return (dict, (dict(self),))
+
+
+class _ReadOnlyList(list):
+    """
+    List that raises a TypeError when it is changed, which is used for the
+    value objects of the parameter data shared by Parameters objects.
+    Copies of it are ordinary lists.
+    """
+
+    def _read_only(self, *args, **kwargs):
+        raise TypeError('shared parameter data cannot be changed')
+
+    __setitem__ = __delitem__ = __iadd__ = __imul__ = _read_only
+    append = extend = insert = pop = remove = _read_only
+    clear = sort = reverse = _read_only
+
+    def __reduce__(self):
+        return (list, (list(self),))
+
+
+def _read_only_param_data(data):
+    """
+    Return read-only copy of the data dictionary of a parameter, whose
+    value list and value objects are also read-only.
+    """
+    vos = _ReadOnlyList()
+    list.extend(vos, (_read_only_dict(vo) for vo in data['value']))
+    return _read_only_dict(data, value=vos)
+
+
+def _read_only_dict(data, **items):
+    """
+    Return read-only copy of the data dictionary updated with items.
+    """
+    frozen = _ReadOnlyDict()
+    dict.update(frozen, data, **items)
+    return frozen
+
+
+def _year_groups(vos, extend_grid):
+    """
+    Return list of (by_year, missing) pairs, one for each combination of
+    the values of the labels other than year in the vos value objects
+    that has missing years, where by_year is a dictionary containing the
+    value object for each year and missing is the sorted list of the
+    extend_grid years after the first year that have no value object.
+    Return None if the value objects cannot be extended in bulk.
+    """
+    if not any('year' in vo for vo in vos):
+        return []
+    groups = {}
+    for vo in vos:
+        if 'year' not in vo or isinstance(vo['value'], (list, dict)):
+            return None
+        key = tuple(sorted(
+            (lbl, val) for lbl, val in vo.items()
+            if lbl not in ('value', 'year', '_auto')
+        ))
+        by_year = groups.setdefault(key, {})
+        if vo['year'] in by_year:
+            return None
+        by_year[vo['year']] = vo
+    if len({tuple(lbl for lbl, _ in key) for key in groups}) > 1:
+        return None
+    pairs = []
+    for by_year in groups.values():
+        missing = [year for year in extend_grid if year not in by_year]
+        if not missing:
+            continue
+        if missing[0] < min(by_year):
+            return None
+        pairs.append((by_year, missing))
+    return pairs
+
+
+def _split_doc_metadata(params):
+    """
+    Remove the documentation metadata, which are not needed to compute
+    parameter values, from each parameter in the params dictionary and
+    return a dictionary containing the removed metadata of each parameter.
+    """
+    docs = {}
+    for name, data in params.items():
+        if name == 'schema':
+            continue
+        docs[name] = {field: data.pop(field)
+                      for field in DOC_METADATA_FIELDS if field in data}
+    return docs
+
+
+def _snapshot_file_path(key):
+    """
+    Return path to the parameters snapshot file identified by key, or
+    None if key is None or if snapshots are not enabled.  Snapshots are
+    used only when the TAXCALC_SNAPSHOT_DIR environment variable specifies
+    the directory in which they are stored, and only with the
+    paramtools version whose constructor is reproduced by the
+    Parameters._init_from_snapshot method.
+    """
+    if key is None or paramtools.__version__ != SNAPSHOT_PARAMTOOLS_VERSION:
+        return None
+    snapshot_dir = _cache_directory('TAXCALC_SNAPSHOT_DIR')
+    if snapshot_dir is None:
+        return None
+    return os.path.join(snapshot_dir, f'{key}.pkl')
+
+
+def _read_snapshot(path):
+    """
+    Return dictionary read from the snapshot file at path, which contains
+    the defaults needed for computation (under the defaults key) and the
+    extended parameter data (under the data key), or None if path is None
+    or if the snapshot file cannot be read.
+    """
+    if path is None:
+        return None
+    try:
+        with open(path, 'rb') as sfile:
+            data = pickle.load(sfile)
+    except (OSError, EOFError, pickle.UnpicklingError,
+            AttributeError, ImportError, IndexError):
+        return None
+    if not isinstance(data, dict) or set(data) != {'defaults', 'data'}:
+        return None
+    return data
+
+
+def _write_snapshot(path, data):
+    """
+    Write the defaults and parameter data in the data dictionary to the
+    snapshot file at path, doing nothing if path is None or if the
+    snapshot file cannot be written.
+    """
+    if path is None:
+        return
+    tmppath = None
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # write to temporary file and then rename it so that concurrent
+        # readers never see a partially written snapshot file
+        fd, tmppath = tempfile.mkstemp(suffix='.tmp',
+                                       dir=os.path.dirname(path))
+        with os.fdopen(fd, 'wb') as tmpfile:
+            pickle.dump(data, tmpfile, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmppath, path)
+    except OSError:  # pragma: no cover
+        if tmppath is not None and os.path.isfile(tmppath):
+            os.remove(tmppath)
+
+
+def _unloaded_schemas(factory, key=None):
+    """
+    Return (defaults_schema, validator_schema) pair constructed from the
+    specified paramtools SchemaFactory object in the same way as they are
+    constructed by its schemas method, but without deserializing the
+    defaults, which is what takes almost all of that method's time.
+    The schema classes are created once for each snapshot key.
+    """
+    if key is not None and key in _SCHEMA_CLASSES:
+        defaults_cls, validator_cls = _SCHEMA_CLASSES[key]
+        return defaults_cls(), validator_cls()
+    param_dict = {}
+    validator_dict = {}
+    for name, data in factory.defaults.items():
+        classattrs = {
+            'value': get_type(data),
+            '_auto': marshmallow.fields.Boolean(required=False,
+                                                load_only=True),
+            **factory.label_validators,
+        }
+        validator_dict[name] = type('ValidatorItem', (marshmallow.Schema,),
+                                    classattrs)
+        classattrs = {'value': ValueObject(validator_dict[name], many=True)}
+        param_dict[name] = type('IndividualParamSchema',
+                                (factory.BaseParamSchema,), classattrs)
+    classattrs = {name: marshmallow.fields.Nested(schema)
+                  for name, schema in param_dict.items()}
+    defaults_cls = type('DefaultsSchema', (marshmallow.Schema,), classattrs)
+    classattrs = {name: ValueObject(schema, many=True)
+                  for name, schema in validator_dict.items()}
+    validator_cls = type('ValidatorSchema', (BaseValidatorSchema,),
+                         classattrs)
+    if key is not None:
+        _SCHEMA_CLASSES[key] = (defaults_cls, validator_cls)
+    return defaults_cls(), validator_cls()
+
+
 TaxcalcReform = Union[str, Mapping[int, Any]]
 ParamToolsAdjustment = Union[str, List[paramtools.ValueObject]]
 
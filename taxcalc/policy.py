@@ -6,7 +6,11 @@ Tax-Calculator federal tax policy Policy class.
 # pylint --disable=locally-disabled policy.py
 
 import os
+import copy
 import json
+import hashlib
+import inspect
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 import paramtools
 from taxcalc.parameters import Parameters
@@ -105,6 +109,36 @@ class Policy(Parameters):
                         Policy.REDEFINED_PARAMS,
                         Policy.WAGE_INDEXED_PARAMS, **kwargs)
 
+    def _snapshot_key(self, last_budget_year):
+        """
+        Return string that identifies the contents of the policy defaults
+        file, the indexing rates in the GrowFactors object, the years
+        through which parameter values are extended, and the source code
+        of the classes that construct and extend the parameter values,
+        which together with the Tax-Calculator and ParamTools versions
+        determine the values of a newly constructed Policy object.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from taxcalc import __version__
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(
+            f'{type(self).__name__}|{__version__}|{paramtools.__version__}|'
+            f'{last_budget_year}|{Policy.LAST_KNOWN_YEAR}|'.encode('utf-8')
+        )
+        path = os.path.join(Policy.DEFAULTS_FILE_PATH,
+                            Policy.DEFAULTS_FILE_NAME)
+        paths = [path] + sorted({
+            inspect.getfile(cls) for cls in type(self).__mro__
+            if issubclass(cls, Parameters)
+        })
+        for path in paths:
+            with open(path, 'rb') as pfile:
+                hasher.update(pfile.read())
+        rates = self._gfactors.gfdf[['ACPIU', 'AWAGE']]
+        hasher.update(rates.index.to_numpy().tobytes())
+        hasher.update(rates.to_numpy().tobytes())
+        return hasher.hexdigest()
+
     @staticmethod
     def tmd_constructor(
             growfactors: Path | GrowFactors,
@@ -132,10 +166,50 @@ class Policy(Parameters):
         """
         return Parameters._read_json_revision(obj, 'policy')
 
+    @staticmethod
+    def validate_reforms(reforms, num_workers=1):
+        """
+        Static method returns a list containing, for each Tax-Calculator-style
+        reform dictionary in the specified reforms list, a dictionary of the
+        errors found when the reform is implemented in a current-law Policy
+        object, which is empty when the reform is valid.  Identical reforms
+        are validated only once, and the reforms are divided among
+        num_workers processes when num_workers is greater than one.
+        Reforms without errors can then be implemented repeatedly with the
+        much faster implement_reform(reform, validate=False) call.
+        """
+        if not isinstance(reforms, list):
+            raise ValueError('reforms is not a list')
+        if not isinstance(num_workers, int) or num_workers < 1:
+            raise ValueError('num_workers is not a positive integer')
+        unique = {}
+        for reform in reforms:
+            unique.setdefault(_reform_key(reform), reform)
+        keys = list(unique)
+        num_workers = min(num_workers, len(keys))
+        if num_workers > 1:
+            size = -(-len(keys) // num_workers)  # ceiling division
+            chunks = [[unique[key] for key in keys[idx:idx + size]]
+                      for idx in range(0, len(keys), size)]
+            with ProcessPoolExecutor(max_workers=num_workers) as executor:
+                errors = [errs for chunk_errors in
+                          executor.map(_reform_errors, chunks)
+                          for errs in chunk_errors]
+        else:
+            errors = _reform_errors([unique[key] for key in keys])
+        errors_by_key = dict(zip(keys, errors))
+        return [copy.deepcopy(errors_by_key[_reform_key(reform)])
+                for reform in reforms]
+
     def implement_reform(self, reform: dict,
-                         print_warnings=True, raise_errors=True):
+                         print_warnings=True, raise_errors=True,
+                         validate=True):
         """
         Implement reform using a Tax-Calculator-style reform dictionary.
+        When validate is False, the reform is trusted to be valid (for
+        example, because the validate_reforms method found no errors in
+        it), so the parameter values are indexed but not validated, which
+        makes the reform much faster to implement.
         """
         if not isinstance(reform, dict):
             raise paramtools.ValidationError(
@@ -160,7 +234,57 @@ class Policy(Parameters):
                     'if you think this removal should not happen, open an\n'
                     'issue on GitHub to make your case for non-removal.'
                 )
-        return self._update(reform, print_warnings, raise_errors)
+        return self._update(reform, print_warnings, raise_errors, validate)
+
+    def implement_reforms(self, reforms: list,
+                          print_warnings=True, raise_errors=True,
+                          validate=True):
+        """
+        Implement the Tax-Calculator-style reform dictionaries in the
+        specified reforms list, which has the same effect as calling the
+        implement_reform method for each reform in the order of the list,
+        so that later reforms override earlier ones.  Consecutive reforms
+        are merged into one reform, which is implemented with one parameter
+        adjustment, whenever the merged reform is known to have the same
+        effect as the consecutive reforms (see the merge_reforms method).
+        Because a merged reform is validated as a whole, the errors and
+        warnings for a list that contains invalid reforms may differ from
+        those raised by implementing the reforms one at a time.
+        """
+        if not isinstance(reforms, list):
+            raise ValueError('reforms is not a list')
+        for reform in self.merge_reforms(reforms):
+            self.implement_reform(reform, print_warnings=print_warnings,
+                                  raise_errors=raise_errors,
+                                  validate=validate)
+
+    def merge_reforms(self, reforms: list):
+        """
+        Return list of reform dictionaries whose implementation, in order,
+        has the same effect on this Policy object as implementing the
+        reform dictionaries in the specified reforms list, in order.
+        A reform is merged into the preceding merged reform by letting its
+        values for a parameter replace the values of the preceding reforms
+        in the same and later years, which is what implementing it after
+        them does.  A parameter whose indexed status is changed by a reform
+        also loses the values of the preceding reforms for years after the
+        first year in which the indexed status is changed.  Reforms are not
+        merged when that does not have the same effect, which is the case
+        when a reform changes parameter_indexing_CPI_offset (which changes
+        the indexing of all parameters), when the indexed status of a
+        parameter is changed by two reforms, or when a parameter is changed
+        by a reform after its indexed status is changed by an earlier one.
+        """
+        merged = []
+        for reform in reforms:
+            combined = None
+            if merged:
+                combined = self._merged_reform(merged[-1], reform)
+            if combined is None:
+                merged.append(copy.deepcopy(reform))
+            else:
+                merged[-1] = combined
+        return merged
 
     @staticmethod
     def parameter_list():
@@ -175,6 +299,68 @@ class Policy(Parameters):
             defaults = json.loads(f.read())  # pylint: disable=protected-access
         return [k for k in defaults if k != "schema"]
 
+    def _merged_reform(self, first, second):
+        """
+        Return reform dictionary that has the same effect as implementing
+        the first and then the second reform dictionary, or None if the
+        two reforms cannot be merged (see the merge_reforms method).
+        """
+        cuts = self._merge_cuts(first, second)
+        if cuts is None:
+            return None
+        merged = copy.deepcopy(first)
+        for param, cut in cuts.items():
+            if param not in merged:
+                continue
+            try:
+                merged[param] = {
+                    year: val for year, val in merged[param].items()
+                    if cut is not None and int(year) < cut
+                }
+            except (TypeError, ValueError):
+                return None
+        for param, values in second.items():
+            merged.setdefault(param, {}).update(copy.deepcopy(values))
+        return merged
+
+    def _merge_cuts(self, first, second):
+        """
+        Return dictionary whose keys are the names of the parameters whose
+        values in the first reform dictionary are replaced by the second
+        reform dictionary and whose values are the first year whose values
+        are replaced (None when all values are replaced), or None if the
+        two reforms cannot be merged.
+        """
+        cpi_offset = 'parameter_indexing_CPI_offset'
+        if (
+            not isinstance(first, dict) or not isinstance(second, dict) or
+            not all(isinstance(values, dict) for values in first.values()) or
+            cpi_offset in first or cpi_offset in second
+        ):
+            return None
+        cuts = {}
+        for param, values in second.items():
+            if not isinstance(param, str) or not isinstance(values, dict):
+                return None
+            try:
+                years = [int(year) for year in values]
+            except (TypeError, ValueError):
+                return None
+            if not years:
+                continue
+            if param.endswith('-indexed'):
+                if param in first:
+                    return None
+                # values after the first indexed status change are removed
+                cuts[param.split('-indexed')[0]] = min(years) + 1
+            elif f'{param}-indexed' in first:
+                return None
+            elif self._data.get(param, {}).get('type') == 'str':
+                cuts[param] = None
+            else:
+                cuts[param] = min(years)
+        return cuts
+
     def set_rates(self):
         """
         Initialize policy parameter indexing rates.
@@ -193,3 +379,34 @@ class Policy(Parameters):
         self._wage_growth_rates = self._gfactors.wage_growth_rates(
             syr, self.end_year
         )
+
+
+def _reform_key(reform):
+    """
+    Return string that is the same for reform dictionaries that are equal,
+    whose dictionary keys are converted to strings so that reforms with
+    both integer and string year keys can be dumped with sorted keys.
+    """
+    def str_keys(obj):
+        if isinstance(obj, dict):
+            return {str(key): str_keys(val) for key, val in obj.items()}
+        return obj
+    return json.dumps(str_keys(reform), sort_keys=True, default=str)
+
+
+def _reform_errors(reforms):
+    """
+    Return list containing the dictionary of errors found when each reform
+    in the reforms list is implemented in a current-law Policy object.
+    """
+    base = Policy()
+    errors = []
+    for reform in reforms:
+        pol = copy.deepcopy(base)
+        try:
+            pol.implement_reform(reform, print_warnings=False,
+                                 raise_errors=False)
+            errors.append(dict(pol.parameter_errors))
+        except paramtools.ValidationError as valerr:
+            errors.append(dict(valerr.messages.get('errors', {})))
+    return errors
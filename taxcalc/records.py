@@ -24,7 +24,11 @@ class Records(Data):
     Parameters
     ----------
     data: string or Pandas DataFrame
-        string describes CSV file in which records data reside;
+        string describes CSV file in which records data reside or
+        directory containing columnar store written by the write_columns
+        method, whose columns are read from memory-mapped files and copied
+        into the values of the read variables (so a scratch_dir must also
+        be specified to avoid holding all the records data in memory);
         DataFrame already contains records data;
         default value is the string 'puf.csv'
         NOTE: when using custom data, set this argument to a DataFrame.
@@ -76,6 +80,15 @@ class Records(Data):
         while TMD input data generated in the tax-microdata repository
         use a 1.0 weights_scale value.
 
+    scratch_dir: None or string
+        None keeps the values of all variables in memory;
+        string describes directory in which the values of all variables
+        (and copies of them) are kept in memory-mapped temporary files,
+        which allows the records data to be larger than the available
+        memory (when the data are read from a columnar store, as the data
+        are read from a CSV file or a DataFrame in memory);
+        default value is None.
+
     Raises
     ------
     ValueError:
@@ -135,12 +148,14 @@ class Records(Data):
                  weights=PUF_WEIGHTS_FILENAME,
                  adjust_ratios=PUF_RATIOS_FILENAME,
                  exact_calculations=False,
-                 weights_scale=0.01):
+                 weights_scale=0.01,
+                 scratch_dir=None):
         # pylint: disable=too-many-positional-arguments
         # pylint: disable=no-member,too-many-branches
         if isinstance(weights, str):
             weights = os.path.join(Records.CODE_PATH, weights)
-        super().__init__(data, start_year, gfactors, weights, weights_scale)
+        super().__init__(data, start_year, gfactors, weights, weights_scale,
+                         scratch_dir)
         if data is None:
             return  # because there are no data
         # read adjustment ratios
@@ -238,6 +253,7 @@ class Records(Data):
             weights_path: Path,
             growfactors: Path | GrowFactors,
             exact_calculations=False,
+            scratch_dir=None,
     ):  # pragma: no cover
         """
         Static method returns a Records object instantiated with TMD
@@ -247,7 +263,10 @@ class Records(Data):
         specify all the details of the TMD input data just as the
         default values of the arguments of the Records class constructor
         eliminate the need to specify all the details of the PUF input
-        data.
+        data.  The data_path can be the directory of a columnar store
+        written by the write_columns method, which can be used together
+        with a scratch_dir (see Records constructor) when the TMD input
+        data are larger than the available memory.
         """
         assert isinstance(data_path, Path)
         assert isinstance(weights_path, Path)
@@ -256,13 +275,14 @@ class Records(Data):
         else:
             assert isinstance(growfactors, GrowFactors)
         return Records(
-            data=pd.read_csv(data_path),
+            data=str(data_path),
             start_year=Records.TMDCSV_YEAR,
-            weights=pd.read_csv(weights_path),
+            weights=str(weights_path),
             gfactors=growfactors,
             adjust_ratios=None,
             exact_calculations=exact_calculations,
             weights_scale=1.0,
+            scratch_dir=scratch_dir,
         )
 
     def increment_year(self):
@@ -293,102 +313,21 @@ class Records(Data):
         """
         Apply to variables the grow factor values for specified calendar year.
         """
-        # pylint: disable=too-many-statements,no-member
-        # put values in local dictionary
-        gfv = {}
-        for name in GrowFactors.VALID_NAMES:
-            gfv[name] = self.gfactors.factor_value(name, year)
-        # apply values to Records variables
-        self.PT_binc_w2_wages *= gfv['AWAGE']
-        self.e00200 *= gfv['AWAGE']
-        self.e00200p *= gfv['AWAGE']
-        self.e00200s *= gfv['AWAGE']
-        self.pencon_p *= gfv['AWAGE']
-        self.pencon_s *= gfv['AWAGE']
-        self.e00300 *= gfv['AINTS']
-        self.e00400 *= gfv['AINTS']
-        self.e00600 *= gfv['ADIVS']
-        self.e00650 *= gfv['ADIVS']
-        self.e00700 *= gfv['ATXPY']
-        self.e00800 *= gfv['ATXPY']
-        self.e00900s[:] = np.where(self.e00900s >= 0,
-                                   self.e00900s * gfv['ASCHCI'],
-                                   self.e00900s * gfv['ASCHCL'])
-        self.e00900p[:] = np.where(self.e00900p >= 0,
-                                   self.e00900p * gfv['ASCHCI'],
-                                   self.e00900p * gfv['ASCHCL'])
+        # pylint: disable=no-member
+        # apply the growfactor of each variable in the VARINFO file
+        super()._extrapolate(year)
+        # the total of the taxpayer and spouse amounts has no growfactor
         self.e00900[:] = self.e00900p + self.e00900s
-        self.e01100 *= gfv['ACGNS']
-        self.e01200 *= gfv['ACGNS']
-        self.e01400 *= gfv['ATXPY']
-        self.e01500 *= gfv['ATXPY']
-        self.e01700 *= gfv['ATXPY']
-        self.e02000[:] = np.where(self.e02000 >= 0,
-                                  self.e02000 * gfv['ASCHEI'],
-                                  self.e02000 * gfv['ASCHEL'])
-        self.e02100 *= gfv['ASCHF']
-        self.e02100p *= gfv['ASCHF']
-        self.e02100s *= gfv['ASCHF']
-        self.e02300 *= gfv['AUCOMP']
-        self.e02400 *= gfv['ASOCSEC']
-        self.e03150 *= gfv['ATXPY']
-        self.e03210 *= gfv['ATXPY']
-        self.e03220 *= gfv['ATXPY']
-        self.e03230 *= gfv['ATXPY']
-        self.e03270 *= gfv['ACPIM']
-        self.e03240 *= gfv['ATXPY']
-        self.e03290 *= gfv['ACPIM']
-        self.e03300 *= gfv['ATXPY']
-        self.e03400 *= gfv['ATXPY']
-        self.e03500 *= gfv['ATXPY']
-        self.e07240 *= gfv['ATXPY']
-        self.e07260 *= gfv['ATXPY']
-        self.e07300 *= gfv['ABOOK']
-        self.e07400 *= gfv['ABOOK']
-        self.p08000 *= gfv['ATXPY']
-        self.e09700 *= gfv['ATXPY']
-        self.e09800 *= gfv['ATXPY']
-        self.e09900 *= gfv['ATXPY']
-        self.e11200 *= gfv['ATXPY']
-        # ITEMIZED DEDUCTIONS
-        self.e17500 *= gfv['ACPIM']
-        self.e18400 *= gfv['ATXPY']
-        self.e18500 *= gfv['ATXPY']
-        self.e19200 *= gfv['AIPD']
-        self.e19800 *= gfv['ATXPY']
-        self.e20100 *= gfv['ATXPY']
-        self.e20400 *= gfv['ATXPY']
-        self.g20500 *= gfv['ATXPY']
-        # CAPITAL GAINS
-        self.p22250 *= gfv['ACGNS']
-        self.p23250 *= gfv['ACGNS']
-        self.e24515 *= gfv['ACGNS']
-        self.e24518 *= gfv['ACGNS']
-        # SCHEDULE E
-        self.e26270 *= gfv['ASCHEI']
-        self.e27200 *= gfv['ASCHEI']
-        self.k1bx14p *= gfv['ASCHEI']
-        self.k1bx14s *= gfv['ASCHEI']
-        # MISCELLANOUS SCHEDULES
-        self.e07600 *= gfv['ATXPY']
-        self.e32800 *= gfv['ATXPY']
-        self.e58990 *= gfv['ATXPY']
-        self.e62900 *= gfv['ATXPY']
-        self.e87530 *= gfv['ATXPY']
-        self.e87521 *= gfv['ATXPY']
-        self.cmbtp *= gfv['ATXPY']
-        # BENEFITS
-        self.other_ben *= gfv['ABENOTHER']
-        self.mcare_ben *= gfv['ABENMCARE']
-        self.mcaid_ben *= gfv['ABENMCAID']
-        self.ssi_ben *= gfv['ABENSSI']
-        self.snap_ben *= gfv['ABENSNAP']
-        self.wic_ben *= gfv['ABENWIC']
-        self.housing_ben *= gfv['ABENHOUSING']
-        self.tanf_ben *= gfv['ABENTANF']
-        self.vet_ben *= gfv['ABENVET']
-        # remove local dictionary
-        del gfv
+
+    def _input_key_values(self):
+        """
+        Return list of arrays whose values are included in the input_key
+        string, which are the exact flags and the adjustment ratios.
+        """
+        # pylint: disable=no-member
+        ratios = self._adj_ratios
+        return [self.exact, np.array(list(self._adj_cols), dtype=str),
+                np.zeros(0) if ratios is None else ratios]
 
     def _adjust(self, year):
         """
@@ -398,7 +337,8 @@ class Records(Data):
         # pylint: disable=no-member
         if self.ADJ.size > 0:
             # Interest income
-            self.e00300 *= self.ADJ[f'INT{year}'].iloc[self.agi_bin].values
+            col = self._adj_cols[f'INT{year}']
+            self.e00300 *= self._adj_ratios[self.agi_bin, col]
 
     def _read_ratios(self, ratios):
         """
@@ -408,6 +348,8 @@ class Records(Data):
         """
         if ratios is None:
             setattr(self, 'ADJ', pd.DataFrame({'nothing': []}))
+            self._adj_cols = {}
+            self._adj_ratios = None
             return
         if isinstance(ratios, pd.DataFrame):
             assert 'INT2013' in ratios.columns  # check for transposed
@@ -431,3 +373,6 @@ class Records(Data):
         self.ADJ = pd.DataFrame()
         setattr(self, 'ADJ', ADJ.astype(np.float32))
         del ADJ
+        # ratio matrix indexed by agi_bin position and year column
+        self._adj_cols = {name: col for col, name in enumerate(self.ADJ)}
+        self._adj_ratios = self.ADJ.to_numpy()
@@ -0,0 +1,209 @@
+"""
+Tax-Calculator ReformDelta class that applies a compiled policy reform.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle reformdelta.py
+# pylint --disable=locally-disabled reformdelta.py
+#
+# pylint: disable=protected-access
+
+import copy
+from taxcalc.policy import Policy
+
+
+class ReformDelta():
+    """
+    Constructor for the ReformDelta class, which compiles a policy reform
+    into the changes it makes to the parameter values of a base Policy
+    object, so that the reform can be applied to other Policy objects
+    without repeating the validation and indexing done by the
+    Policy.implement_reform method.
+
+    The reform is compiled by implementing it once in a copy of the base
+    Policy object and recording, for each parameter whose values change,
+    its values in all years after the reform, which include the values of
+    later years that change because of indexing (for example, when the
+    reform changes the indexing status of a parameter or the
+    parameter_indexing_CPI_offset parameter).  The changed parameters and
+    years are available as the changes property.
+
+    The apply method copies the recorded values into a Policy object whose
+    parameter values and indexing rates are the same as those of the base
+    Policy object, which is the case for a newly constructed Policy object
+    (when the base is the current-law policy) or for a Policy object to
+    which the same reforms have been applied as to the base.  The current
+    year of the Policy object does not matter.  Otherwise (for example,
+    when another reform has been applied to the Policy object), the apply
+    method calls the implement_reform method, so applying a ReformDelta
+    object always has the same effect as implementing its reform, but
+    costs as much as implementing it.  The number of applications that
+    copied the recorded values and the number that called the
+    implement_reform method are counted by the applied and fallbacks
+    attributes, so callers can see whether the Policy objects they apply
+    the reform to match the base.  Deltas are stacked by compiling the
+    second reform with a base to which the first reform has been applied.
+
+    Parameters
+    ----------
+    reform: dictionary
+        Tax-Calculator-style reform dictionary, which is what is passed to
+        the Policy.implement_reform method.
+
+    policy: None or Policy class instance
+        base Policy object, which is not changed;
+        None implies a newly constructed current-law Policy object.
+
+    print_warnings: boolean
+        passed to the implement_reform method when compiling the reform.
+
+    raise_errors: boolean
+        passed to the implement_reform method when compiling the reform.
+
+    Raises
+    ------
+    ValueError:
+        if policy is not None or a Policy class instance.
+    paramtools.ValidationError:
+        if the reform is not valid and raise_errors is True.
+
+    Returns
+    -------
+    class instance: ReformDelta
+
+    Notes
+    -----
+    A reform can be applied to many Policy objects as follows:
+         delta = ReformDelta(reform)
+         for ...:
+             pol = Policy()
+             delta.apply(pol)
+             calc = Calculator(policy=pol, records=rec)
+    """
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, reform, policy=None,
+                 print_warnings=True, raise_errors=True):
+        if policy is None:
+            base = Policy()
+        elif isinstance(policy, Policy):
+            base = copy.deepcopy(policy)
+        else:
+            raise ValueError('policy is not None or a Policy instance')
+        self.reform = copy.deepcopy(reform)
+        self._base = ReformDelta._parameter_state(base)
+        base.implement_reform(reform, print_warnings=print_warnings,
+                              raise_errors=raise_errors)
+        self._errors = copy.deepcopy(base._errors)
+        self._warnings = copy.deepcopy(base._warnings)
+        reformed = ReformDelta._parameter_state(base)
+        self._params = {
+            param: state
+            for param, state in reformed['params'].items()
+            if state != self._base['params'][param]
+        }
+        self._rates = reformed['rates']
+        self._changes = {}
+        for param, (indexed, values) in self._params.items():
+            old_indexed, old_values = self._base['params'][param]
+            old = ReformDelta._values_by_year(old_values)
+            new = ReformDelta._values_by_year(values)
+            years = {year for year in set(old) | set(new)
+                     if old.get(year) != new.get(year)}
+            if indexed != old_indexed:
+                years.add(base.start_year)
+            self._changes[param] = sorted(years)
+        self.applied = 0
+        self.fallbacks = 0
+
+    @property
+    def changes(self):
+        """
+        Dictionary whose keys are the names of the parameters changed by
+        the reform and whose values are the sorted lists of years in which
+        the parameter values (or, for the first year, the parameter
+        indexing status) are changed by the reform.
+        """
+        return copy.deepcopy(self._changes)
+
+    def matches(self, policy):
+        """
+        Return True if the parameter values and indexing rates of the
+        specified Policy object are the same as those of the base Policy
+        object used to compile the reform; otherwise return False.
+        The parameters changed by the reform are compared first, so that
+        a Policy object that differs from the base in one of them is
+        rejected without comparing all the parameters.
+        """
+        # pylint: disable=unidiomatic-typecheck
+        if type(policy) is not self._base['cls']:
+            return False
+        for param in self._params:
+            data = policy._data.get(param)
+            if (data is None or
+                    (data.get('indexed'), data['value']) !=
+                    self._base['params'][param]):
+                return False
+        return ReformDelta._parameter_state(policy, copy_values=False) == \
+            self._base
+
+    def apply(self, policy, print_warnings=True, raise_errors=True):
+        """
+        Apply the compiled reform to the specified Policy object, which
+        is done by copying the reformed parameter values when the policy
+        matches the base Policy object and by calling the implement_reform
+        method otherwise (which is counted by the fallbacks attribute).
+        """
+        if self._errors or not self.matches(policy):
+            self.fallbacks += 1
+            policy.implement_reform(self.reform,
+                                    print_warnings=print_warnings,
+                                    raise_errors=raise_errors)
+            return
+        self.applied += 1
+        for param, (indexed, values) in self._params.items():
+            data = policy._own_param_data(param)
+            data['indexed'] = indexed
+            data['value'] = copy.deepcopy(values)
+        policy._inflation_rates = list(self._rates[0])
+        policy._wage_growth_rates = list(self._rates[1])
+        policy._errors = {}
+        policy._warnings = copy.deepcopy(self._warnings)
+        policy._set_state(params=list(self._params))
+        if print_warnings and policy.warnings:
+            print('WARNING:')
+            print(policy.warnings)
+
+    # ----- begin private methods of ReformDelta class -----
+
+    @staticmethod
+    def _parameter_state(policy, copy_values=True):
+        """
+        Return dictionary containing the class, the years, the indexing
+        rates, and the indexing status and value objects of each parameter
+        of the specified Policy object.
+        """
+        def values(vos):
+            return copy.deepcopy(vos) if copy_values else vos
+        return {
+            'cls': type(policy),
+            'years': (policy.start_year, policy.end_year),
+            'rates': (list(policy._inflation_rates or []),
+                      list(policy._wage_growth_rates or [])),
+            'params': {
+                param: (data.get('indexed'), values(data['value']))
+                for param, data in policy._data.items()
+            },
+        }
+
+    @staticmethod
+    def _values_by_year(values):
+        """
+        Return dictionary whose keys are years and whose values are the
+        sorted label-and-value items of the value objects for that year.
+        """
+        by_year = {}
+        for vo in values:
+            items = sorted((key, str(val)) for key, val in vo.items()
+                           if key not in ('year', '_auto'))
+            by_year.setdefault(vo.get('year'), []).append(items)
+        return {year: sorted(vos) for year, vos in by_year.items()}
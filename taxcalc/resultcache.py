@@ -0,0 +1,180 @@
+"""
+Tax-Calculator on-disk ResultCache class.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle resultcache.py
+# pylint --disable=locally-disabled resultcache.py
+
+import os
+import shutil
+import hashlib
+import numpy as np
+from taxcalc.data import _read_columns, _write_columns, _evict_columns
+
+
+class ResultCache():
+    """
+    Constructor for the ResultCache class, which is an opt-in on-disk
+    cache of the variables calculated by the Calculator.calc_all method.
+
+    Each cache entry is stored in its own columnar store directory, which
+    contains an uncompressed NumPy .npy file for each dtype of the
+    calculated variables (whose rows are memory-mapped and copied into
+    the Records variables when the entry is read), and is named
+    using a content-addressed key that is a hash of everything that can
+    influence the calc_all results: the Records input_key string (which
+    identifies the input data and weights files, the growth factors, and
+    the year to which the data have been extrapolated), the current
+    values of all the Records read variables, the current-year
+    values of all the Policy and Consumption parameters (which reflect
+    the baseline/reform and assumption files), the calc_all
+    zero_out_calc_vars flag, and the Tax-Calculator version.  So read
+    variables changed in any way (including in place) give a different
+    key, and calc_all results are neither read from nor written to the
+    cache when the Records input_key method returns None, which is the
+    case after a read variable has been changed by a Calculator method
+    such as array (as is done by the Calculator.mtr method).
+    When the total size of the cache entries exceeds max_size_bytes,
+    the least recently used entries are removed from the cache.
+
+    Parameters
+    ----------
+    cache_dir: string
+        path to directory in which the cache entries are stored;
+        directory is created if it does not exist.
+
+    max_size_bytes: integer
+        maximum total size of the cache entries; default is 2GB.
+
+    Raises
+    ------
+    ValueError:
+        if max_size_bytes is not a positive integer.
+
+    Returns
+    -------
+    class instance: ResultCache
+
+    Notes
+    -----
+    The cache is used as follows:
+         cache = ResultCache('/path/to/cache_dir')
+         calc = Calculator(policy=pol, records=rec, result_cache=cache)
+         calc.calc_all()  # reads results from cache when possible
+    The cache can also be used by the tc CLI via its --cachedir option.
+    """
+
+    FILE_SUFFIX = '.columns'
+    DEFAULT_MAX_SIZE_BYTES = 2 * 1024**3
+
+    def __init__(self, cache_dir, max_size_bytes=DEFAULT_MAX_SIZE_BYTES):
+        if not isinstance(max_size_bytes, int) or max_size_bytes <= 0:
+            raise ValueError('max_size_bytes must be a positive integer')
+        self.cache_dir = os.path.abspath(cache_dir)
+        self.max_size_bytes = max_size_bytes
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def key(policy, records, consumption, zero_out_calc_vars=False):
+        """
+        Return string key that identifies the calc_all results for the
+        specified Policy, Records, and Consumption objects, or None if
+        the Records variables cannot be identified by their input_key.
+        """
+        # pylint: disable=import-outside-toplevel,cyclic-import
+        from taxcalc import __version__
+        records_key = records.input_key()
+        if records_key is None:
+            return None
+        hasher = hashlib.blake2b(digest_size=20)
+        hasher.update(
+            f'{__version__}|{zero_out_calc_vars}|{records_key}|'
+            f'{records.current_year}|{records.array_length}'.encode('utf-8')
+        )
+        for vname in sorted(records.USABLE_READ_VARS):
+            ResultCache._hash_array(hasher, vname, getattr(records, vname))
+        for pobj in (policy, consumption):
+            hasher.update(f'|{type(pobj).__name__}'.encode('utf-8'))
+            for pname in sorted(pobj.keys()):
+                ResultCache._hash_array(hasher, pname, getattr(pobj, pname))
+        return hasher.hexdigest()
+
+    def fetch(self, key, records):
+        """
+        Copy into the calculated variables in the specified Records object
+        the values cached under the specified key and return True, or
+        return False if there is no cache entry for the key.
+        """
+        path = self._path(key)
+        cached = _read_columns(path)
+        if cached is None:
+            self.misses += 1
+            return False
+        for vname, array in cached[0].items():
+            getattr(records, vname)[:] = array
+        del cached
+        try:
+            os.utime(path)  # mark entry as most recently used
+        except OSError:  # pragma: no cover
+            pass  # entry may have been evicted by another process
+        self.hits += 1
+        return True
+
+    def store(self, key, records):
+        """
+        Store the calculated variables in the specified Records object
+        as the cache entry for the specified key and then remove least
+        recently used cache entries if the cache is larger than allowed.
+        """
+        arrays = {vname: np.asarray(getattr(records, vname))
+                  for vname in sorted(records.CALCULATED_VARS)}
+        path = self._path(key)
+        try:
+            _write_columns(path, arrays, {})
+        except OSError:  # pragma: no cover
+            if not os.path.isdir(path):
+                raise
+            # entry has just been stored by another process
+        self.evict()
+
+    def evict(self):
+        """
+        Remove least recently used cache entries until the total size
+        of the cache entries is no larger than max_size_bytes.
+        """
+        _evict_columns(self.cache_dir, self.max_size_bytes,
+                       ResultCache.FILE_SUFFIX)
+
+    def clear(self):
+        """
+        Remove all cache entries.
+        """
+        for entry in os.scandir(self.cache_dir):
+            if entry.name.endswith(ResultCache.FILE_SUFFIX):
+                shutil.rmtree(entry.path)
+        self.hits = 0
+        self.misses = 0
+
+    # ----- begin private methods of ResultCache class -----
+
+    def _path(self, key):
+        """
+        Return path to the cache entry directory for the specified key.
+        """
+        return os.path.join(self.cache_dir, key + ResultCache.FILE_SUFFIX)
+
+    @staticmethod
+    def _hash_array(hasher, name, value):
+        """
+        Update hasher with the name, dtype, shape, and contents of value.
+        """
+        array = np.ascontiguousarray(np.asarray(value))
+        hasher.update(
+            f'|{name}|{array.dtype.str}|{array.shape}|'.encode('utf-8')
+        )
+        if array.dtype == object:
+            hasher.update(repr(array.tolist()).encode('utf-8'))
+        else:
+            hasher.update(array.reshape(-1).view(np.uint8).data)
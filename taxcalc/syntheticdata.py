@@ -0,0 +1,244 @@
+"""
+Tax-Calculator SyntheticData class that generates large input data files.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle syntheticdata.py
+# pylint --disable=locally-disabled syntheticdata.py
+
+import os
+import numpy as np
+import pandas as pd
+from taxcalc.records import Records
+from taxcalc.utils import read_egg_csv
+
+
+class SyntheticData():
+    """
+    Constructor for the SyntheticData class, which generates synthetic
+    input data of any size (for example, tens of millions of filing units)
+    by bootstrapping (that is, sampling with replacement) the filing units
+    in existing Records input data, such as the cps.csv.gz data included
+    in the taxcalc package.  The synthetic data can be returned as Pandas
+    DataFrames, streamed in chunks, or written to data and weights files
+    that can be used to construct a Records object.
+
+    The synthetic data satisfy all the checks done by the Records class
+    constructor because integer variables (such as MARS and EIC) are copied
+    unchanged, because the optional noise multiplies all the dollar amounts
+    of a filing unit by the same random factor (so zero amounts, signs,
+    inequalities such as e00600 >= e00650, and the spouse zeros are
+    preserved), and because the split-earnings totals (e00200, e00900, and
+    e02100) are recomputed from their taxpayer and spouse parts.  The
+    weights (both the s006 variable and each year of the weights data) are
+    scaled so that their totals are the same as in the original data, so
+    weighted aggregates of the synthetic data match those of the original
+    data up to sampling error.  Each synthetic filing unit is given a
+    unique RECID value.
+
+    Parameters
+    ----------
+    data: string or Pandas DataFrame
+        string describes CSV file in which the original data reside;
+        DataFrame already contains the original data.
+
+    weights: None or string or Pandas DataFrame
+        None implies there are no sample weights to scale;
+        string describes CSV file in which the original weights reside;
+        DataFrame already contains the original weights.
+
+    noise: float
+        standard deviation of the logarithm of the random factor (which has
+        a mean of one) that multiplies the dollar amounts of each synthetic
+        filing unit;
+        default value of zero implies no noise is added.
+
+    seed: None or integer
+        seed for the random number generator; None implies a random seed.
+
+    Raises
+    ------
+    ValueError:
+        if data is not a string or a DataFrame instance.
+        if weights is not None or a string or a DataFrame instance.
+        if data and weights have different numbers of rows.
+        if noise is negative.
+
+    Returns
+    -------
+    class instance: SyntheticData
+
+    Notes
+    -----
+    Ten million synthetic CPS filing units can be written as follows:
+         synth = SyntheticData(noise=0.05, seed=123)
+         synth.write(10_000_000, 'cps10m.csv.gz', 'cps10m_weights.csv.gz')
+    and processed with Records(data='cps10m.csv.gz',
+    start_year=Records.CPSCSV_YEAR, weights='cps10m_weights.csv.gz', ...).
+    """
+
+    DEFAULT_CHUNK_SIZE = 1_000_000
+    SPLIT_VARS = ['e00200', 'e00900', 'e02100']
+
+    def __init__(self, data='cps.csv.gz',
+                 weights=Records.CPS_WEIGHTS_FILENAME,
+                 noise=0.0, seed=None):
+        self._data = SyntheticData._read_frame(data, 'data')
+        if weights is None:
+            self._weights = None
+        else:
+            self._weights = SyntheticData._read_frame(weights, 'weights')
+            if len(self._weights.index) != len(self._data.index):
+                msg = 'data and weights have different numbers of rows'
+                raise ValueError(msg)
+        if noise < 0.:
+            raise ValueError('noise is negative')
+        self.noise = noise
+        self._rng = np.random.default_rng(seed)
+        # identify float read variables, which contain dollar amounts
+        varinfo = Records(data=None, gfactors=None, weights=None)
+        float_vars = varinfo.USABLE_READ_VARS - varinfo.INTEGER_READ_VARS
+        self._amount_vars = [vname for vname in self._data.columns
+                             if vname in float_vars and vname != 's006']
+
+    @property
+    def original_size(self):
+        """
+        Number of filing units in the original data.
+        """
+        return len(self._data.index)
+
+    def chunks(self, num_records, chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Generator that yields (data, weights) pairs of Pandas DataFrames,
+        each containing no more than chunk_size filing units, which
+        together contain num_records synthetic filing units; weights is
+        None when the SyntheticData object was constructed without weights.
+        """
+        if num_records <= 0 or chunk_size <= 0:
+            raise ValueError('num_records and chunk_size must be positive')
+        # draw all the bootstrap indices first so that the weights of the
+        # complete synthetic sample can be scaled exactly
+        indices = self._rng.integers(0, self.original_size, size=num_records,
+                                     dtype=np.int32)
+        counts = np.bincount(indices, minlength=self.original_size)
+        if 's006' in self._data.columns:
+            data_factor = SyntheticData._scale_factors(self._data[['s006']],
+                                                       counts)
+        else:
+            data_factor = None
+        if self._weights is None:
+            weights_factors = None
+        else:
+            weights_factors = SyntheticData._scale_factors(self._weights,
+                                                           counts)
+        for start in range(0, num_records, chunk_size):
+            idx = indices[start:start + chunk_size]
+            data = self._data.iloc[idx].reset_index(drop=True)
+            data['RECID'] = np.arange(start + 1, start + len(idx) + 1,
+                                      dtype=self._data['RECID'].dtype)
+            if self.noise > 0.:
+                self._add_noise(data)
+            if data_factor is not None:
+                data['s006'] = SyntheticData._scaled(data[['s006']],
+                                                     data_factor)['s006']
+            if self._weights is None:
+                weights = None
+            else:
+                weights = SyntheticData._scaled(
+                    self._weights.iloc[idx].reset_index(drop=True),
+                    weights_factors
+                )
+            yield data, weights
+
+    def sample(self, num_records):
+        """
+        Return (data, weights) pair of Pandas DataFrames containing
+        num_records synthetic filing units; weights is None when the
+        SyntheticData object was constructed without weights.
+        """
+        return next(self.chunks(num_records, chunk_size=num_records))
+
+    def write(self, num_records, data_filename, weights_filename=None,
+              chunk_size=DEFAULT_CHUNK_SIZE):
+        """
+        Write num_records synthetic filing units to the data_filename CSV
+        file and their weights to the weights_filename CSV file, one chunk
+        at a time so that memory use does not depend on num_records.
+        Files whose names end with .gz are gzip compressed.
+        """
+        if weights_filename is not None and self._weights is None:
+            raise ValueError('cannot write weights file without weights')
+        for fname in (data_filename, weights_filename):
+            if fname is not None and os.path.isfile(fname):
+                os.remove(fname)
+        header = True
+        for data, weights in self.chunks(num_records, chunk_size):
+            data.to_csv(data_filename, mode='a', header=header, index=False)
+            if weights_filename is not None:
+                weights.to_csv(weights_filename, mode='a', header=header,
+                               index=False)
+            header = False
+
+    # ----- begin private methods of SyntheticData class -----
+
+    def _add_noise(self, data):
+        """
+        Multiply all the dollar amounts of each filing unit in data by the
+        same random factor and recompute the split-earnings totals.
+        """
+        # lognormal factor has a mean of one so noise does not bias totals
+        factor = np.exp(self._rng.normal(-0.5 * self.noise**2, self.noise,
+                                         len(data.index)))
+        for vname in self._amount_vars:
+            values = data[vname].to_numpy() * factor
+            if np.issubdtype(data[vname].dtype, np.integer):
+                data[vname] = np.round(values).astype(data[vname].dtype)
+            else:
+                data[vname] = np.round(values, 2)
+        for vname in SyntheticData.SPLIT_VARS:
+            parts = [vname + 'p', vname + 's']
+            if vname in data.columns and set(parts) <= set(data.columns):
+                data[vname] = data[parts[0]] + data[parts[1]]
+
+    @staticmethod
+    def _read_frame(frame, what):
+        """
+        Return frame if it is a DataFrame or return the contents of the
+        CSV file named frame, which may be in the taxcalc package.
+        """
+        if isinstance(frame, pd.DataFrame):
+            return frame
+        if isinstance(frame, str):
+            if os.path.isfile(frame):
+                return pd.read_csv(frame)
+            if os.path.isfile(os.path.join(Records.CODE_PATH, frame)):
+                return pd.read_csv(os.path.join(Records.CODE_PATH, frame))
+            return read_egg_csv(frame)  # pragma: no cover
+        raise ValueError(f'{what} is neither a string nor a Pandas DataFrame')
+
+    @staticmethod
+    def _scale_factors(frame, counts):
+        """
+        Return Pandas Series containing for each column of frame the factor
+        that makes the column total of the bootstrap sample, in which each
+        original row appears the number of times given by counts, equal to
+        the column total of frame.
+        """
+        totals = frame.sum()
+        sample_totals = pd.Series(
+            counts.astype(np.float64) @ frame.to_numpy(dtype=np.float64),
+            index=frame.columns
+        )
+        return totals / sample_totals.where(sample_totals != 0., 1.)
+
+    @staticmethod
+    def _scaled(frame, factors):
+        """
+        Return frame with each column multiplied by its scale factor,
+        keeping integer columns integers.
+        """
+        scaled = frame * factors
+        for col in frame.columns:
+            if np.issubdtype(frame[col].dtype, np.integer):
+                scaled[col] = np.round(scaled[col]).astype(frame[col].dtype)
+        return scaled
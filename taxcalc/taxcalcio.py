@@ -4,11 +4,14 @@ Tax-Calculator Input-Output class.
 # CODING-STYLE CHECKS:
 # pycodestyle taxcalcio.py
 # pylint --disable=locally-disabled taxcalcio.py
+#
+# pylint: disable=too-many-lines
 
 import os
 import gc
 import copy
 import sqlite3
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import pandas as pd
 import paramtools
@@ -60,6 +63,12 @@ class TaxCalcIO():
     silent: boolean
         whether or not to suppress action messages.
 
+    memprofile: None or MemoryProfile
+        None implies no memory profiling, or MemoryProfile object
+        that records memory use of each stage of the init, analyze,
+        and advance_to_year methods; when specified, the baseline and
+        reform calculations are not done concurrently.
+
     Returns
     -------
     class instance: TaxCalcIO
@@ -67,10 +76,11 @@ class TaxCalcIO():
     # pylint: disable=too-many-instance-attributes
 
     def __init__(self, input_data, tax_year, baseline, reform, assump,
-                 runid=0, silent=True):
+                 runid=0, silent=True, memprofile=None):
         # pylint: disable=too-many-arguments,too-many-positional-arguments
         # pylint: disable=too-many-branches,too-many-statements,too-many-locals
         self.silent = silent
+        self.memprofile = memprofile
         self.gf_reform = None
         self.errmsg = ''
         # check name and existence of INPUT file
@@ -248,12 +258,13 @@ class TaxCalcIO():
             '-mtr.html',
             '-pch.html',
             '.db',
+            '-memprofile.txt',
         ]
         for ext in extensions:
             delete_file(self.output_filename.replace('.xxx', ext))
 
     def init(self, input_data, tax_year, baseline, reform, assump,
-             aging_input_data, exact_calculations):
+             aging_input_data, exact_calculations, result_cache=None):
         """
         TaxCalcIO class post-constructor method that completes initialization.
 
@@ -269,10 +280,17 @@ class TaxCalcIO():
         exact_calculations: boolean
             specifies whether or not exact tax calculations are done without
             any smoothing of "stair-step" provisions in the tax law.
+
+        result_cache: None or ResultCache
+            specifies the on-disk cache of calc_all results used by both
+            the baseline and reform Calculator objects; None implies no
+            caching of calc_all results.
         """
         # pylint: disable=too-many-arguments,too-many-positional-arguments
         # pylint: disable=too-many-statements,too-many-branches,too-many-locals
         self.errmsg = ''
+        if self.memprofile is not None:
+            self.memprofile.restart()
         # instantiate base and reform GrowFactors objects
         if self.tmd_input_data:
             gfactors_bas = GrowFactors(self.tmd_gfactor)  # pragma: no cover
@@ -336,6 +354,7 @@ class TaxCalcIO():
         gdiff_baseline.apply_to(gfactors_ref)
         gdiff_response.apply_to(gfactors_ref)
         self.gf_reform = copy.deepcopy(gfactors_ref)
+        self._memory_checkpoint('GrowFactors construction')
         # create Policy objects:
         # ... the baseline Policy object
         if self.specified_baseline:
@@ -343,19 +362,19 @@ class TaxCalcIO():
                 gfactors=gfactors_bas,
                 last_budget_year=last_b_year,
             )
-            for poldict in poldicts_bas:
-                try:
-                    pol_bas.implement_reform(
-                        poldict,
-                        print_warnings=True,
-                        raise_errors=False,
-                    )
-                    if self.errmsg:
-                        self.errmsg += "\n"
-                    for _, errors in pol_bas.parameter_errors.items():
-                        self.errmsg += "\n".join(errors)
-                except paramtools.ValidationError as valerr_msg:
-                    self.errmsg += str(valerr_msg)
+            # implement compound reform with as few adjustments as possible
+            try:
+                pol_bas.implement_reforms(
+                    poldicts_bas,
+                    print_warnings=True,
+                    raise_errors=False,
+                )
+                if self.errmsg:
+                    self.errmsg += "\n"
+                for _, errors in pol_bas.parameter_errors.items():
+                    self.errmsg += "\n".join(errors)
+            except paramtools.ValidationError as valerr_msg:
+                self.errmsg += str(valerr_msg)
         else:
             pol_bas = Policy(
                 gfactors=gfactors_bas,
@@ -367,19 +386,19 @@ class TaxCalcIO():
                 gfactors=gfactors_ref,
                 last_budget_year=last_b_year,
             )
-            for poldict in poldicts_ref:
-                try:
-                    pol_ref.implement_reform(
-                        poldict,
-                        print_warnings=True,
-                        raise_errors=False,
-                    )
-                    if self.errmsg:
-                        self.errmsg += "\n"
-                    for _, errors in pol_ref.parameter_errors.items():
-                        self.errmsg += "\n".join(errors)
-                except paramtools.ValidationError as valerr_msg:
-                    self.errmsg += str(valerr_msg)
+            # implement compound reform with as few adjustments as possible
+            try:
+                pol_ref.implement_reforms(
+                    poldicts_ref,
+                    print_warnings=True,
+                    raise_errors=False,
+                )
+                if self.errmsg:
+                    self.errmsg += "\n"
+                for _, errors in pol_ref.parameter_errors.items():
+                    self.errmsg += "\n".join(errors)
+            except paramtools.ValidationError as valerr_msg:
+                self.errmsg += str(valerr_msg)
         else:
             pol_ref = Policy(
                 gfactors=gfactors_bas,
@@ -397,6 +416,7 @@ class TaxCalcIO():
         # set policy to tax_year
         pol_ref.set_year(tax_year)
         pol_bas.set_year(tax_year)
+        self._memory_checkpoint('Policy construction')
         # read input file contents into Records objects
         if aging_input_data:
             if self.cps_input_data:
@@ -404,41 +424,25 @@ class TaxCalcIO():
                     gfactors=gfactors_ref,
                     exact_calculations=exact_calculations,
                 )
-                recs_bas = Records.cps_constructor(
-                    gfactors=gfactors_bas,
-                    exact_calculations=exact_calculations,
-                )
             elif self.tmd_input_data:  # pragma: no cover
-                wghts = pd.read_csv(self.tmd_weights)
                 recs_ref = Records(
-                    data=pd.read_csv(input_data),
+                    data=input_data,
                     start_year=Records.TMDCSV_YEAR,
-                    weights=wghts,
+                    weights=os.path.abspath(self.tmd_weights),
                     gfactors=gfactors_ref,
                     adjust_ratios=None,
                     exact_calculations=exact_calculations,
                     weights_scale=1.0,
                 )
-                recs_bas = Records(
-                    data=pd.read_csv(input_data),
-                    start_year=Records.TMDCSV_YEAR,
-                    weights=wghts,
-                    gfactors=gfactors_bas,
-                    adjust_ratios=None,
-                    exact_calculations=exact_calculations,
-                    weights_scale=1.0,
-                )
             else:  # if not {cps|tmd}_input_data but aging_input_data: puf
                 recs_ref = Records(
                     data=input_data,
                     gfactors=gfactors_ref,
                     exact_calculations=exact_calculations
                 )
-                recs_bas = Records(
-                    data=input_data,
-                    gfactors=gfactors_bas,
-                    exact_calculations=exact_calculations
-                )
+            # baseline Records object differs only in its growth factors,
+            # so the input data and weights are read only once
+            recs_bas = recs_ref.copy_with_gfactors(gfactors_bas)
         else:  # input_data are raw data that are not being aged
             recs_ref = Records(
                 data=input_data,
@@ -449,6 +453,7 @@ class TaxCalcIO():
                 exact_calculations=exact_calculations,
             )
             recs_bas = copy.deepcopy(recs_ref)
+        self._memory_checkpoint('Records construction')
         # create Calculator objects
         self.calc_ref = Calculator(
             policy=pol_ref,
@@ -456,6 +461,7 @@ class TaxCalcIO():
             verbose=(not self.silent),
             consumption=con,
             sync_years=aging_input_data,
+            result_cache=result_cache,
         )
         self.calc_bas = Calculator(
             policy=pol_bas,
@@ -463,6 +469,10 @@ class TaxCalcIO():
             verbose=False,
             consumption=con,
             sync_years=aging_input_data,
+            result_cache=result_cache,
+        )
+        self._memory_checkpoint(
+            f'Calculator construction for {self.calc_ref.current_year}'
         )
 
     def tax_year(self):
@@ -495,6 +505,7 @@ class TaxCalcIO():
         # advance baseline and reform Calculator objects to specified year
         self.calc_bas.advance_to_year(year)
         self.calc_ref.advance_to_year(year)
+        self._memory_checkpoint(f'increment_year to {year}')
         idata = 'Advance input data and' if aging_data else 'Advance'
         if not self.silent:
             print(f'{idata} policy to {year}')
@@ -506,6 +517,7 @@ class TaxCalcIO():
             output_graphs=False,
             output_dump=False,
             dump_varlist=None,
+            concurrent_calcs=True,
     ):
         """
         Conduct tax analysis.
@@ -532,6 +544,11 @@ class TaxCalcIO():
            list of variables to include in dumpdb output;
            list must include at least one variable.
 
+        concurrent_calcs: boolean
+           whether or not to do the baseline and reform calculations
+           concurrently in two threads; the results are identical to
+           those generated when the calculations are done sequentially.
+
         Returns
         -------
         Nothing
@@ -539,24 +556,39 @@ class TaxCalcIO():
         # pylint: disable=too-many-arguments,too-many-positional-arguments
         # pylint: disable=too-many-branches,too-many-locals
         doing_calcs = output_tables or output_graphs or output_dump
-        # optionally write --params output to text files
-        if output_params:
-            self.write_policy_params_files()
-        if not doing_calcs:
-            return
-        # do output calculations
-        self.calc_bas.calc_all()
-        self.calc_ref.calc_all()
         if output_dump:
             assert isinstance(dump_varlist, list)
             assert len(dump_varlist) > 0
+        if not doing_calcs:
+            # optionally write --params output to text files
+            if output_params:
+                self.write_policy_params_files()
+            return
+        # do output calculations, with the baseline and reform Calculator
+        # objects (which share no data) being processed concurrently
+        # when concurrent_calcs is True
+        if concurrent_calcs and self.memprofile is None:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                fut_bas = executor.submit(self._calculate, self.calc_bas,
+                                          output_dump, 'baseline')
+                fut_ref = executor.submit(self._calculate, self.calc_ref,
+                                          output_dump, 'reform')
+                # optionally write --params output to text files
+                # while the calculations are being done
+                if output_params:
+                    self.write_policy_params_files()
+                mtr_bas = fut_bas.result()
+                mtr_ref = fut_ref.result()
+        else:
+            if output_params:
+                self.write_policy_params_files()
+                self._memory_checkpoint('write_policy_params_files')
+            mtr_bas = self._calculate(self.calc_bas, output_dump, 'baseline')
+            mtr_ref = self._calculate(self.calc_ref, output_dump, 'reform')
+        if output_dump:
             # might need marginal tax rates for dumpdb
-            (mtr_ptax_ref, mtr_itax_ref,
-             _) = self.calc_ref.mtr(wrt_full_compensation=False,
-                                    calc_all_already_called=True)
-            (mtr_ptax_bas, mtr_itax_bas,
-             _) = self.calc_bas.mtr(wrt_full_compensation=False,
-                                    calc_all_already_called=True)
+            (mtr_ptax_ref, mtr_itax_ref) = mtr_ref
+            (mtr_ptax_bas, mtr_itax_bas) = mtr_bas
         else:
             # do not need marginal tax rates for dumpdb
             mtr_ptax_ref = None
@@ -566,9 +598,11 @@ class TaxCalcIO():
         # optionally write --tables output to text file
         if output_tables:
             self.write_tables_file()
+            self._memory_checkpoint('write_tables_file')
         # optionally write --graphs output to HTML files
         if output_graphs:
             self.write_graph_files()
+            self._memory_checkpoint('write_graph_files')
         # optionally write --dumpdb output to SQLite database file
         if output_dump:
             self.write_dumpdb_file(
@@ -576,6 +610,48 @@ class TaxCalcIO():
                 mtr_ptax_ref, mtr_itax_ref,
                 mtr_ptax_bas, mtr_itax_bas,
             )
+            self._memory_checkpoint('write_dumpdb_file')
+        if self.memprofile is not None:
+            year = self.calc_ref.current_year
+            self.memprofile.record_objects(f'{year} baseline Calculator',
+                                           self.calc_bas)
+            self.memprofile.record_objects(f'{year} reform Calculator',
+                                           self.calc_ref)
+
+    def _calculate(self, calc, need_mtr, label):
+        """
+        Call calc_all method of specified Calculator object and, when
+        need_mtr is True, return its (mtr_ptax, mtr_itax) marginal tax
+        rates; otherwise return None.
+        """
+        calc.calc_all()
+        self._memory_checkpoint(f'{calc.current_year} {label} calc_all')
+        if not need_mtr:
+            return None
+        (mtr_ptax, mtr_itax,
+         _) = calc.mtr(wrt_full_compensation=False,
+                       calc_all_already_called=True)
+        self._memory_checkpoint(f'{calc.current_year} {label} mtr')
+        return (mtr_ptax, mtr_itax)
+
+    def _memory_checkpoint(self, stage):
+        """
+        Record memory use of the named stage when memory profiling.
+        """
+        if self.memprofile is not None:
+            self.memprofile.checkpoint(stage)
+
+    def write_memprofile_file(self):
+        """
+        Write memory profile report to a text file.
+        """
+        assert self.memprofile is not None
+        fname = self.output_filename.replace('.xxx', '-memprofile.txt')
+        self.memprofile.write_report(fname)
+        if not self.silent:
+            print(  # pragma: no cover
+                f'Write memory profile to file {fname}'
+            )
 
     def write_policy_params_files(self):
         """
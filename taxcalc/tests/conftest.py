@@ -13,6 +13,12 @@ import pytest
 # convert all numpy warnings into errors so they can be detected in tests
 numpy.seterr(all='raise')
 
+# construct Policy objects without snapshots and Records objects without
+# input caches, except in the tests that enable them, so that the tests
+# exercise the Parameters constructor and the reading of input files
+os.environ.pop('TAXCALC_SNAPSHOT_DIR', None)
+os.environ.pop('TAXCALC_INPUT_CACHE_DIR', None)
+
 
 @pytest.fixture
 def skip_jit(monkeypatch):
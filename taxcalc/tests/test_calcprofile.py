@@ -0,0 +1,45 @@
+"""
+Test CalcProfile class and its methods.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle test_calcprofile.py
+# pylint --disable=locally-disabled test_calcprofile.py
+
+import os
+from taxcalc import Policy, Records, Calculator, CalcProfile
+
+
+def test_calc_all_profile(cps_subsample, tmp_path):
+    """Test docstring"""
+    rec = Records.cps_constructor(data=cps_subsample)
+    pol = Policy()
+    pol.implement_reform({'ID_BenefitSurtax_crt': {2015: 0.2}})
+    calc = Calculator(policy=pol, records=rec)
+    assert calc.profile is None
+    calc = Calculator(policy=pol, records=rec, profile=True)
+    assert isinstance(calc.profile, CalcProfile)
+    calc.advance_to_year(2015)
+    calc.calc_all()
+    calc.mtr(calc_all_already_called=True)
+    tdf = calc.profile.dataframe()
+    assert list(tdf.columns) == CalcProfile.COLUMNS
+    assert set(tdf['year']) == {2015}
+    paths = dict(zip(tdf['path'], tdf['calls']))
+    assert paths['calc_all'] == 1
+    assert paths['calc_all;_calc_one_year;_taxinc_to_amt'] == 3
+    assert paths['calc_all;_calc_one_year;_taxinc_to_amt;TaxInc'] == 3
+    assert paths['mtr;_calc_one_year;_taxinc_to_amt'] == 3
+    # ComputeBenefit recalculations are included in BenefitSurtax timings
+    assert paths['calc_all;BenefitSurtax;_taxinc_to_amt'] == 3
+    assert paths['increment_year'] == 1
+    assert (tdf['self_seconds'] <= tdf['seconds']).all()
+    assert tdf.loc[tdf['function'] == 'TaxInc', 'bytes'].min() > 0
+    # folded-stack output
+    fname = os.path.join(tmp_path, 'calc.folded')
+    calc.profile.write_folded(fname, by_year=True)
+    with open(fname, 'r', encoding='utf-8') as ffile:
+        lines = ffile.readlines()
+    assert len(lines) == len(tdf.index)
+    assert lines[0].startswith('2015;')
+    calc.profile.clear()
+    assert calc.profile.dataframe().empty
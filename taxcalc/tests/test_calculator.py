@@ -52,6 +52,24 @@ def test_make_calculator_deepcopy(cps_subsample):
     assert isinstance(calc2, Calculator)
 
 
+def test_calculator_integer_types(cps_subsample):
+    """
+    Test that narrow storage types of integer variables are not returned.
+    """
+    # pylint: disable=no-member
+    rec = Records.cps_constructor(data=cps_subsample)
+    calc = Calculator(policy=Policy(), records=rec)
+    assert rec.age_head.dtype == np.int8
+    for var in ['age_head', 'XTOT', 'MARS', 'FLPDYR', 'RECID']:
+        assert calc.array(var).dtype == np.int32, var
+    vdf = calc.dataframe(['age_head', 'XTOT', 'MARS'])
+    assert all(dtype == np.int32 for dtype in vdf.dtypes)
+    assert (calc.array('age_head') * 12).max() == int(rec.age_head.max()) * 12
+    assert np.array_equal(calc.array('XTOT') * 1000,
+                          rec.XTOT.astype(np.int64) * 1000)
+    assert calc.array('e00200').dtype == np.float64
+
+
 def test_make_calculator_with_policy_reform(cps_subsample):
     """
     Test Calculator class ctor with policy reform.
@@ -630,6 +648,9 @@ def test_reform_documentation():
     if dump:
         print(doc)
         assert False, 'ERROR: reform_documentation above'
+    # documentation uses cached current-law policy but not growfactors
+    assert not gfs.used
+    assert Calculator.reform_documentation(params, gfs, [second_reform]) == doc
 
 
 def test_distribution_tables(cps_subsample):
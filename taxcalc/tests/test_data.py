@@ -6,6 +6,7 @@ Test Data class and its methods.
 # pylint --disable=locally-disabled test_data.py
 
 import os
+import json
 import tempfile
 import pytest
 import numpy as np
@@ -138,3 +139,47 @@ def test_recs_class(recs_varinfo_file, cps_subsample):
     rec._read_weights(weights=None)
     with pytest.raises(ValueError):
         rec._read_weights(weights=[])
+
+
+@pytest.mark.parametrize('storage, values, error', [
+    (None, [1, 2, 70000], False),
+    ('int8', [1, 2, 5], False),
+    ('int8', [1, 2, 500], True),
+    ('int16', [1, 2, 500], False),
+    ('bool', [0, 1, 1], False),
+    ('bool', [0, 1, 2], True),
+    ('float32', [1, 2, 5], True),
+])
+def test_integer_storage(tmp_path, storage, values, error):
+    """
+    Test storage of integer variables in the types specified in VARINFO.
+    """
+    # pylint: disable=no-member
+    varinfo = json.loads(VARINFO_JSON)
+    if storage is not None:
+        varinfo['read']['MARS']['storage'] = storage
+    varinfo_path = tmp_path / 'varinfo.json'
+    varinfo_path.write_text(json.dumps(varinfo))
+
+    class Recs(Data):
+        """
+        The Recs class is derived from the abstract base Data class.
+        """
+        VARINFO_FILE_NAME = varinfo_path.name
+        VARINFO_FILE_PATH = str(tmp_path)
+
+    data = pd.DataFrame({'RECID': [1, 2, 3], 'MARS': values})
+    if error:
+        with pytest.raises(ValueError):
+            Recs(data=data, start_year=2014)
+        return
+    rec = Recs(data=data, start_year=2014)
+    expect = np.dtype(storage or 'int32')
+    assert rec.INTEGER_STORAGE['MARS'] == expect
+    assert rec.MARS.dtype == expect
+    assert np.array_equal(rec.MARS, values)
+    assert rec.RECID.dtype == np.int32
+    snap = rec.snapshot()
+    rec.MARS[:] = 0
+    rec.restore(snap)
+    assert np.array_equal(rec.MARS, values)
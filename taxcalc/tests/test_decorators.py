@@ -240,6 +240,21 @@ def test_ret_everything_iterate_jit():
     assert_frame_equal(ans, exp)
 
 
+def test_iterate_jit_exposes_applied_function():
+    """Test docstring"""
+    assert ret_everything.out_args == ('c', 'd', 'e', 'f')
+    pm = Foo()
+    pf = Foo()
+    for name in ['a', 'b', 'c', 'd', 'e', 'f']:
+        setattr(pf, name, np.ones((5,)))
+    ret_everything(pm, pf)
+    applied = ret_everything.applied_function
+    if hasattr(applied, 'signatures'):  # function was JIT compiled
+        assert len(applied.signatures) == 1
+        timers = applied.get_metadata(applied.signatures[0])['timers']
+        assert timers['compiler_lock'] > 0.
+
+
 @iterate_jit(nopython=True)
 def magic_calc3(x, y, z):
     """Function docstring"""
@@ -310,6 +325,31 @@ def test_function_parameters_optional():
     assert_frame_equal(ans, exp)
 
 
+def test_function_reads_year_values():
+    """Test docstring"""
+    pm = Foo()
+    pf = Foo()
+    # parameter attributes are ignored when year_values dictionary exists
+    pm.w = np.zeros((1, 5))
+    pm.year_values = {'w': np.full((5,), 2.)}
+    pf.x = np.ones((5,))
+    pf.y = np.ones((5,))
+    pf.z = np.ones((5,))
+    pf.a = np.zeros((5,))
+    pf.b = np.zeros((5,))
+    ans = magic_calc5(pm, pf)
+    exp = DataFrame(data=[[2.0, 5.0]] * 5,
+                    columns=["a", "b"])
+    assert_frame_equal(ans, exp)
+    assert np.allclose(pf.b, 5.)
+    # returned arrays are stored even when there is only one of them
+    pf.mars = np.ones((5,))
+    pf.var = np.zeros((5,))
+    ans = faux_function(pm, pf)  # pylint: disable=too-many-function-args
+    assert_frame_equal(ans, DataFrame(data=[2.0] * 5, columns=['var']))
+    assert np.allclose(pf.var, 2.)
+
+
 # pylint: enable=no-value-for-parameter
 
 
@@ -7,6 +7,7 @@ Tests of Tax-Calculator GrowFactors class.
 
 import os
 import tempfile
+import numpy as np
 import pytest
 from taxcalc.growfactors import GrowFactors
 from taxcalc.policy import Policy
@@ -92,3 +93,50 @@ def test_growfactors_csv_values():
         for gfname in GrowFactors.VALID_NAMES:
             val = gfo.factor_value(gfname, min_data_year)
             assert val == 1
+
+
+def test_array_access():
+    """
+    Test array access to GrowFactors values.
+    """
+    gfo = GrowFactors()
+    assert sorted(gfo.names) == sorted(GrowFactors.VALID_NAMES)
+    col = gfo.names.index('AWAGE')
+    assert gfo.gfdf.loc[2020, 'AWAGE'] == gfo.factor_value('AWAGE', 2020)
+    factors = gfo.year_factors(2020)
+    assert factors[col] == gfo.factor_value('AWAGE', 2020)
+    with pytest.raises(ValueError):
+        factors[col] = 1.0
+    with pytest.raises(ValueError):
+        gfo.year_factors(gfo.last_year + 1)
+    cumulative = gfo.cumulative_factors(2015, 2020)
+    expect = 1.0
+    for year in range(2015, 2021):
+        expect *= gfo.factor_value('AWAGE', year)
+    assert np.isclose(cumulative[col], expect)
+    assert np.allclose(gfo.cumulative_factors(2021, 2020), 1.0)
+    with pytest.raises(ValueError):
+        gfo.cumulative_factors(gfo.first_year - 1, 2020)
+
+
+def test_apply_diff():
+    """
+    Test that apply_diff gives the same values as repeated update calls.
+    """
+    gfo1 = GrowFactors()
+    gfo2 = GrowFactors()
+    diff = np.zeros((gfo1.last_year - 2009, len(gfo1.names)))
+    diff[5, gfo1.names.index('ACPIU')] = 0.01
+    diff[-1, gfo1.names.index('ABOOK')] = -0.02
+    gfo1.apply_diff(diff, 2010)
+    for idx, year in enumerate(range(2010, gfo1.last_year + 1)):
+        for col, name in enumerate(gfo2.names):
+            gfo2.update(name, year, float(diff[idx, col]))
+    assert np.array_equal(gfo1.gfdf.to_numpy(), gfo2.gfdf.to_numpy())
+    assert gfo1.factor_value('ACPIU', 2015) == \
+        GrowFactors().factor_value('ACPIU', 2015) + 0.01
+    with pytest.raises(ValueError):
+        gfo1.apply_diff(diff[:, :3], 2010)
+    gfo1.factor_value('ACPIU', 2015)
+    with pytest.raises(ValueError):
+        gfo1.apply_diff(diff, 2010)
@@ -0,0 +1,94 @@
+"""
+Test MemoryProfile class and its methods.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle test_memprofile.py
+# pylint --disable=locally-disabled test_memprofile.py
+
+import os
+from io import StringIO
+import numpy as np
+import pandas as pd
+from taxcalc import MemoryProfile, TaxCalcIO
+
+
+def test_memprofile_stages(tmp_path):
+    """Test docstring"""
+    mprof = MemoryProfile()
+    with mprof.stage('allocate'):
+        arr = np.ones(4 * 1024**2 // 8)
+    mprof.restart()
+    arr = None
+    mprof.checkpoint('release')
+    sdf = mprof.dataframe()
+    assert list(sdf.columns) == MemoryProfile.COLUMNS
+    assert list(sdf['stage']) == ['allocate', 'release']
+    assert sdf['traced_peak_mb'].iloc[0] >= 4.0
+    assert sdf['traced_change_mb'].iloc[1] < -3.9
+    mprof.stop()
+    assert arr is None
+
+    # object attribute sizes
+    class Holder():  # pylint: disable=too-few-public-methods
+        """Class docstring"""
+        def __init__(self):
+            self.big = np.zeros(1000)
+            self.small = np.zeros(10)
+            self.frame = pd.DataFrame({'a': np.zeros(100)})
+            self.__inner = Holder2()  # pylint: disable=unused-private-member
+
+    class Holder2():  # pylint: disable=too-few-public-methods
+        """Class docstring"""
+        def __init__(self):
+            self.col = np.zeros(500)
+    mprof.record_objects('holder', Holder(), top=3)
+    odf = mprof.objects_dataframe()
+    assert list(odf['attribute']) == ['big', 'inner.col', 'frame']
+    fname = os.path.join(tmp_path, 'mem.txt')
+    mprof.write_report(fname)
+    with open(fname, 'r', encoding='utf-8') as rfile:
+        report = rfile.read()
+    assert 'allocate' in report
+    assert 'inner.col' in report
+
+
+def test_taxcalcio_memprofile():
+    """Test docstring"""
+    rawinput = (
+        'RECID,MARS,e00200,e00200p\n'
+        '    1,   2,  50000,  50000\n'
+        '    2,   1, 100000, 100000\n'
+    )
+    mprof = MemoryProfile(trace_allocations=False)
+    tcio = TaxCalcIO(input_data=pd.read_csv(StringIO(rawinput)),
+                     tax_year=2021, baseline=None, reform=None,
+                     assump=None, memprofile=mprof)
+    assert not tcio.errmsg
+    tcio.init(input_data=pd.read_csv(StringIO(rawinput)),
+              tax_year=2021, baseline=None, reform=None, assump=None,
+              aging_input_data=False, exact_calculations=False)
+    assert not tcio.errmsg
+    tcio.analyze(output_dump=True, dump_varlist=['RECID', 'iitax'])
+    tcio.delete_output_files()
+    tcio.advance_to_year(2022, False)
+    stages = list(mprof.dataframe()['stage'])
+    assert stages == [
+        'GrowFactors construction',
+        'Policy construction',
+        'Records construction',
+        'Calculator construction for 2021',
+        '2021 baseline calc_all',
+        '2021 baseline mtr',
+        '2021 reform calc_all',
+        '2021 reform mtr',
+        'write_dumpdb_file',
+        'increment_year to 2022',
+    ]
+    assert mprof.dataframe()['traced_peak_mb'].isna().all()
+    odf = mprof.objects_dataframe()
+    assert odf['attribute'].str.startswith('records.').any()
+    tcio.write_memprofile_file()
+    fname = tcio.output_filename.replace('.xxx', '-memprofile.txt')
+    assert os.path.isfile(fname)
+    tcio.delete_output_files()
+    assert not os.path.isfile(fname)
@@ -555,6 +555,50 @@ def test_expand_2d_partial_expand():
     assert np.allclose(res, exp, atol=0.01, rtol=0.0)
 
 
+class HalfRatePolicy(Policy):
+    """
+    Policy class whose parameters are indexed at half the usual rates.
+    """
+    # pylint: disable=too-few-public-methods
+
+    def get_index_rate(self, param, lte_val):
+        """
+        Return half the indexing rate of a Policy object.
+        """
+        return 0.5 * super().get_index_rate(param, lte_val)
+
+
+@pytest.mark.parametrize('policy_class', [Policy, HalfRatePolicy])
+def test_bulk_extend_matches_paramtools_extend(policy_class, monkeypatch):
+    """
+    Check that bulk extension of parameter values produces exactly the same
+    value objects as the paramtools extend method that calls extend_func,
+    including when the get_index_rate method is overridden.
+    """
+    reform = {
+        'II_em': {2020: 1000},
+        'II_brk2': {2018: [40000, 80000, 40000, 40000, 80000]},
+        'II_brk2-indexed': {2020: False, 2024: True},
+        'SS_Earnings_c': {2021: 200000},
+    }
+    bulk = policy_class()
+    bulk.implement_reform(reform)
+    bulk.implement_reform({'parameter_indexing_CPI_offset': {2023: -0.005}})
+    monkeypatch.setattr(Parameters, 'extend', paramtools.Parameters.extend)
+    monkeypatch.setattr(Parameters, '_update_param',
+                        paramtools.Parameters._update_param)
+    loop = policy_class()
+    loop.implement_reform(reform)
+    loop.implement_reform({'parameter_indexing_CPI_offset': {2023: -0.005}})
+
+    def key(vo):
+        return sorted((lbl, str(val)) for lbl, val in vo.items())
+
+    for param in loop._data:
+        assert sorted(map(key, bulk._data[param]['value'])) == \
+            sorted(map(key, loop._data[param]['value'])), param
+
+
 TAXCALC_REVISION = """
 {
     "consumption": {"BEN_mcaid_value": {"2013": 0.9}}
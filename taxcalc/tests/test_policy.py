@@ -13,6 +13,7 @@ import json
 import numpy as np
 import pytest
 import paramtools
+from taxcalc import parameters
 from taxcalc.policy import Policy
 
 
@@ -1669,3 +1670,307 @@ def test_ext_plus_ctc2_reform(tests_path):
         ref.set_year(year)
         assert np.allclose([ref.CTC_c], [exp_ctc_c_ref[year]])
         assert np.allclose([ref.ACTC_c], [exp_actc_c_ref[year]])
+
+
+def test_policy_snapshot(tmp_path, monkeypatch):
+    """
+    Test that a Policy object constructed from a snapshot of the extended
+    current-law parameters is the same as one constructed without it.
+    """
+    # pylint: disable=protected-access
+    pol0 = Policy()
+    monkeypatch.setenv('TAXCALC_SNAPSHOT_DIR', str(tmp_path))
+    pol1 = Policy()  # writes snapshot
+    assert len(os.listdir(tmp_path)) == 1
+    pol2 = Policy()  # reads snapshot
+    assert len(os.listdir(tmp_path)) == 1
+    cmp_policy_objs(pol0, pol2)
+    assert pol2._data == pol0._data
+    trusted = {'parameter_indexing_CPI_offset': {2022: -0.005}}
+    pol5 = Policy()
+    pol0.implement_reform(trusted, validate=False)
+    pol5.implement_reform(trusted, validate=False)
+    assert pol5._data == pol0._data
+    pol0 = Policy()
+    reform1 = {'II_em': {2020: 1000}, 'STD-indexed': {2019: False}}
+    reform2 = {'parameter_indexing_CPI_offset': {2022: 0.0}}
+    for pol in (pol0, pol1, pol2):
+        pol.implement_reform(reform1)
+        pol.implement_reform(reform2)
+    cmp_policy_objs(pol0, pol2)
+    cmp_policy_objs(pol1, pol2)
+    with pytest.raises(paramtools.ValidationError):
+        pol2.implement_reform({'II_em': {2020: -1000}})
+    # snapshot is rebuilt when last_budget_year changes
+    pol3 = Policy(last_budget_year=2030)
+    assert len(os.listdir(tmp_path)) == 2
+    assert pol3.end_year == 2030
+    # corrupt snapshot file is ignored and rewritten
+    for fname in os.listdir(tmp_path):
+        with open(os.path.join(tmp_path, fname), 'wb') as sfile:
+            sfile.write(b'not a pickle')
+    pol4 = Policy()
+    monkeypatch.delenv('TAXCALC_SNAPSHOT_DIR')
+    cmp_policy_objs(Policy(), pol4)
+    # snapshots are not used with other paramtools versions
+    monkeypatch.setenv('TAXCALC_SNAPSHOT_DIR', str(tmp_path / 'other'))
+    monkeypatch.setattr(parameters, 'SNAPSHOT_PARAMTOOLS_VERSION', '0.0.0')
+    Policy()
+    assert not os.path.exists(tmp_path / 'other')
+
+
+def test_year_values():
+    """
+    Test that year_values dictionary contains current-year parameter values.
+    """
+    pol = Policy()
+    for year in [2013, 2020, 2026]:
+        pol.set_year(year)
+        assert set(pol.year_values) == set(pol._data)
+        for param, value in pol.year_values.items():
+            assert np.array_equal(value, getattr(pol, param)[0])
+    pol.implement_reform({'II_em': {2026: 1000}, 'STD': {2026: [1] * 5}})
+    pol.set_year(2026)
+    assert pol.year_values['II_em'] == 1000
+    assert np.array_equal(pol.year_values['STD'], [1] * 5)
+    assert pol.year_values['STD'].shape == (5,)
+
+
+def test_all_years_arrays_are_cached():
+    """
+    Test that all-years parameter arrays are cached read-only arrays that
+    reflect changes in parameter values.
+    """
+    pol = Policy()
+    ii_em = pol._II_em
+    assert ii_em.shape == (pol.num_years,)
+    assert not ii_em.flags.writeable
+    with pytest.raises(ValueError):
+        ii_em[0] = 0.
+    with pytest.raises(ValueError):
+        ii_em.flags.writeable = True
+    assert ii_em.base is pol._II_em.base
+    pol.set_year(2020)
+    assert pol._II_em.base is ii_em.base
+    pol.implement_reform({'II_em': {2020: 1000}})
+    assert pol._II_em.base is not ii_em.base
+    assert pol._II_em[2020 - pol.start_year] == 1000
+    assert np.array_equal(pol._II_em[:7], ii_em[:7])
+    np.testing.assert_array_equal(
+        pol._STD, pol.to_array('STD', year=list(range(2013, 2036)))
+    )
+
+
+def test_lazy_doc_metadata(tmp_path, monkeypatch):
+    """
+    Test that parameter documentation metadata are not kept with the
+    parameter values but are included in the metadata() dictionary.
+    """
+    path = os.path.join(Policy.DEFAULTS_FILE_PATH, Policy.DEFAULTS_FILE_NAME)
+    with open(path, 'r', encoding='utf-8') as jfile:
+        defaults = json.load(jfile)
+    monkeypatch.setenv('TAXCALC_SNAPSHOT_DIR', str(tmp_path))
+    for _ in range(2):  # without and with snapshot
+        pol = Policy()
+        # pylint: disable=protected-access
+        for field in ('title', 'description', 'notes', 'compatible_data'):
+            assert field not in pol._data['II_em']
+            assert field not in pol.defaults['II_em']
+        assert pol._data['II_em']['indexed'] is True
+        mdata = pol.metadata()
+        for param, data in mdata.items():
+            assert data['title'] == defaults[param]['title']
+            assert data['description'] == defaults[param]['description']
+            assert data['compatible_data'] == \
+                defaults[param]['compatible_data']
+        assert mdata['II_em']['value'] == pol._data['II_em']['value']
+        assert 'title' not in pol._data['II_em']
+        spec = pol.specification(use_state=False, meta_data=True,
+                                 serializable=True, year=2020)
+        assert spec['II_em']['title'] == defaults['II_em']['title']
+        assert spec['II_em']['value'][0]['year'] == 2020
+
+
+@pytest.mark.parametrize('reform', [
+    {'II_em': {2020: 1000}, 'STD': {2021: [1, 2, 3, 4, 5]},
+     'CTC_include17': {2021: True}, 'EITC_MinEligAge': {2021: 19},
+     'EITC_c-indexed': {2023: False}},
+    {'parameter_indexing_CPI_offset': {2022: -0.005},
+     'II_brk1': {2024: [1e4] * 5}},
+])
+def test_trusted_implement_reform(reform):
+    """
+    Test that implementing a valid reform without validation gives the
+    same parameter values as implementing it with validation.
+    """
+    pol1 = Policy()
+    pol1.implement_reform(reform)
+    pol2 = Policy()
+    pol2.implement_reform(reform, validate=False)
+    # pylint: disable=protected-access
+    assert pol2._inflation_rates == pol1._inflation_rates
+    for param, data in pol1._data.items():
+        assert pol2._data[param]['value'] == data['value'], param
+        assert pol2._data[param].get('indexed') == data.get('indexed')
+        assert np.array_equal(getattr(pol2, f'_{param}'),
+                              getattr(pol1, f'_{param}')), param
+    # structural errors are still found without validation
+    with pytest.raises(paramtools.ValidationError):
+        Policy().implement_reform({'XX': {2020: 1}}, validate=False)
+
+
+def test_validate_reforms():
+    """
+    Test Policy.validate_reforms static method.
+    """
+    with pytest.raises(ValueError):
+        Policy.validate_reforms({'II_em': {2020: 1000}})
+    with pytest.raises(ValueError):
+        Policy.validate_reforms([], num_workers=0)
+    reforms = [
+        {'II_em': {2020: 1000}},
+        {'II_em': {2020: -1000}},
+        {'XX': {2020: 1}},
+        {'II_em': {2020: 1000}},
+        {'II_em': {2020: 1000, '2022': 1200}},
+    ]
+    for num_workers in [1, 2]:
+        errors = Policy.validate_reforms(reforms, num_workers=num_workers)
+        assert len(errors) == len(reforms)
+        assert errors[0] == {} and errors[3] == {} and errors[4] == {}
+        assert list(errors[1]) == ['II_em']
+        assert 'XX' in errors[2]['schema']
+    assert not Policy.validate_reforms([])
+
+
+def test_precomputed_year_states():
+    """
+    Test that setting the year from precomputed year states gives the same
+    parameter values as paramtools does and that the states are recomputed
+    after the parameter values change.
+    """
+    pol = Policy()
+    ref = Policy()
+    pol.implement_reform({'II_em': {2020: 1000}})
+    ref.implement_reform({'II_em': {2020: 1000}})
+    for year in [2035, 2013, 2020, 2026]:
+        pol.set_year(year)
+        paramtools.Parameters._set_state(ref, year=year)
+        assert pol.current_year == year
+        for param in pol._data:  # pylint: disable=protected-access
+            value = getattr(pol, param)
+            expect = getattr(ref, param)
+            assert value.dtype == expect.dtype, param
+            assert np.array_equal(value, expect), param
+            assert not value.flags.writeable
+            assert np.array_equal(pol.year_values[param], expect[0])
+    # year_values changes do not change precomputed year states
+    pol.year_values['II_em'] = 0.
+    pol.set_year(2020)
+    assert pol.year_values['II_em'] == 1000.
+    # precomputed year states are recomputed after reforms
+    pol.implement_reform({'II_em': {2020: 2000}})
+    pol.set_year(2021)
+    pol.set_year(2020)
+    assert pol.II_em[0] == 2000.
+    assert pol.year_values['II_em'] == 2000.
+
+
+def test_shared_parameter_storage():
+    """
+    Test that copies of a Policy object share the parameter data they do
+    not adjust and that the shared parameter data cannot be changed.
+    """
+    # pylint: disable=protected-access
+    base = Policy()
+    base.set_year(2020)
+    pol = copy.deepcopy(base)
+    assert pol._data['STD'] is base._data['STD']
+    assert np.shares_memory(pol._STD, base._STD)
+    assert pol._year_states[2] is not base._year_states[2]
+    with pytest.raises(TypeError):
+        base._data['STD']['value'] = []
+    with pytest.raises(TypeError):
+        base._data['STD']['value'].append({'year': 2020, 'value': 1.})
+    with pytest.raises(TypeError):
+        pol._data['STD']['value'][0]['value'] = 1.
+    # failed adjustments do not change the parameter data of other copies
+    with pytest.raises(paramtools.ValidationError):
+        pol.implement_reform({'STD': {2020: [-1, 2, 3, 4, 5]}})
+    pol.implement_reform({'STD': {2021: [-1, 2, 3, 4, 5]}},
+                         raise_errors=False)
+    assert pol.errors
+    cmp_policy_objs(base, Policy())
+    base.set_year(2020)
+    pol = copy.deepcopy(base)
+    pol.implement_reform({'STD': {2020: [1, 2, 3, 4, 5]}})
+    assert pol._data['STD'] is not base._data['STD']
+    assert pol._data['II_em'] is base._data['II_em']
+    assert np.shares_memory(pol._II_em, base._II_em)
+    pol.set_year(2020)
+    base.set_year(2020)
+    assert np.allclose(pol.STD, [1, 2, 3, 4, 5])
+    assert not np.allclose(base.STD, [1, 2, 3, 4, 5])
+    # adjusting the base does not change its copies
+    base.implement_reform({'II_em': {2020: 1000}})
+    pol.set_year(2020)
+    base.set_year(2020)
+    assert base.II_em[0] == 1000.
+    assert pol.II_em[0] != 1000.
+    cmp_policy_objs(pol, Policy(), exclude=['STD'])
+
+
+@pytest.mark.parametrize('reforms, num_merged', [
+    ([{'STD': {2020: [1, 2, 3, 4, 5]}, 'II_em': {2022: 100}},
+      {'STD': {2023: [9, 9, 9, 9, 9]}},
+      {'II_em': {2019: 50, 2025: 70}, 'CTC_include17': {2021: True}}], 1),
+    ([{'II_em': {2019: 500, 2024: 900}},
+      {'II_em-indexed': {2022: False}, 'II_em': {2020: 300, 2026: 1}}], 1),
+    ([{'EITC_c-indexed': {2020: False}},
+      {'STD-indexed': {2021: False}, 'STD': {2018: [1, 2, 3, 4, 5]}}], 1),
+    ([{'STD': {2026: [1, 2, 3, 4, 5]}},
+      {'STD-indexed': {2021: False, 2024: True}},
+      {'STD': {2028: [7, 7, 7, 7, 7]}}], 2),
+    ([{'II_em': {2020: 1000}},
+      {'parameter_indexing_CPI_offset': {2022: -0.005}}], 2),
+])
+def test_implement_reforms(reforms, num_merged):
+    """
+    Test that implementing a list of reforms gives the same parameter
+    values as implementing the reforms one at a time.
+    """
+    pol1 = Policy()
+    for reform in reforms:
+        pol1.implement_reform(reform)
+    pol2 = Policy()
+    assert len(pol2.merge_reforms(reforms)) == num_merged
+    pol2.implement_reforms(reforms)
+    # pylint: disable=protected-access
+    assert pol2._inflation_rates == pol1._inflation_rates
+    for param, data in pol1._data.items():
+        assert sorted(str(dict(vo)) for vo in pol2._data[param]['value']) \
+            == sorted(str(dict(vo)) for vo in data['value']), param
+        assert pol2._data[param].get('indexed') == data.get('indexed')
+        assert np.array_equal(getattr(pol2, f'_{param}'),
+                              getattr(pol1, f'_{param}')), param
+    with pytest.raises(ValueError):
+        pol2.implement_reforms(reforms[0])
+
+
+def test_related_parameter_validation():
+    """
+    Test that a reform is validated against the parameters whose
+    validators refer to the parameters changed by the reform.
+    """
+    pol = Policy()
+    with pytest.raises(paramtools.ValidationError):
+        pol.implement_reform({'SS_thd85': {2020: [1.0] * 5}})
+    assert 'SS_thd50' in pol.errors
+    pol = Policy()
+    pol.implement_reform({'SS_thd85': {2020: [1.0] * 5}},
+                         raise_errors=False)
+    assert 'SS_thd50' in pol.errors
+    pol = Policy()
+    pol.implement_reform({'SS_thd85': {2020: [1e6] * 5},
+                          'SS_thd50': {2020: [1e5] * 5}})
+    assert not pol.errors
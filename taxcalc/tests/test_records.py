@@ -6,12 +6,14 @@ Test Records class and its methods.
 # pylint --disable=locally-disabled test_records.py
 
 import os
+import copy
 import json
+import pickle
 from io import StringIO
 import numpy as np
 import pandas as pd
 import pytest
-from taxcalc import GrowFactors, Policy, Records
+from taxcalc import Calculator, GrowFactors, Policy, Records, ResultCache
 
 
 def test_incorrect_records_instantiation(cps_subsample, cps_fullsample):
@@ -131,6 +133,212 @@ def test_read_data(csv):
         Records(data=df)
 
 
+def test_extrapolate_growfactors(cps_subsample):
+    """Test docstring"""
+    # pylint: disable=protected-access,no-member
+    rec = Records.cps_constructor(data=cps_subsample)
+    assert set(rec.GROWFACTOR_VARS) <= rec.USABLE_READ_VARS
+    for gfnames in rec.GROWFACTOR_VARS.values():
+        assert set(gfnames) <= set(rec.gfactors.names)
+    assert rec.GROWFACTOR_VARS['e00200'] == ('AWAGE', 'AWAGE')
+    assert rec.GROWFACTOR_VARS['e02000'] == ('ASCHEI', 'ASCHEL')
+    assert 'e00900' not in rec.GROWFACTOR_VARS
+    # a replaced variable is grown like the other variables
+    rec.e00300 = rec.e00300 + 1.
+    before = {var: getattr(rec, var).copy() for var in rec.GROWFACTOR_VARS}
+    year = rec.current_year + 1
+    rec._extrapolate(year)
+    gfv = dict(zip(rec.gfactors.names, rec.gfactors.year_factors(year)))
+    for var, (pos, neg) in rec.GROWFACTOR_VARS.items():
+        expect = np.where(before[var] >= 0,
+                          before[var] * gfv[pos], before[var] * gfv[neg])
+        assert np.array_equal(getattr(rec, var), expect), var
+    assert np.array_equal(rec.e00900, rec.e00900p + rec.e00900s)
+    # growth factors must be in the GrowFactors object
+    rec.GROWFACTOR_VARS['e00200'] = ('AWAGE', 'UNKNOWN')
+    with pytest.raises(ValueError):
+        rec._index_growfactors()
+
+
+def test_column_store(cps_subsample):
+    """Test docstring"""
+    # pylint: disable=protected-access,no-member
+    rec = Records.cps_constructor(data=cps_subsample)
+    assert np.shares_memory(rec.e00200, rec._arrays['float64'])
+    assert np.shares_memory(rec.MARS, rec._arrays['int8'])
+    assert rec.MARS.dtype == np.int8
+    assert rec.exact.dtype == np.bool_
+    # snapshot and restore variables and year
+    snap = rec.snapshot()
+    year = rec.current_year
+    e00200 = rec.e00200.copy()
+    s006 = rec.s006.copy()
+    mars = rec.MARS
+    rec.increment_year()
+    assert np.shares_memory(rec.s006, rec._arrays['float64'])
+    assert not rec.snapshot()['detached']
+    rec.MARS[:] = 1
+    rec.iitax = np.ones(rec.array_length)
+    assert not np.array_equal(rec.e00200, e00200)
+    for _ in range(2):
+        rec.restore(snap)
+        assert rec.current_year == year
+        assert np.array_equal(rec.e00200, e00200)
+        assert np.array_equal(rec.s006, s006)
+        assert np.array_equal(rec.iitax, np.zeros(rec.array_length))
+        assert np.all(mars == 1)  # arrays obtained before restore unchanged
+        assert not np.all(rec.MARS == 1)
+        rec.e00200 = rec.e00200 + 1.
+    # copies have their own column store
+    for dup in (copy.deepcopy(rec), pickle.loads(pickle.dumps(rec))):
+        assert np.array_equal(dup.e00200, rec.e00200)
+        assert np.shares_memory(dup.e00300, dup._arrays['float64'])
+        assert not np.shares_memory(dup.e00300, rec._arrays['float64'])
+        dup.increment_year()
+        assert np.array_equal(dup.e00900, dup.e00900p + dup.e00900s)
+
+
+def test_columnar_cache(cps_subsample, tmp_path, monkeypatch):
+    """Test docstring"""
+    # pylint: disable=no-member,too-many-locals
+    data_path = str(tmp_path / 'data.csv')
+    cps_subsample.to_csv(data_path, index=False)
+    weights = pd.DataFrame({
+        'WT2014': np.arange(len(cps_subsample)) + 100,
+        'WT2015': np.arange(len(cps_subsample)) + 200,
+    })
+    weights_path = str(tmp_path / 'weights.csv')
+    weights.to_csv(weights_path, index=False)
+
+    def records():
+        return Records(data=data_path, start_year=Records.CPSCSV_YEAR,
+                       weights=weights_path, adjust_ratios=None)
+
+    # caching is opt-in and is not enabled by the snapshot directory
+    monkeypatch.setenv('TAXCALC_SNAPSHOT_DIR', str(tmp_path / 'cache'))
+    records()
+    assert not os.path.exists(tmp_path / 'cache')
+    monkeypatch.setenv('TAXCALC_INPUT_CACHE_DIR', str(tmp_path / 'cache'))
+    rec1 = records()
+    caches = sorted(os.listdir(tmp_path / 'cache'))
+    assert len(caches) == 2  # data and weights
+    assert all(cache.endswith('.inputcols') for cache in caches)
+    cache_size = sum(
+        os.path.getsize(tmp_path / 'cache' / cache / name)
+        for cache in caches
+        for name in os.listdir(tmp_path / 'cache' / cache)
+    )
+    for cache in caches:
+        os.utime(tmp_path / 'cache' / cache, (0, 0))
+    rec2 = records()
+    for cache in caches:  # caches are marked as most recently used
+        assert os.path.getmtime(tmp_path / 'cache' / cache) > 0
+    expect = Records(data=cps_subsample, start_year=Records.CPSCSV_YEAR,
+                     weights=weights, adjust_ratios=None)
+    for rec in (rec1, rec2):
+        assert rec.IGNORED_VARS == expect.IGNORED_VARS
+        assert rec.WT.equals(expect.WT)
+        for var in sorted(rec.USABLE_READ_VARS):
+            assert getattr(rec, var).dtype == getattr(expect, var).dtype
+            assert np.array_equal(getattr(rec, var),
+                                  getattr(expect, var)), var
+    rec2.increment_year()
+    assert np.allclose(rec2.s006, (weights['WT2015'] * 0.01).values)
+    # a changed or unreadable file is not read from the cache
+    cps_subsample.assign(e00300=1.).to_csv(data_path, index=False)
+    assert np.all(records().e00300 == 1.)
+    assert len(os.listdir(tmp_path / 'cache')) == 3
+    # least recently used caches are removed when the caches are too large
+    # pylint: disable=protected-access
+    monkeypatch.setenv('TAXCALC_INPUT_CACHE_MAX_BYTES', str(cache_size))
+    weights_cache = os.path.basename(rec1._cache_path('weights',
+                                                      weights_path))
+    cps_subsample.assign(e00300=2.).to_csv(data_path, index=False)
+    assert np.all(records().e00300 == 2.)
+    remaining = os.listdir(tmp_path / 'cache')
+    assert len(remaining) == 2
+    assert weights_cache in remaining  # read and so recently used
+    assert not set(remaining) & (set(caches) - {weights_cache})
+    # caches are not removed by a ResultCache in the same directory
+    ResultCache(str(tmp_path / 'cache'), max_size_bytes=1).evict()
+    assert sorted(os.listdir(tmp_path / 'cache')) == sorted(remaining)
+    monkeypatch.setenv('TAXCALC_INPUT_CACHE_MAX_BYTES', 'none')
+    cps_subsample.assign(e00300=3.).to_csv(data_path, index=False)
+    with pytest.raises(ValueError):
+        records()
+    monkeypatch.delenv('TAXCALC_INPUT_CACHE_MAX_BYTES')
+    for cache in os.listdir(tmp_path / 'cache'):
+        os.remove(tmp_path / 'cache' / cache / 'columns.json')
+    assert np.all(records().e00300 == 3.)
+
+
+def test_memory_mapped_records(cps_subsample, tmp_path):
+    """Test docstring"""
+    # pylint: disable=protected-access,no-member
+    rec = Records.cps_constructor(data=cps_subsample)
+    store = str(tmp_path / 'store')
+    rec.write_columns(store)
+    with pytest.raises(OSError):
+        rec.write_columns(store)
+    with pytest.raises(ValueError):
+        Records(data=str(tmp_path), gfactors=None, weights=None)
+    scratch = tmp_path / 'scratch'
+    scratch.mkdir()
+    weights = pd.read_csv(os.path.join(Records.CODE_PATH,
+                                       Records.CPS_WEIGHTS_FILENAME))
+    mrec = Records(data=store, start_year=Records.CPSCSV_YEAR,
+                   weights=weights, adjust_ratios=None,
+                   scratch_dir=str(scratch))
+    assert isinstance(mrec.e00200, np.memmap)
+    assert isinstance(mrec.iitax, np.memmap)
+    assert all(isinstance(array, np.memmap)
+               for array in mrec._arrays.values())
+    assert not os.listdir(scratch)  # scratch files are removed at once
+    # without a scratch_dir the store columns are copied into memory
+    srec = Records(data=store, start_year=Records.CPSCSV_YEAR,
+                   weights=weights, adjust_ratios=None)
+    assert not any(isinstance(array, np.memmap)
+                   for array in srec._arrays.values())
+    assert np.shares_memory(srec.e00200, srec._arrays['float64'])
+    assert np.array_equal(srec.e00200, mrec.e00200)
+    calcs = [Calculator(policy=Policy(), records=recs)
+             for recs in (rec, mrec)]
+    for calc in calcs:
+        calc.advance_to_year(2020)
+        calc.calc_all()
+    assert isinstance(calcs[1].array('iitax'), np.memmap)
+    for var in ['e00200', 's006', 'iitax', 'payrolltax']:
+        assert np.allclose(calcs[0].array(var), calcs[1].array(var),
+                           rtol=0., atol=0.), var
+    mtr0 = calcs[0].mtr('e00900p', calc_all_already_called=True)
+    mtr1 = calcs[1].mtr('e00900p', calc_all_already_called=True)
+    assert np.array_equal(mtr0[2], mtr1[2])
+
+
+def test_copy_with_gfactors(cps_subsample):
+    """Test docstring"""
+    # pylint: disable=no-member
+    gfactors = GrowFactors()
+    gfactors.update('AWAGE', 2015, 1.5)
+    rec = Records.cps_constructor(data=cps_subsample)
+    dup = rec.copy_with_gfactors(gfactors)
+    assert dup.gfactors is gfactors
+    assert rec.gfactors is not gfactors
+    expect = Records.cps_constructor(data=cps_subsample, gfactors=gfactors)
+    for recs in (rec, dup, expect):
+        recs.increment_year()
+    assert np.array_equal(dup.e00200, expect.e00200)
+    assert np.array_equal(dup.s006, expect.s006)
+    assert not np.array_equal(rec.e00200, expect.e00200)
+    with pytest.raises(ValueError):
+        rec.copy_with_gfactors(GrowFactors())
+    with pytest.raises(ValueError):
+        expect.copy_with_gfactors(None)
+    with pytest.raises(ValueError):
+        Records.cps_constructor(data=cps_subsample,
+                                gfactors=None).copy_with_gfactors(gfactors)
+
+
 def test_for_duplicate_names():
     """Test docstring"""
     records_varinfo = Records(data=None)
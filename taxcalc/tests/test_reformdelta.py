@@ -0,0 +1,121 @@
+"""
+Test ReformDelta class and its methods.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle test_reformdelta.py
+# pylint --disable=locally-disabled test_reformdelta.py
+
+import copy
+import time
+import numpy as np
+import pytest
+import paramtools
+from taxcalc import Policy, ReformDelta
+
+
+REFORM = {
+    'STD': {2020: [13000, 26000, 13000, 19000, 26000]},
+    'II_em': {2020: 1000},
+    'EITC_c-indexed': {2022: False},
+}
+
+
+def assert_same_policy(pol1, pol2):
+    """
+    Check that the two Policy objects have the same parameter values.
+    """
+    # pylint: disable=protected-access
+    assert set(pol1._data) == set(pol2._data)
+    for param in pol1._data:
+        assert np.array_equal(getattr(pol1, f'_{param}'),
+                              getattr(pol2, f'_{param}')), param
+        assert pol1._data[param].get('indexed') == \
+            pol2._data[param].get('indexed'), param
+    for year in [2019, 2026]:
+        pol1.set_year(year)
+        pol2.set_year(year)
+        for param, value in pol1.year_values.items():
+            assert np.array_equal(value, pol2.year_values[param]), param
+
+
+def test_incorrect_ctor():
+    """Test docstring"""
+    with pytest.raises(ValueError):
+        ReformDelta(REFORM, policy='current_law')
+    with pytest.raises(paramtools.ValidationError):
+        ReformDelta({'II_em': {2020: -1000}})
+
+
+def test_apply_is_same_as_implement_reform():
+    """Test docstring"""
+    delta = ReformDelta(REFORM)
+    changes = delta.changes
+    assert sorted(changes) == ['EITC_c', 'II_em', 'STD']
+    assert changes['II_em'] == list(range(2020, 2036))
+    assert changes['EITC_c'][0] == Policy.JSON_START_YEAR
+    assert changes['EITC_c'][1] == 2023
+    pol = Policy()
+    assert delta.matches(pol)
+    delta.apply(pol)
+    assert not delta.matches(pol)
+    expect = Policy()
+    expect.implement_reform(REFORM)
+    assert_same_policy(pol, expect)
+    # applying to a different policy implements the reform
+    pol = Policy()
+    pol.implement_reform({'II_em': {2018: 500}})
+    assert not delta.matches(pol)
+    delta.apply(pol)
+    expect = Policy()
+    expect.implement_reform({'II_em': {2018: 500}})
+    expect.implement_reform(REFORM)
+    assert_same_policy(pol, expect)
+
+
+def test_apply_fallback():
+    """Test docstring"""
+    delta = ReformDelta(REFORM)
+    # the current year of a policy does not prevent copying the values
+    pol = Policy()
+    pol.set_year(2025)
+    delta.apply(pol)
+    assert (delta.applied, delta.fallbacks) == (1, 0)
+    assert pol.current_year == 2025
+    expect = Policy()
+    expect.implement_reform(REFORM)
+    assert_same_policy(pol, expect)
+    # a policy that differs from the base is counted as a fallback and
+    # costs no more than implementing the reform
+    pol1 = Policy()
+    pol1.implement_reform(REFORM)
+    pol2 = copy.deepcopy(pol1)
+    start = time.perf_counter()
+    assert not delta.matches(pol1)
+    match_time = time.perf_counter() - start
+    delta.apply(pol1, print_warnings=False)
+    assert (delta.applied, delta.fallbacks) == (1, 1)
+    start = time.perf_counter()
+    pol2.implement_reform(REFORM, print_warnings=False)
+    reform_time = time.perf_counter() - start
+    assert match_time < 0.05 * reform_time
+    assert_same_policy(pol1, pol2)
+
+
+def test_stacked_deltas():
+    """Test docstring"""
+    delta1 = ReformDelta(REFORM)
+    base = Policy()
+    delta1.apply(base)
+    cpi_reform = {'parameter_indexing_CPI_offset': {2023: -0.005}}
+    delta2 = ReformDelta(cpi_reform, policy=base)
+    assert 'II_brk1' in delta2.changes
+    assert delta2.changes['II_brk1'][0] == Policy.LAST_KNOWN_YEAR + 1
+    assert delta2.changes['II_em'][0] == 2024
+    assert delta2.matches(base)
+    pol = Policy()
+    delta1.apply(pol)
+    delta2.apply(pol)
+    expect = Policy()
+    expect.implement_reform(REFORM)
+    expect.implement_reform(cpi_reform)
+    assert_same_policy(pol, expect)
@@ -0,0 +1,121 @@
+"""
+Test ResultCache class and its methods.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle test_resultcache.py
+# pylint --disable=locally-disabled test_resultcache.py
+
+import os
+import copy
+import numpy as np
+import pandas as pd
+import pytest
+from taxcalc import Policy, Records, Calculator, ResultCache
+
+
+def test_incorrect_ctor(tmp_path):
+    """Test docstring"""
+    with pytest.raises(ValueError):
+        ResultCache(str(tmp_path), max_size_bytes=0)
+    with pytest.raises(ValueError):
+        Calculator(policy=Policy(), records=Records.cps_constructor(),
+                   result_cache=str(tmp_path))
+
+
+def test_cached_calc_all(cps_subsample, tmp_path):
+    """Test docstring"""
+    rec = Records.cps_constructor(data=cps_subsample)
+    pol = Policy()
+    cache = ResultCache(str(tmp_path))
+    # calculations without cache
+    calc0 = Calculator(policy=pol, records=rec)
+    calc0.calc_all()
+    # calculations that write results to cache
+    calc1 = Calculator(policy=pol, records=rec, result_cache=cache)
+    calc1.calc_all()
+    assert cache.hits == 0
+    assert cache.misses == 1
+    # calculations that read results from cache
+    calc2 = Calculator(policy=pol, records=rec, result_cache=cache)
+    calc2.calc_all()
+    assert cache.hits == 1
+    varlist = sorted(rec.CALCULATED_VARS)
+    pd.testing.assert_frame_equal(calc2.dataframe(varlist),
+                                  calc0.dataframe(varlist))
+    mtr0 = calc0.mtr(calc_all_already_called=True)
+    mtr2 = calc2.mtr(calc_all_already_called=True)
+    for res0, res2 in zip(mtr0, mtr2):
+        assert np.allclose(res0, res2)
+    # reform calculations are not read from cache
+    pol.implement_reform({'II_em': {2014: 1000}})
+    calc3 = Calculator(policy=pol, records=rec, result_cache=cache)
+    calc3.calc_all()
+    assert cache.hits == 1
+    assert cache.misses == 2
+    assert len(os.listdir(tmp_path)) == 2
+    # evicting cache entries
+    cache.max_size_bytes = 1
+    cache.evict()
+    assert not os.listdir(tmp_path)
+    cache.clear()
+    assert cache.hits == 0
+
+
+def test_cache_key(cps_subsample, tmp_path):
+    """Test docstring"""
+    # pylint: disable=protected-access,too-many-locals
+    cache = ResultCache(str(tmp_path / 'cache'))
+    rec = Records.cps_constructor(data=cps_subsample)
+    assert rec.input_key() is not None
+    assert rec.input_key() == copy.deepcopy(rec).input_key()
+    calc1 = Calculator(policy=Policy(), records=rec, result_cache=cache)
+    calc1.calc_all()
+    calc2 = Calculator(policy=Policy(), records=rec, result_cache=cache)
+    calc2.calc_all()
+    assert cache.hits == 1
+    # cached results are copied into the column store of the Records object
+    rec2 = calc2._Calculator__records
+    assert np.shares_memory(rec2.iitax, rec2._arrays['float64'])
+    assert np.array_equal(calc2.array('iitax'), calc1.array('iitax'))
+    # changed read variables are not identified by the input_key
+    calc2.store_records()
+    calc2.array('e00200p', calc2.array('e00200p') + 1.)
+    calc2.array('e00200', calc2.array('e00200') + 1.)
+    assert rec2.input_key() is None
+    calc2.calc_all()
+    assert cache.hits == 1
+    assert cache.misses == 1
+    calc2.restore_records()
+    assert rec2.input_key() is not None
+    # read variables changed in place are identified by their values
+    for var in ('e00200', 'e00200p'):
+        getattr(rec, var)[:] *= 3.
+    assert rec.input_key() is not None
+    calc3 = Calculator(policy=Policy(), records=rec, result_cache=cache)
+    calc3.calc_all()
+    assert cache.hits == 1
+    assert cache.misses == 2
+    calc4 = Calculator(policy=Policy(), records=rec)
+    calc4.calc_all()
+    assert np.array_equal(calc3.array('iitax'), calc4.array('iitax'))
+    assert not np.array_equal(calc3.array('iitax'), calc1.array('iitax'))
+    # DataFrame input data cannot be identified after being extrapolated
+    rec3 = Records.cps_constructor(data=cps_subsample)
+    rec3.increment_year()
+    assert rec3.input_key() is None
+    # file input data are identified by the file contents
+    data_path = tmp_path / 'data.csv'
+    cps_subsample.to_csv(data_path, index=False)
+    rec4 = Records.cps_constructor(data=str(data_path))
+    rec4.increment_year()
+    key4 = rec4.input_key()
+    assert key4 is not None
+    rec5 = Records.cps_constructor(data=str(data_path))
+    rec5.increment_year()
+    assert rec5.input_key() == key4
+    rec5.increment_year()
+    assert rec5.input_key() != key4
+    rec6 = Records.cps_constructor(data=str(data_path),
+                                   exact_calculations=True)
+    rec6.increment_year()
+    assert rec6.input_key() != key4
@@ -0,0 +1,90 @@
+"""
+Test SyntheticData class and its methods.
+"""
+# CODING-STYLE CHECKS:
+# pycodestyle test_syntheticdata.py
+# pylint --disable=locally-disabled test_syntheticdata.py
+
+import os
+import numpy as np
+import pandas as pd
+import pytest
+from taxcalc import GrowFactors, Records, SyntheticData
+
+
+@pytest.fixture(scope='module', name='cps_weights')
+def cps_weights_fixture(tests_path):
+    """Fixture docstring"""
+    return pd.read_csv(os.path.join(tests_path, '..',
+                                    Records.CPS_WEIGHTS_FILENAME))
+
+
+def test_incorrect_ctor(cps_subsample, cps_weights):
+    """Test docstring"""
+    with pytest.raises(ValueError):
+        SyntheticData(data=[], weights=None)
+    with pytest.raises(ValueError):
+        SyntheticData(data=cps_subsample, weights=cps_weights)
+    with pytest.raises(ValueError):
+        SyntheticData(data=cps_subsample, weights=None, noise=-0.1)
+    synth = SyntheticData(data=cps_subsample, weights=None)
+    with pytest.raises(ValueError):
+        synth.sample(0)
+    with pytest.raises(ValueError):
+        synth.write(10, 'data.csv', 'weights.csv')
+
+
+def test_sample_preserves_records_invariants(cps_fullsample, cps_weights):
+    """Test docstring"""
+    # pylint: disable=no-member
+    synth = SyntheticData(data=cps_fullsample, weights=cps_weights,
+                          noise=0.2, seed=123)
+    num = 2 * synth.original_size
+    data, weights = synth.sample(num)
+    assert len(data.index) == num
+    assert len(weights.index) == num
+    assert list(data.columns) == list(cps_fullsample.columns)
+    assert list(weights.columns) == list(cps_weights.columns)
+    assert np.array_equal(data['RECID'], np.arange(1, num + 1))
+    # weight totals are the same as in original data
+    assert np.allclose(weights.sum(), cps_weights.sum(), rtol=1e-6)
+    assert np.isclose(data['s006'].sum(), cps_fullsample['s006'].sum(),
+                      rtol=1e-6)
+    # integer variables are unchanged and noise preserves zero amounts
+    assert set(data['MARS']) <= set(cps_fullsample['MARS'])
+    assert ((data['e00200'] == 0) ==
+            (data['e00200p'] == 0) & (data['e00200s'] == 0)).all()
+    # Records constructor checks are all satisfied
+    rec = Records(data=data, start_year=Records.CPSCSV_YEAR,
+                  gfactors=GrowFactors(), weights=weights,
+                  adjust_ratios=Records.CPS_RATIOS_FILENAME)
+    assert rec.array_length == num
+    # weighted aggregate is close to that of original data
+    orig = Records.cps_constructor(data=cps_fullsample)
+    synth_wages = (rec.s006 * rec.e00200).sum()
+    orig_wages = (orig.s006 * orig.e00200).sum()
+    assert np.isclose(synth_wages, orig_wages, rtol=0.02)
+
+
+def test_chunks_and_write(cps_subsample, tmp_path):
+    """Test docstring"""
+    weights = pd.DataFrame({'WT2014': np.full(len(cps_subsample.index), 500),
+                            'WT2015': np.full(len(cps_subsample.index), 600)})
+    data_a, wght_a = SyntheticData(data=cps_subsample, weights=weights,
+                                   seed=9).sample(2500)
+    chunks = list(SyntheticData(data=cps_subsample, weights=weights,
+                                seed=9).chunks(2500, chunk_size=1000))
+    assert [len(dchunk.index) for dchunk, _ in chunks] == [1000, 1000, 500]
+    data_b = pd.concat([dchunk for dchunk, _ in chunks], ignore_index=True)
+    wght_b = pd.concat([wchunk for _, wchunk in chunks], ignore_index=True)
+    pd.testing.assert_frame_equal(data_a, data_b)
+    pd.testing.assert_frame_equal(wght_a, wght_b)
+    dfile = str(tmp_path / 'synth.csv.gz')
+    wfile = str(tmp_path / 'synth_weights.csv')
+    SyntheticData(data=cps_subsample, weights=weights,
+                  seed=9).write(2500, dfile, wfile, chunk_size=1000)
+    pd.testing.assert_frame_equal(pd.read_csv(dfile), data_a)
+    pd.testing.assert_frame_equal(pd.read_csv(wfile), wght_a)
+    synth = SyntheticData(data=cps_subsample, weights=None)
+    _, no_weights = synth.sample(10)
+    assert no_weights is None
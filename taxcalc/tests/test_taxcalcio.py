@@ -8,6 +8,7 @@ Tests for Tax-Calculator TaxCalcIO class.
 # pylint: disable=too-many-lines
 
 import os
+import sqlite3
 from io import StringIO
 import tempfile
 import pytest
@@ -501,6 +502,43 @@ def test_output_options_mtr(reformfile1, assumpfile1):
         os.remove(dumppath)
 
 
+def test_concurrent_calcs(reformfile1, assumpfile1):
+    """
+    Test that concurrent and sequential TaxCalcIO.analyze calculations
+    generate identical dump output.
+    """
+    taxyear = 2021
+    dumpvars = TaxCalcIO.MINIMAL_DUMPVARS + TaxCalcIO.MTR_DUMPVARS
+    results = {}
+    for concurrent in [True, False]:
+        tcio = TaxCalcIO(input_data=pd.read_csv(StringIO(RAWINPUT)),
+                         tax_year=taxyear,
+                         baseline=None,
+                         reform=reformfile1.name,
+                         assump=assumpfile1.name)
+        assert not tcio.errmsg
+        tcio.init(input_data=pd.read_csv(StringIO(RAWINPUT)),
+                  tax_year=taxyear,
+                  baseline=None,
+                  reform=reformfile1.name,
+                  assump=assumpfile1.name,
+                  aging_input_data=False,
+                  exact_calculations=False)
+        assert not tcio.errmsg
+        dumppath = tcio.output_filepath().replace('.xxx', '.db')
+        tcio.analyze(output_dump=True, dump_varlist=dumpvars,
+                     concurrent_calcs=concurrent)
+        dbcon = sqlite3.connect(dumppath)
+        results[concurrent] = {
+            tbl: pd.read_sql_query(f'SELECT * FROM {tbl}', dbcon)
+            for tbl in ['base', 'baseline', 'reform']
+        }
+        dbcon.close()
+        os.remove(dumppath)
+    for tbl, odf in results[True].items():
+        pd.testing.assert_frame_equal(odf, results[False][tbl])
+
+
 def test_write_policy_param_files(reformfile1):
     """
     Test write_policy_params_files with compound reform.